@@ -8,8 +8,11 @@ Provides:
 """
 
 from .domain import Password, Token, TokenPayload
-from .application import JWTService, AuthService
-from .infrastructure import create_auth_dependency
+from .application import (
+    JWTService, JWTStats, TokenCache, KeyRing, KeyEntry,
+    PasswordHasher, BcryptCostPolicy, HasherStats, BloomFilter, RevocationList, AuthService
+)
+from .infrastructure import create_auth_dependency, create_claims_dependency
 
 __version__ = "1.0.0"
 
@@ -18,6 +21,16 @@ __all__ = [
     'Token',
     'TokenPayload',
     'JWTService',
+    'JWTStats',
+    'TokenCache',
+    'KeyRing',
+    'KeyEntry',
+    'PasswordHasher',
+    'BcryptCostPolicy',
+    'HasherStats',
+    'BloomFilter',
+    'RevocationList',
     'AuthService',
-    'create_auth_dependency'
+    'create_auth_dependency',
+    'create_claims_dependency'
 ]
@@ -1,14 +1,25 @@
+from typing import Optional, Tuple
 from uuid import UUID
 from core import Result
-from ..domain import Password, Token
+from ..domain import Password, Token, TokenPayload
 from .JWTService import JWTService
+from .PasswordHasher import PasswordHasher
+from .RevocationList import RevocationList
 
 
 class AuthService:
-    """Authentication service"""
+    """Authentication service
     
-    def __init__(self, jwt_service: JWTService):
+    The *_async password methods run bcrypt on the PasswordHasher executor
+    and should be used from async handlers. With a RevocationList, token
+    verification also rejects revoked token ids.
+    """
+    
+    def __init__(self, jwt_service: JWTService, hasher: PasswordHasher = None,
+                 revocations: RevocationList = None):
         self.jwt = jwt_service
+        self.hasher = hasher or PasswordHasher()
+        self.revocations = revocations
 
     def hash_password(self, plain: str) -> Result[str]:
         """Hash password"""
@@ -23,20 +34,53 @@ class AuthService:
         password = Password(hashed=hashed)
         return password.verify(plain)
 
+    async def hash_password_async(self, plain: str) -> Result[str]:
+        """Hash password off the event loop"""
+        try:
+            return Result.ok(await self.hasher.hash(plain))
+        except Exception as e:
+            return Result.fail(str(e))
+
+    async def verify_password_async(self, plain: str, hashed: str) -> bool:
+        """Verify password off the event loop"""
+        return await self.hasher.verify(plain, hashed)
+
+    async def verify_password_and_rehash(self, plain: str, hashed: str) -> Tuple[bool, Optional[str]]:
+        """Verify password; returns a new hash to store when the cost is outdated"""
+        return await self.hasher.verify_and_update(plain, hashed)
+
     def create_tokens(self, user_id: UUID, email: str, role: str) -> Token:
         """Create authentication tokens"""
         return self.jwt.create_token(user_id, email, role)
 
     def verify_access_token(self, token: str) -> Result[UUID]:
         """Verify access token"""
+        result = self.verify_access_claims(token)
+        return Result.ok(result.value.user_id) if result.is_success else result
+
+    def verify_access_claims(self, token: str) -> Result[TokenPayload]:
+        """Verify access token and return its claims"""
         payload = self.jwt.verify_token(token, "access")
-        if not payload:
+        if not payload or self._is_revoked(payload):
             return Result.fail("Invalid token")
-        return Result.ok(payload.user_id)
+        return Result.ok(payload)
 
     def verify_refresh_token(self, token: str) -> Result[UUID]:
         """Verify refresh token"""
         payload = self.jwt.verify_token(token, "refresh")
-        if not payload:
+        if not payload or self._is_revoked(payload):
             return Result.fail("Invalid refresh token")
         return Result.ok(payload.user_id)
+
+    async def revoke_token(self, token: str, token_type: str = "refresh") -> Result[None]:
+        """Revoke a valid token until it expires"""
+        if self.revocations is None:
+            return Result.fail("Revocation is not configured")
+        payload = self.jwt.verify_token(token, token_type)
+        if not payload or not payload.jti:
+            return Result.fail("Invalid token")
+        await self.revocations.revoke(payload.jti, payload.exp.timestamp())
+        return Result.ok()
+
+    def _is_revoked(self, payload: TokenPayload) -> bool:
+        return self.revocations is not None and self.revocations.is_revoked(payload.jti)
@@ -1,19 +1,73 @@
+import binascii
+import hashlib
+import json
+import time
+from calendar import timegm
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 from uuid import UUID
 from jose import JWTError, jwt
+from jose.utils import base64url_decode, base64url_encode
+from core import Result, new_id
 from ..domain import Token, TokenPayload
+from .KeyRing import KeyEntry, KeyRing
+from .TokenCache import TokenCache
+
+
+def _claims_valid(claims, now: float) -> bool:
+    """Registered claim checks jose.jwt.decode applies with its defaults
+    
+    Kept in step with _decode so both verification paths accept the same
+    tokens before writing to the shared cache: no audience is configured,
+    so any aud claim is rejected.
+    """
+    if not isinstance(claims, dict) or "aud" in claims:
+        return False
+    moment = int(now)
+    if "iat" in claims:
+        int(claims["iat"])
+    if "nbf" in claims and int(claims["nbf"]) > moment:
+        return False
+    if "exp" in claims and int(claims["exp"]) < moment:
+        return False
+    return all(isinstance(claims.get(name, ""), str) for name in ("sub", "jti"))
+
+
+@dataclass
+class JWTStats:
+    """JWT verification counters snapshot"""
+    cache_hits: int = 0
+    cache_misses: int = 0
+    cache_entries: int = 0
+    verifications: int = 0
+    verify_seconds: float = 0.0
 
 
 class JWTService:
-    """JWT token service"""
+    """JWT token service
+    
+    Keys come from a KeyRing: a shared secret (HS*) or asymmetric keys
+    (RS*/ES*) indexed by the token's kid header. Verification-only
+    services pass a ring holding public keys. Verified payloads are cached
+    by token digest until exp, so repeated presentations of the same
+    token skip signature verification; a hit is only served while the key
+    that verified it is still in the ring and may verify.
+    """
     
-    def __init__(self, secret: str, algorithm: str = "HS256", 
-                 access_expire_minutes: int = 60, refresh_expire_days: int = 7):
+    def __init__(self, secret: str = None, algorithm: str = "HS256", 
+                 access_expire_minutes: int = 60, refresh_expire_days: int = 7,
+                 cache_size: int = 10000, key_ring: KeyRing = None):
+        if key_ring is None and secret is None:
+            raise ValueError("secret or key_ring is required")
         self.secret = secret
         self.algorithm = algorithm
         self.access_expire = access_expire_minutes
         self.refresh_expire = refresh_expire_days
+        self.key_ring = key_ring or KeyRing.symmetric(secret, algorithm)
+        self._cache = TokenCache(cache_size)
+        self._headers: Dict[Tuple[Optional[str], str], bytes] = {}
+        self._stats = JWTStats()
 
     def create_token(self, user_id: UUID, email: str, role: str) -> Token:
         """Create access and refresh tokens"""
@@ -28,32 +82,182 @@ class JWTService:
             "email": email,
             "role": role,
             "exp": expire,
-            "type": "access"
+            "type": "access",
+            "jti": new_id().hex
         }
-        return jwt.encode(payload, self.secret, algorithm=self.algorithm)
+        return self._encode(payload)
 
     def _create_refresh(self, user_id: UUID) -> str:
         expire = datetime.utcnow() + timedelta(days=self.refresh_expire)
         payload = {
             "sub": str(user_id),
             "exp": expire,
-            "type": "refresh"
+            "type": "refresh",
+            "jti": new_id().hex
         }
-        return jwt.encode(payload, self.secret, algorithm=self.algorithm)
+        return self._encode(payload)
+
+    def _encode(self, payload: dict) -> str:
+        key = self.key_ring.signing_key()
+        payload["exp"] = timegm(payload["exp"].utctimetuple())
+        return self._sign(self._header(key), key, payload)
+
+    def _header(self, key: KeyEntry) -> bytes:
+        """Encoded JOSE header, built once per signing key"""
+        cache_key = (key.kid, key.algorithm)
+        header = self._headers.get(cache_key)
+        if header is None:
+            fields = {"alg": key.algorithm, "typ": "JWT"}
+            if key.kid is not None:
+                fields["kid"] = key.kid
+            header = base64url_encode(json.dumps(fields, separators=(",", ":"), sort_keys=True).encode())
+            self._headers[cache_key] = header
+        return header
+
+    @staticmethod
+    def _sign(header: bytes, key: KeyEntry, claims: dict) -> str:
+        encoded_claims = base64url_encode(json.dumps(claims, separators=(",", ":")).encode())
+        signing_input = header + b"." + encoded_claims
+        return (signing_input + b"." + base64url_encode(key.signer.sign(signing_input))).decode()
+
+    def create_tokens_many(self, users: Iterable[Tuple[UUID, str, str]]) -> List[Result[Token]]:
+        """Create tokens for (user_id, email, role) tuples sharing one clock read and key setup"""
+        now = datetime.utcnow()
+        key = self.key_ring.signing_key(now)
+        header = self._header(key)
+        access_exp = timegm((now + timedelta(minutes=self.access_expire)).utctimetuple())
+        refresh_exp = timegm((now + timedelta(days=self.refresh_expire)).utctimetuple())
+        
+        results = []
+        for user_id, email, role in users:
+            try:
+                sub = str(user_id)
+                access = self._sign(header, key, {
+                    "sub": sub, "email": email, "role": role, "exp": access_exp,
+                    "type": "access", "jti": new_id().hex
+                })
+                refresh = self._sign(header, key, {
+                    "sub": sub, "exp": refresh_exp, "type": "refresh", "jti": new_id().hex
+                })
+                results.append(Result.ok(Token(access, refresh)))
+            except Exception as e:
+                results.append(Result.fail(str(e)))
+        return results
 
     def verify_token(self, token: str, token_type: str = "access") -> Optional[TokenPayload]:
         """Verify and decode token"""
+        start = time.perf_counter()
+        digest = hashlib.sha256(token.encode()).digest()
+        payload = self._cached(digest)
+        if payload is None:
+            self._stats.cache_misses += 1
+            payload = self._decode(token, digest)
+        else:
+            self._stats.cache_hits += 1
+        self._stats.verifications += 1
+        self._stats.verify_seconds += time.perf_counter() - start
+        
+        if payload is None or payload.type != token_type:
+            return None
+        return payload
+
+    def verify_many(self, tokens: Iterable[str], token_type: str = "access") -> List[Result[TokenPayload]]:
+        """Verify tokens sharing one clock read; headers are parsed once per distinct header"""
+        start = time.perf_counter()
+        now = time.time()
+        keys: Dict[bytes, Optional[KeyEntry]] = {}
+        results = [self._verify_batched(token, token_type, now, keys) for token in tokens]
+        self._stats.verifications += len(results)
+        self._stats.verify_seconds += time.perf_counter() - start
+        return results
+
+    def _verify_batched(self, token: str, token_type: str, now: float,
+                        keys: Dict[bytes, Optional[KeyEntry]]) -> Result[TokenPayload]:
+        digest = hashlib.sha256(token.encode()).digest()
+        payload = self._cached(digest, now)
+        if payload is None:
+            self._stats.cache_misses += 1
+            payload = self._decode_batched(token, digest, now, keys)
+        else:
+            self._stats.cache_hits += 1
+        
+        if payload is None or payload.type != token_type:
+            return Result.fail("Invalid token")
+        return Result.ok(payload)
+
+    def _decode_batched(self, token: str, digest: bytes, now: float,
+                        keys: Dict[bytes, Optional[KeyEntry]]) -> Optional[TokenPayload]:
         try:
-            payload = jwt.decode(token, self.secret, algorithms=[self.algorithm])
-            if payload.get("type") != token_type:
+            header, claims_segment, signature = token.encode().split(b".")
+            if header not in keys:
+                keys[header] = self._header_key(header)
+            key = keys[header]
+            if key is None or not key.verifier.verify(header + b"." + claims_segment,
+                                                      base64url_decode(signature)):
                 return None
-            
-            return TokenPayload(
-                user_id=UUID(payload["sub"]),
-                email=payload.get("email", ""),
-                role=payload.get("role", ""),
-                exp=datetime.fromtimestamp(payload["exp"]),
-                type=payload["type"]
+            claims = json.loads(base64url_decode(claims_segment))
+            if not _claims_valid(claims, now):
+                return None
+            payload = TokenPayload(
+                user_id=UUID(claims["sub"]),
+                email=claims.get("email", ""),
+                role=claims.get("role", ""),
+                exp=datetime.fromtimestamp(claims["exp"]),
+                type=claims["type"],
+                jti=claims.get("jti", "")
             )
-        except JWTError:
+        except (binascii.Error, ValueError, KeyError, TypeError, AttributeError):
+            return None
+        self._cache.set(digest, payload, claims["exp"], key)
+        return payload
+
+    def _cached(self, digest: bytes, now: float = None) -> Optional[TokenPayload]:
+        """Cached payload while its verification key is still current"""
+        entry = self._cache.entry(digest, now)
+        if entry is None:
+            return None
+        payload, key = entry
+        if key is None or self.key_ring.verification_key(key.kid) is not key:
+            self._cache.discard(digest)
+            return None
+        return payload
+
+    def _header_key(self, header: bytes) -> Optional[KeyEntry]:
+        """Verification key for an encoded header, requiring its alg to match the key"""
+        fields = json.loads(base64url_decode(header))
+        if not isinstance(fields, dict):
+            return None
+        key = self.key_ring.verification_key(fields.get("kid"))
+        if key is None or fields.get("alg") != key.algorithm:
             return None
+        return key
+
+    def _decode(self, token: str, digest: bytes) -> Optional[TokenPayload]:
+        try:
+            key = self.key_ring.verification_key(jwt.get_unverified_header(token).get("kid"))
+            if key is None:
+                return None
+            claims = jwt.decode(token, key.verifier, algorithms=[key.algorithm])
+            payload = TokenPayload(
+                user_id=UUID(claims["sub"]),
+                email=claims.get("email", ""),
+                role=claims.get("role", ""),
+                exp=datetime.fromtimestamp(claims["exp"]),
+                type=claims["type"],
+                jti=claims.get("jti", "")
+            )
+        except (JWTError, KeyError, ValueError, TypeError, AttributeError):
+            return None
+        self._cache.set(digest, payload, claims["exp"], key)
+        return payload
+
+    @property
+    def stats(self) -> JWTStats:
+        """Current verification counters"""
+        return JWTStats(
+            cache_hits=self._stats.cache_hits,
+            cache_misses=self._stats.cache_misses,
+            cache_entries=len(self._cache),
+            verifications=self._stats.verifications,
+            verify_seconds=self._stats.verify_seconds
+        )
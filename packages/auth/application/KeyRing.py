@@ -0,0 +1,116 @@
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+from jose import jwk
+from jose.constants import ALGORITHMS
+
+
+@dataclass
+class KeyEntry:
+    """Key ring entry with its rotation window"""
+    kid: Optional[str]
+    algorithm: str
+    verifier: Any
+    signer: Any = None
+    activate_at: datetime = datetime.min
+    retire_at: Optional[datetime] = None
+    expire_at: Optional[datetime] = None
+
+    def can_sign(self, now: datetime) -> bool:
+        if self.signer is None or self.activate_at > now:
+            return False
+        return self.retire_at is None or now < self.retire_at
+
+    def can_verify(self, now: datetime) -> bool:
+        return self.expire_at is None or now < self.expire_at
+
+
+class KeyRing:
+    """Signing and verification keys indexed by kid
+    
+    Keys are constructed once when added. Verifiers only need public keys
+    (see from_jwks). A key signs between activate_at and retire_at and
+    verifies until expire_at, so rotation keeps a verification overlap.
+    """
+    
+    def __init__(self):
+        self._keys: Dict[Optional[str], KeyEntry] = {}
+
+    @classmethod
+    def symmetric(cls, secret: str, algorithm: str = ALGORITHMS.HS256,
+                  kid: Optional[str] = None) -> "KeyRing":
+        """Ring with a single shared secret (tokens carry no kid by default)"""
+        ring = cls()
+        ring.add(kid, algorithm, secret, secret)
+        return ring
+
+    @classmethod
+    def from_jwks(cls, jwks: Dict[str, List[dict]]) -> "KeyRing":
+        """Verification-only ring from a JWKS document"""
+        ring = cls()
+        for key in jwks["keys"]:
+            ring.add(key["kid"], key["alg"], key)
+        return ring
+
+    def add(self, kid: Optional[str], algorithm: str, public_key: Any, private_key: Any = None,
+            activate_at: datetime = None, retire_at: datetime = None,
+            expire_at: datetime = None) -> KeyEntry:
+        """Add key material (PEM, JWK dict or secret); private_key enables signing"""
+        if algorithm not in ALGORITHMS.SUPPORTED:
+            raise ValueError(f"Unsupported algorithm: {algorithm}")
+        entry = KeyEntry(
+            kid=kid,
+            algorithm=algorithm,
+            verifier=jwk.construct(public_key, algorithm),
+            signer=jwk.construct(private_key, algorithm) if private_key is not None else None,
+            activate_at=activate_at or datetime.utcnow(),
+            retire_at=retire_at,
+            expire_at=expire_at
+        )
+        self._keys[kid] = entry
+        return entry
+
+    def rotate(self, kid: str, algorithm: str, public_key: Any, private_key: Any,
+               overlap: timedelta, activate_at: datetime = None) -> KeyEntry:
+        """Add a new signing key and retire current ones, verifying them for overlap"""
+        activate_at = activate_at or datetime.utcnow()
+        for entry in self._keys.values():
+            if entry.signer is not None and entry.retire_at is None:
+                entry.retire_at = activate_at
+                entry.expire_at = activate_at + overlap
+        return self.add(kid, algorithm, public_key, private_key, activate_at)
+
+    def remove(self, kid: Optional[str]):
+        """Remove key"""
+        self._keys.pop(kid, None)
+
+    def prune(self, now: datetime = None):
+        """Remove keys past expire_at"""
+        now = now or datetime.utcnow()
+        for kid in [kid for kid, entry in self._keys.items() if not entry.can_verify(now)]:
+            del self._keys[kid]
+
+    def signing_key(self, now: datetime = None) -> KeyEntry:
+        """Most recently activated key allowed to sign"""
+        now = now or datetime.utcnow()
+        candidates = [entry for entry in self._keys.values() if entry.can_sign(now)]
+        if not candidates:
+            raise LookupError("No active signing key")
+        return max(candidates, key=lambda entry: entry.activate_at)
+
+    def verification_key(self, kid: Optional[str], now: datetime = None) -> Optional[KeyEntry]:
+        """Key for kid if it may still verify"""
+        entry = self._keys.get(kid)
+        if entry is None or not entry.can_verify(now or datetime.utcnow()):
+            return None
+        return entry
+
+    def jwks(self) -> Dict[str, List[dict]]:
+        """Public keys as a JWKS document (symmetric keys are never exported)"""
+        keys = []
+        for entry in self._keys.values():
+            if entry.algorithm.startswith("HS"):
+                continue
+            public = entry.verifier.public_key().to_dict()
+            keys.append({**public, "kid": entry.kid, "alg": entry.algorithm, "use": "sig"})
+        return {"keys": keys}
@@ -0,0 +1,129 @@
+import asyncio
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Optional, Tuple, TypeVar
+from passlib.context import CryptContext
+from ..domain import Password
+
+T = TypeVar('T')
+
+
+@dataclass
+class HasherStats:
+    """Password hasher counters snapshot"""
+    queued: int = 0
+    in_flight: int = 0
+    completed: int = 0
+    rehashed: int = 0
+    wait_seconds: float = 0.0
+    work_seconds: float = 0.0
+    rounds: int = 0
+
+
+class BcryptCostPolicy:
+    """Chooses the bcrypt cost whose hash time fits a latency budget"""
+    
+    def __init__(self, target_seconds: float = 0.25, min_rounds: int = 10,
+                 max_rounds: int = 15, rounds: int = 12):
+        self.target_seconds = target_seconds
+        self.min_rounds = min_rounds
+        self.max_rounds = max_rounds
+        self.rounds = rounds
+        self.context = self._build_context()
+
+    def calibrate(self) -> int:
+        """Measure min_rounds and pick the highest cost within target (blocking)"""
+        probe = CryptContext(schemes=["bcrypt"], bcrypt__rounds=self.min_rounds)
+        start = time.perf_counter()
+        probe.hash("calibration-Probe1")
+        elapsed = time.perf_counter() - start
+        rounds = self.min_rounds
+        # Each extra round doubles bcrypt work
+        while rounds < self.max_rounds and elapsed * 2 <= self.target_seconds:
+            rounds += 1
+            elapsed *= 2
+        self.rounds = rounds
+        self.context = self._build_context()
+        return rounds
+
+    def _build_context(self) -> CryptContext:
+        return CryptContext(
+            schemes=["bcrypt"],
+            bcrypt__default_rounds=self.rounds,
+            bcrypt__min_rounds=self.rounds
+        )
+
+
+class PasswordHasher:
+    """Runs bcrypt off the event loop on a bounded executor
+    
+    At most max_concurrency hashes run at once; further calls wait on a
+    semaphore and are counted as queued.
+    """
+    
+    def __init__(self, max_concurrency: int = 4, executor: Executor = None,
+                 policy: BcryptCostPolicy = None):
+        self.max_concurrency = max_concurrency
+        self.policy = policy or BcryptCostPolicy()
+        self._executor = executor or ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="password-hasher"
+        )
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._stats = HasherStats()
+
+    async def calibrate(self) -> int:
+        """Calibrate the cost policy on the executor"""
+        return await self._run(self.policy.calibrate)
+
+    async def hash(self, plain: str) -> str:
+        """Validate and hash password"""
+        context = self.policy.context
+        return await self._run(lambda: Password(plain=plain, context=context).hash)
+
+    async def verify(self, plain: str, hashed: str) -> bool:
+        """Verify password against hash"""
+        context = self.policy.context
+        return await self._run(lambda: Password(hashed=hashed, context=context).verify(plain))
+
+    async def verify_and_update(self, plain: str, hashed: str) -> Tuple[bool, Optional[str]]:
+        """Verify and, when the stored cost is outdated, return a new hash"""
+        context = self.policy.context
+        valid, new_hash = await self._run(lambda: context.verify_and_update(plain[:72], hashed))
+        if new_hash is not None:
+            self._stats.rehashed += 1
+        return valid, new_hash
+
+    @property
+    def stats(self) -> HasherStats:
+        """Current counters"""
+        return HasherStats(
+            queued=self._stats.queued,
+            in_flight=self._stats.in_flight,
+            completed=self._stats.completed,
+            rehashed=self._stats.rehashed,
+            wait_seconds=self._stats.wait_seconds,
+            work_seconds=self._stats.work_seconds,
+            rounds=self.policy.rounds
+        )
+
+    def shutdown(self):
+        """Release executor threads"""
+        self._executor.shutdown(wait=False)
+
+    async def _run(self, func: Callable[[], T]) -> T:
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_concurrency)
+        queued_at = time.perf_counter()
+        self._stats.queued += 1
+        async with self._slots:
+            self._stats.queued -= 1
+            self._stats.in_flight += 1
+            started_at = time.perf_counter()
+            self._stats.wait_seconds += started_at - queued_at
+            try:
+                return await asyncio.get_running_loop().run_in_executor(self._executor, func)
+            finally:
+                self._stats.in_flight -= 1
+                self._stats.completed += 1
+                self._stats.work_seconds += time.perf_counter() - started_at
@@ -0,0 +1,99 @@
+import asyncio
+import logging
+import time
+from typing import Dict, Optional
+from uuid import uuid4
+from core import MessageBroker
+
+logger = logging.getLogger(__name__)
+
+
+class RevocationList:
+    """Revoked token ids (jti) mapped to their token's exp
+
+    Lookups are a single dict probe. Entries are dropped once their token
+    has expired, every prune_interval seconds after start(). With a
+    broker, revocations are broadcast so every process applies them, and
+    start() asks running peers for a snapshot so a new process also sees
+    revocations made before it subscribed.
+    """
+
+    def __init__(self, broker: MessageBroker = None, topic: str = "auth.revocations",
+                 prune_interval: float = 60.0):
+        self.broker = broker
+        self.topic = topic
+        self.prune_interval = prune_interval
+        self._revoked: Dict[str, float] = {}
+        self._origin = str(uuid4())
+        self._maintenance: Optional[asyncio.Task] = None
+
+    async def start(self):
+        """Subscribe to revocation deltas, request a snapshot and start pruning"""
+        if self.broker is not None:
+            await self.broker.subscribe(self.topic, self._on_delta)
+            await self.broker.publish(self.topic, {"sync": True, "origin": self._origin})
+        if self._maintenance is None:
+            self._maintenance = asyncio.create_task(self._maintain())
+
+    async def stop(self):
+        """Stop periodic pruning"""
+        if self._maintenance is not None:
+            self._maintenance.cancel()
+            await asyncio.gather(self._maintenance, return_exceptions=True)
+            self._maintenance = None
+
+    async def revoke(self, jti: str, exp: float):
+        """Revoke token id until exp (epoch seconds) and broadcast it"""
+        self.add(jti, exp)
+        if self.broker is not None:
+            await self.broker.publish(self.topic, {"jti": jti, "exp": exp, "origin": self._origin})
+
+    def add(self, jti: str, exp: float):
+        """Revoke token id locally"""
+        if exp > self._revoked.get(jti, 0.0):
+            self._revoked[jti] = exp
+
+    def is_revoked(self, jti: Optional[str], now: float = None) -> bool:
+        """Whether token id is revoked and not yet expired"""
+        exp = self._revoked.get(jti) if jti else None
+        return exp is not None and exp > (now if now is not None else time.time())
+
+    def prune(self, now: float = None) -> int:
+        """Drop expired entries, returning how many were dropped"""
+        now = now if now is not None else time.time()
+        expired = [jti for jti, exp in self._revoked.items() if exp <= now]
+        for jti in expired:
+            del self._revoked[jti]
+        return len(expired)
+
+    def snapshot(self, now: float = None) -> Dict[str, float]:
+        """Unexpired revocations as jti -> exp"""
+        now = now if now is not None else time.time()
+        return {jti: exp for jti, exp in self._revoked.items() if exp > now}
+
+    def __len__(self) -> int:
+        return len(self._revoked)
+
+    async def _maintain(self):
+        while True:
+            await asyncio.sleep(self.prune_interval)
+            try:
+                self.prune()
+            except Exception:
+                logger.exception("Revocation list pruning failed")
+
+    async def _on_delta(self, message: dict):
+        if message.get("origin") == self._origin:
+            return
+        if message.get("sync"):
+            revoked = self.snapshot()
+            if revoked:
+                await self.broker.publish(self.topic, {
+                    "snapshot": revoked, "origin": self._origin, "to": message["origin"]
+                })
+        elif "snapshot" in message:
+            if message.get("to") == self._origin:
+                for jti, exp in message["snapshot"].items():
+                    self.add(jti, exp)
+        else:
+            self.add(message["jti"], message["exp"])
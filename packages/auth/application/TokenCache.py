@@ -0,0 +1,51 @@
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+from ..domain import TokenPayload
+
+
+class TokenCache:
+    """Bounded LRU of verified token payloads keyed by token digest
+    
+    Entries are dropped once the token's exp (epoch seconds) has passed.
+    Each entry keeps the key that verified it so callers can reject hits
+    whose key was removed or expired since.
+    """
+    
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[bytes, Tuple[TokenPayload, float, Any]]" = OrderedDict()
+
+    def get(self, digest: bytes, now: float = None) -> Optional[TokenPayload]:
+        """Cached payload if present and not expired at now (epoch seconds)"""
+        entry = self.entry(digest, now)
+        return entry[0] if entry is not None else None
+
+    def entry(self, digest: bytes, now: float = None) -> Optional[Tuple[TokenPayload, Any]]:
+        """Cached (payload, key) if present and not expired at now"""
+        entry = self._entries.get(digest)
+        if entry is None:
+            return None
+        if entry[1] <= (now if now is not None else time.time()):
+            del self._entries[digest]
+            return None
+        self._entries.move_to_end(digest)
+        return entry[0], entry[2]
+
+    def set(self, digest: bytes, payload: TokenPayload, exp: float, key: Any = None):
+        """Store payload until exp, with the key that verified it"""
+        self._entries[digest] = (payload, exp, key)
+        self._entries.move_to_end(digest)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def discard(self, digest: bytes):
+        """Drop one entry"""
+        self._entries.pop(digest, None)
+
+    def clear(self):
+        """Drop all entries"""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
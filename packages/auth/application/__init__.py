@@ -1,4 +1,10 @@
-from .JWTService import JWTService
+from .JWTService import JWTService, JWTStats
+from .TokenCache import TokenCache
+from .KeyRing import KeyRing, KeyEntry
+from .PasswordHasher import PasswordHasher, BcryptCostPolicy, HasherStats
+from .BloomFilter import BloomFilter
+from .RevocationList import RevocationList
 from .AuthService import AuthService
 
-__all__ = ['JWTService', 'AuthService']
+__all__ = ['JWTService', 'JWTStats', 'TokenCache', 'KeyRing', 'KeyEntry', 'PasswordHasher',
+           'BcryptCostPolicy', 'HasherStats', 'BloomFilter', 'RevocationList', 'AuthService']
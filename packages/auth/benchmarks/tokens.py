@@ -0,0 +1,53 @@
+"""
+Benchmark de emissão e verificação de tokens em lote
+
+Compara o caminho por token (create_token/verify_token) com
+create_tokens_many/verify_many. A verificação usa serviços novos para
+medir o caminho sem cache.
+
+Uso: python benchmarks/tokens.py [tokens]
+"""
+
+import sys
+import time
+from pathlib import Path
+from uuid import uuid4
+
+packages_path = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(packages_path))
+
+from auth import JWTService  # noqa: E402
+
+SECRET = "benchmark-secret-with-enough-entropy-0123456789"
+
+
+def timed(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def report(name: str, seconds: float, count: int):
+    print(f"{name:<28} {seconds * 1e6 / count:8.1f} us/token")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    users = [(uuid4(), f"user{i}@example.com", "operator") for i in range(count)]
+    issuer = JWTService(SECRET)
+    print(f"{count} tokens\n")
+
+    report("create_token (loop)", timed(lambda: [issuer.create_token(*user) for user in users]), count)
+    report("create_tokens_many", timed(lambda: issuer.create_tokens_many(users)), count)
+
+    tokens = [result.value.access_token for result in issuer.create_tokens_many(users)]
+    single = JWTService(SECRET)
+    batch = JWTService(SECRET)
+    report("verify_token (loop, cold)", timed(lambda: [single.verify_token(t) for t in tokens]), count)
+    report("verify_many (cold)", timed(lambda: batch.verify_many(tokens)), count)
+    report("verify_token (loop, cached)", timed(lambda: [single.verify_token(t) for t in tokens]), count)
+    report("verify_many (cached)", timed(lambda: batch.verify_many(tokens)), count)
+
+
+if __name__ == "__main__":
+    main()
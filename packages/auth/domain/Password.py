@@ -8,11 +8,12 @@ pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 class Password(ValueObject):
     """Password value object with hashing and validation"""
     
-    def __init__(self, plain: str = None, hashed: str = None):
+    def __init__(self, plain: str = None, hashed: str = None, context: CryptContext = None):
+        self._context = context or pwd_context
         if plain:
             if not self._validate(plain):
                 raise ValidationException("Password must be 8+ chars with upper, lower, and digit")
-            self._hashed = pwd_context.hash(plain[:72])
+            self._hashed = self._context.hash(plain[:72])
         elif hashed:
             self._hashed = hashed
         else:
@@ -26,7 +27,11 @@ class Password(ValueObject):
                 re.search(r"\d", password))
 
     def verify(self, plain: str) -> bool:
-        return pwd_context.verify(plain[:72], self._hashed)
+        return self._context.verify(plain[:72], self._hashed)
+
+    def needs_rehash(self) -> bool:
+        """Whether the hash uses outdated parameters (e.g. bcrypt cost)"""
+        return self._context.needs_update(self._hashed)
 
     @property
     def hash(self) -> str:
@@ -11,6 +11,7 @@ class TokenPayload:
     role: str
     exp: datetime
     type: str
+    jti: str = ""
 
 
 class Token(ValueObject):
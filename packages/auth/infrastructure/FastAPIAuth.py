@@ -2,6 +2,7 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer
 from uuid import UUID
 from ..application import AuthService
+from ..domain import TokenPayload
 
 security = HTTPBearer()
 
@@ -23,3 +24,22 @@ def create_auth_dependency(auth_service: AuthService):
         return result.value
     
     return get_current_user
+
+
+def create_claims_dependency(auth_service: AuthService):
+    """Factory for dependency returning the verified token claims"""
+    
+    async def get_current_claims(credentials = Depends(security)) -> TokenPayload:
+        """Get claims of the authenticated token"""
+        result = auth_service.verify_access_claims(credentials.credentials)
+        
+        if result.is_failure:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid authentication credentials",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        
+        return result.value
+    
+    return get_current_claims
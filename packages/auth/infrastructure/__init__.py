@@ -1,3 +1,3 @@
-from .FastAPIAuth import create_auth_dependency
+from .FastAPIAuth import create_auth_dependency, create_claims_dependency
 
-__all__ = ['create_auth_dependency']
+__all__ = ['create_auth_dependency', 'create_claims_dependency']
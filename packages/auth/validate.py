@@ -0,0 +1,361 @@
+"""
+Script de validação do Auth
+
+Valida:
+- Imports funcionam
+- Tokens JWT assinam e verificam (HS256, RS256, JWKS, lotes)
+- Rotação de chaves mantém a janela de verificação
+- Cache de verificação respeita o KeyRing
+- verify_many e verify_token aceitam os mesmos tokens
+- Revogações expiram, são podadas e chegam a workers novos
+- AuthService rejeita tokens revogados
+- PasswordHasher roda bcrypt fora do event loop e refaz hashes
+"""
+
+import sys
+from pathlib import Path
+
+# Add packages to path
+packages_path = Path(__file__).parent.parent
+sys.path.insert(0, str(packages_path))
+
+
+def test_imports():
+    """Test all imports work"""
+    print("[TEST] Testing imports...")
+
+    try:
+        from auth import (
+            JWTService, TokenCache, KeyRing, PasswordHasher,
+            BloomFilter, RevocationList, AuthService
+        )
+        print("[OK] All imports successful")
+        return True
+    except Exception as e:
+        print(f"[FAIL] Import failed: {e}")
+        return False
+
+
+def test_jwt_sign_verify():
+    """Test token creation, verification, cache hits and batch APIs"""
+    print("\n[TEST] Testing JWT sign/verify...")
+
+    try:
+        from auth import JWTService
+        from core import new_id
+
+        service = JWTService(secret="secret")
+        user_id = new_id()
+        token = service.create_token(user_id, "a@b.c", "admin")
+
+        payload = service.verify_token(token.access_token)
+        assert payload.user_id == user_id and payload.role == "admin" and payload.jti
+        assert service.verify_token(token.access_token).jti == payload.jti
+        assert service.stats.cache_hits == 1 and service.stats.cache_misses == 1
+        assert service.verify_token(token.refresh_token, "refresh").user_id == user_id
+        assert service.verify_token(token.refresh_token) is None
+
+        header, _, signature = token.access_token.split(".")
+        other_claims = service.create_token(new_id(), "x@b.c", "admin").access_token.split(".")[1]
+        assert service.verify_token(".".join((header, other_claims, signature))) is None
+        assert JWTService(secret="other").verify_token(token.access_token) is None
+
+        users = [(new_id(), f"{i}@b.c", "user") for i in range(20)]
+        issued = service.create_tokens_many(users)
+        assert all(result.is_success for result in issued)
+        verified = service.verify_many([result.value.access_token for result in issued] + ["garbage"])
+        assert [result.value.user_id for result in verified[:-1]] == [user[0] for user in users]
+        assert verified[-1].is_failure
+
+        print("[OK] JWT sign/verify works")
+        return True
+    except Exception as e:
+        print(f"[FAIL] JWT sign/verify failed: {e!r}")
+        return False
+
+
+def test_key_rotation():
+    """Test asymmetric keys, JWKS verifiers and rotation overlap"""
+    print("\n[TEST] Testing KeyRing rotation...")
+
+    try:
+        from datetime import timedelta
+        import rsa
+        from jose import jwt
+        from auth import JWTService, KeyRing
+        from core import new_id
+
+        def pem_pair():
+            public, private = rsa.newkeys(1024)
+            return public.save_pkcs1().decode(), private.save_pkcs1().decode()
+
+        ring = KeyRing()
+        ring.add("k1", "RS256", *pem_pair())
+        issuer = JWTService(key_ring=ring)
+        first = issuer.create_token(new_id(), "a@b.c", "user").access_token
+
+        verifier = JWTService(key_ring=KeyRing.from_jwks(ring.jwks()))
+        assert verifier.verify_token(first) is not None
+        assert jwt.get_unverified_header(first)["kid"] == "k1"
+        assert verifier.verify_many([first])[0].is_success
+
+        ring.rotate("k2", "RS256", *pem_pair(), overlap=timedelta(hours=1))
+        second = issuer.create_token(new_id(), "a@b.c", "user").access_token
+        assert ring.signing_key().kid == "k2"
+        assert issuer.verify_token(first) is not None
+        assert issuer.verify_token(second) is not None
+
+        ring.rotate("k3", "RS256", *pem_pair(), overlap=timedelta(0))
+        assert issuer.verify_token(second) is None
+        assert issuer.verify_many([second])[0].is_failure
+        ring.prune()
+        assert {key["kid"] for key in ring.jwks()["keys"]} == {"k1", "k3"}
+
+        print("[OK] KeyRing rotation works")
+        return True
+    except Exception as e:
+        print(f"[FAIL] KeyRing rotation failed: {e!r}")
+        return False
+
+
+def test_cache_key_removal():
+    """Test cached tokens stop verifying once their key leaves the ring"""
+    print("\n[TEST] Testing JWT cache and key removal...")
+
+    try:
+        from auth import JWTService, KeyRing
+        from core import new_id
+
+        ring = KeyRing.symmetric("old-secret", kid="old")
+        service = JWTService(key_ring=ring)
+        token = service.create_token(new_id(), "a@b.c", "user").access_token
+        assert service.verify_token(token) is not None
+        assert service.verify_token(token) is not None
+        assert service.stats.cache_hits == 1
+
+        ring.add("new", "HS256", "new-secret", "new-secret")
+        ring.remove("old")
+        assert service.verify_token(token) is None
+        assert service.verify_many([token])[0].is_failure
+
+        ring.add("old", "HS256", "other-secret", "other-secret")
+        assert service.verify_token(token) is None
+
+        print("[OK] JWT cache follows the key ring")
+        return True
+    except Exception as e:
+        print(f"[FAIL] JWT cache failed: {e}")
+        return False
+
+
+def test_verify_many_malformed():
+    """Test batch verification survives hostile headers and matches verify_token"""
+    print("\n[TEST] Testing verify_many with malformed tokens...")
+
+    try:
+        import json
+        import time
+        from jose.utils import base64url_encode
+        from auth import JWTService
+        from core import new_id
+
+        service = JWTService(secret="secret")
+        key = service.key_ring.signing_key()
+
+        def forge(header, claims):
+            encode = lambda value: base64url_encode(json.dumps(value).encode())
+            signing_input = encode(header) + b"." + encode(claims)
+            return (signing_input + b"." + base64url_encode(key.signer.sign(signing_input))).decode()
+
+        exp = int(time.time()) + 60
+        claims = {"sub": str(new_id()), "exp": exp, "type": "access"}
+        good = service.create_token(new_id(), "a@b.c", "user").access_token
+        hostile = [forge(header, claims) for header in ([], "x", 1, None)]
+        mismatched = [
+            forge({"alg": "HS256"}, {**claims, "aud": "other"}),
+            forge({"alg": "HS256"}, {**claims, "iat": "soon"}),
+            forge({"alg": "HS256"}, {**claims, "jti": 5}),
+            forge({"alg": "HS256"}, {**claims, "exp": "tomorrow"}),
+            forge({"alg": "HS256"}, {**claims, "nbf": exp}),
+        ]
+        plain = forge({"alg": "HS256"}, claims)
+
+        results = service.verify_many(hostile + mismatched + [plain, good])
+        assert [result.is_success for result in results] == [False] * 9 + [True, True]
+
+        fresh = JWTService(secret="secret")
+        for token in mismatched + [plain]:
+            batched = fresh.verify_many([token])[0].is_success
+            assert batched == (JWTService(secret="secret").verify_token(token) is not None)
+            assert batched == (fresh.verify_token(token) is not None)
+
+        print("[OK] verify_many rejects malformed tokens like verify_token")
+        return True
+    except Exception as e:
+        print(f"[FAIL] verify_many failed: {e!r}")
+        return False
+
+
+def test_revocation_list():
+    """Test revocation lookups, pruning and snapshots for new workers"""
+    print("\n[TEST] Testing RevocationList...")
+
+    try:
+        import asyncio
+        import time
+        from auth import RevocationList
+        from core import MemoryBroker
+
+        async def run():
+            broker = MemoryBroker()
+            first = RevocationList(broker, prune_interval=0.01)
+            await first.start()
+            now = time.time()
+            await first.revoke("live", now + 60)
+            await first.revoke("stale", now + 0.02)
+            assert first.is_revoked("live") and not first.is_revoked("other")
+            assert not first.is_revoked(None)
+
+            late = RevocationList(broker, prune_interval=0.01)
+            await late.start()
+            assert late.is_revoked("live") and late.is_revoked("stale")
+
+            await late.revoke("later", now + 60)
+            assert first.is_revoked("later")
+
+            await asyncio.sleep(0.1)
+            assert len(first) == 2 and len(late) == 2
+            assert not late.is_revoked("stale")
+            await first.stop()
+            await late.stop()
+
+        asyncio.run(run())
+
+        print("[OK] RevocationList works")
+        return True
+    except Exception as e:
+        print(f"[FAIL] RevocationList failed: {e!r}")
+        return False
+
+
+def test_auth_service_revocation():
+    """Test AuthService rejects revoked tokens"""
+    print("\n[TEST] Testing AuthService revocation...")
+
+    try:
+        import asyncio
+        from auth import AuthService, JWTService, RevocationList
+        from core import new_id
+
+        async def run():
+            auth = AuthService(JWTService(secret="secret"), revocations=RevocationList())
+            token = auth.create_tokens(new_id(), "a@b.c", "user")
+            assert auth.verify_refresh_token(token.refresh_token).is_success
+
+            assert (await auth.revoke_token(token.refresh_token)).is_success
+            assert auth.verify_refresh_token(token.refresh_token).is_failure
+            assert auth.verify_access_claims(token.access_token).is_success
+            assert (await auth.revoke_token("garbage")).is_failure
+
+            unconfigured = AuthService(JWTService(secret="secret"))
+            assert (await unconfigured.revoke_token(token.refresh_token)).is_failure
+
+        asyncio.run(run())
+
+        print("[OK] AuthService revocation works")
+        return True
+    except Exception as e:
+        print(f"[FAIL] AuthService revocation failed: {e!r}")
+        return False
+
+
+def test_password_hasher():
+    """Test off-loop hashing, verification and rehash on cost change"""
+    print("\n[TEST] Testing PasswordHasher...")
+
+    try:
+        import asyncio
+        from auth import BcryptCostPolicy, PasswordHasher
+
+        async def run():
+            hasher = PasswordHasher(max_concurrency=2, policy=BcryptCostPolicy(rounds=4, min_rounds=4))
+            hashes = await asyncio.gather(*(hasher.hash(f"Secret{i}Pass") for i in range(4)))
+            assert await hasher.verify("Secret0Pass", hashes[0])
+            assert not await hasher.verify("Secret1Pass", hashes[0])
+            assert hasher.stats.completed == 6 and hasher.stats.in_flight == 0
+
+            valid, new_hash = await hasher.verify_and_update("Secret0Pass", hashes[0])
+            assert valid and new_hash is None
+            stronger = PasswordHasher(policy=BcryptCostPolicy(rounds=5, min_rounds=4))
+            valid, new_hash = await stronger.verify_and_update("Secret0Pass", hashes[0])
+            assert valid and new_hash.startswith("$2b$05$")
+            hasher.shutdown()
+            stronger.shutdown()
+
+        asyncio.run(run())
+
+        print("[OK] PasswordHasher works")
+        return True
+    except Exception as e:
+        print(f"[FAIL] PasswordHasher failed: {e!r}")
+        return False
+
+
+def test_bloom_filter():
+    """Test BloomFilter has no false negatives"""
+    print("\n[TEST] Testing BloomFilter...")
+
+    try:
+        from auth import BloomFilter
+
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        items = [f"jti-{i}" for i in range(1000)]
+        for item in items:
+            bloom.add(item)
+        assert all(item in bloom for item in items)
+        false_positives = sum(f"other-{i}" in bloom for i in range(10000))
+        assert false_positives < 500
+        bloom.clear()
+        assert "jti-0" not in bloom
+
+        print("[OK] BloomFilter works")
+        return True
+    except Exception as e:
+        print(f"[FAIL] BloomFilter failed: {e!r}")
+        return False
+
+
+def main():
+    """Run all tests"""
+    print("=" * 50)
+    print("Auth Validation")
+    print("=" * 50)
+
+    tests = [
+        test_imports,
+        test_jwt_sign_verify,
+        test_key_rotation,
+        test_cache_key_removal,
+        test_verify_many_malformed,
+        test_revocation_list,
+        test_auth_service_revocation,
+        test_password_hasher,
+        test_bloom_filter,
+    ]
+
+    results = [test() for test in tests]
+
+    print("\n" + "=" * 50)
+    print(f"Results: {sum(results)}/{len(results)} passed")
+    print("=" * 50)
+
+    if all(results):
+        print("[SUCCESS] All tests passed!")
+        return 0
+    else:
+        print("[ERROR] Some tests failed")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -11,27 +11,42 @@ Opiniated framework for Domain-Driven Design with:
 from .domain import (
     Entity,
     ValueObject,
+    SlottedValueObject,
+    new_id,
     AggregateRoot,
     DomainEvent,
     DomainException,
     ValidationException,
     BusinessRuleViolationException,
     NotFoundException,
-    Repository
+    Repository,
+    EntityColumns
 )
 
 from .application import (
     UseCase,
     DTO,
     Result,
-    EventBus
+    EventBus,
+    DispatchPolicy,
+    cached_use_case,
+    UseCaseCache
 )
 
 from .infrastructure import (
     UnitOfWork,
+    TrackingUnitOfWork,
     Connection,
+    ConnectionPool,
+    PoolStats,
+    Lease,
+    InMemoryRepository,
     MessageBroker,
+    MemoryBroker,
     Cache,
+    MemoryCache,
+    CacheStats,
+    TieredCache,
     Logger,
     LogLevel
 )
@@ -49,6 +64,8 @@ __all__ = [
     # Domain
     'Entity',
     'ValueObject',
+    'SlottedValueObject',
+    'new_id',
     'AggregateRoot',
     'DomainEvent',
     'DomainException',
@@ -56,16 +73,29 @@ __all__ = [
     'BusinessRuleViolationException',
     'NotFoundException',
     'Repository',
+    'EntityColumns',
     # Application
     'UseCase',
     'DTO',
     'Result',
     'EventBus',
+    'DispatchPolicy',
+    'cached_use_case',
+    'UseCaseCache',
     # Infrastructure
     'UnitOfWork',
+    'TrackingUnitOfWork',
     'Connection',
+    'ConnectionPool',
+    'PoolStats',
+    'Lease',
+    'InMemoryRepository',
     'MessageBroker',
+    'MemoryBroker',
     'Cache',
+    'MemoryCache',
+    'CacheStats',
+    'TieredCache',
     'Logger',
     'LogLevel',
     # App
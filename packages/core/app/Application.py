@@ -31,6 +31,7 @@ class Application:
         """Shutdown lifecycle"""
         for module in self.modules:
             await module.on_shutdown(self)
+        await self.event_bus.stop()
         await self.hooks.run_shutdown()
 
     def run(self, host: str = "0.0.0.0", port: int = 8000):
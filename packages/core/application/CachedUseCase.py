@@ -0,0 +1,124 @@
+import asyncio
+import hashlib
+import json
+from dataclasses import asdict, is_dataclass
+from functools import wraps
+from typing import Any, Dict, Iterable, Optional, Type
+from .EventBus import EventBus
+from .Result import Result
+from .UseCase import UseCase
+from ..domain.DomainEvent import DomainEvent
+from ..domain.Identity import new_id
+from ..infrastructure.cache.Cache import Cache
+
+
+def _encode(value: Any) -> Any:
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=lambda item: json.dumps(item, sort_keys=True, default=_encode))
+    return str(value)
+
+
+class UseCaseCache:
+    """Result memoization state for one use case class
+
+    Keys embed a generation token kept in the cache backend itself, so
+    with a shared backend every process sees the same generation.
+    invalidate() replaces it with a fresh random token, never reused
+    across restarts, so previous entries become unreachable and age out
+    through their TTL.
+    """
+    
+    def __init__(self, cache: Cache, name: str, ttl: int = None):
+        self.cache = cache
+        self.name = name
+        self.ttl = ttl
+        self.generation_key = f"usecase:{name}:generation"
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    async def generation(self) -> str:
+        """Current generation token, created on first use"""
+        generation = await self.cache.get(self.generation_key)
+        if generation is None:
+            generation = new_id().hex
+            await self.cache.set(self.generation_key, generation)
+        return generation
+
+    def key(self, request: Any, generation: str) -> Optional[str]:
+        """Stable key from DTO type and fields (None when request is not a dataclass)
+        
+        Sets are keyed as sorted lists, so equal sets share a key whatever
+        their iteration order.
+        """
+        if not is_dataclass(request):
+            return None
+        request_type = type(request)
+        payload = json.dumps(
+            [f"{request_type.__module__}.{request_type.__qualname__}", asdict(request)],
+            sort_keys=True, default=_encode
+        )
+        digest = hashlib.sha1(payload.encode()).hexdigest()
+        return f"usecase:{self.name}:{generation}:{digest}"
+
+    async def invalidate(self, event: DomainEvent = None):
+        """Drop all cached results"""
+        await self.cache.set(self.generation_key, new_id().hex)
+
+    async def execute(self, execute, use_case: UseCase, request: Any) -> Result:
+        """Return cached Result or run execute once per concurrent key"""
+        if not is_dataclass(request):
+            return await execute(use_case, request)
+        generation = await self.generation()
+        key = self.key(request, generation)
+        cached = await self.cache.get(key)
+        if cached is not None:
+            return cached
+        pending = self._inflight.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await execute(use_case, request)
+            if result.is_success and generation == await self.generation():
+                await self.cache.set(key, result, self.ttl)
+            future.set_result(result)
+            return result
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()
+            raise
+        finally:
+            if not future.done():
+                future.cancel()
+            del self._inflight[key]
+
+
+def cached_use_case(cache: Cache, ttl: int = None, event_bus: EventBus = None,
+                    invalidate_on: Iterable[Type[DomainEvent]] = ()):
+    """Memoize successful Results of a UseCase keyed on its DTO
+    
+    Args:
+        cache: Cache backend storing Result values
+        ttl: Entry TTL in seconds
+        event_bus: Bus used to subscribe invalidation events
+        invalidate_on: Event types that invalidate all cached results
+    """
+    invalidate_on = tuple(invalidate_on)
+    if invalidate_on and event_bus is None:
+        raise ValueError("event_bus is required to subscribe invalidation events")
+
+    def decorator(cls: Type[UseCase]) -> Type[UseCase]:
+        state = UseCaseCache(cache, f"{cls.__module__}.{cls.__qualname__}", ttl)
+        execute = cls.execute
+
+        @wraps(execute)
+        async def cached_execute(self, request):
+            return await state.execute(execute, self, request)
+
+        for event_type in invalidate_on:
+            event_bus.subscribe(event_type, state.invalidate)
+        cls.execute = cached_execute
+        cls.use_case_cache = state
+        return cls
+    return decorator
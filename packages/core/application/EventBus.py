@@ -1,22 +1,233 @@
-from typing import Dict, List, Callable, Awaitable
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Dict, List, Callable, Awaitable, Optional, Tuple, Iterable, Union
 from ..domain.DomainEvent import DomainEvent
 
+Handler = Callable[[DomainEvent], Awaitable[None]]
+BatchHandler = Callable[[List[DomainEvent]], Awaitable[None]]
+ErrorHandler = Callable[[DomainEvent, Handler, BaseException], None]
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class DispatchPolicy:
+    """Dispatch policy for an event type"""
+    max_concurrency: Optional[int] = None
+    timeout: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class _Subscription:
+    handler: Union[Handler, BatchHandler]
+    timeout: Optional[float]
+    batch: bool = False
+
+
+def _log_error(event: DomainEvent, handler: Handler, error: BaseException):
+    logger.error(
+        "Event handler %r failed for %s",
+        handler, type(event).__name__, exc_info=error
+    )
+
 
 class EventBus:
-    """Simple event bus for domain events"""
-    
-    def __init__(self):
-        self._handlers: Dict[type, List[Callable[[DomainEvent], Awaitable[None]]]] = {}
+    """Event bus for domain events
 
-    def subscribe(self, event_type: type, handler: Callable[[DomainEvent], Awaitable[None]]):
-        """Subscribe to event"""
+    Handlers subscribed to a base class also receive its subclasses. The
+    handler table per concrete event type is compiled once from the MRO
+    and reused until the subscriptions change. Handlers of one event run
+    concurrently and failures are isolated from each other; a policy's
+    max_concurrency bounds running handlers per event type across every
+    publish.
+
+    Events can also be enqueued on a bounded queue drained by background
+    workers (see start/enqueue/stop), taking dispatch off the caller path.
+    """
+
+    def __init__(self, default_policy: DispatchPolicy = None,
+                 on_error: ErrorHandler = None, queue_size: int = 10000,
+                 workers: int = 1, max_batch: int = 100):
+        self._handlers: Dict[type, List[_Subscription]] = {}
+        self._policies: Dict[type, DispatchPolicy] = {}
+        self._default_policy = default_policy or DispatchPolicy()
+        self._on_error = on_error or _log_error
+        self._compiled: Dict[type, Tuple[Tuple[_Subscription, ...], DispatchPolicy]] = {}
+        self._queue_size = queue_size
+        self._worker_count = workers
+        self._max_batch = max_batch
+        self._semaphores: Dict[type, asyncio.Semaphore] = {}
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+
+    def subscribe(self, event_type: type, handler: Handler, timeout: float = None):
+        """Subscribe to event (and its subclasses)"""
+        if event_type not in self._handlers:
+            self._handlers[event_type] = []
+        self._handlers[event_type].append(_Subscription(handler, timeout))
+        self._compiled.clear()
+
+    def subscribe_batch(self, event_type: type, handler: BatchHandler, timeout: float = None):
+        """Subscribe handler receiving lists of events (and subclasses)"""
         if event_type not in self._handlers:
             self._handlers[event_type] = []
-        self._handlers[event_type].append(handler)
+        self._handlers[event_type].append(_Subscription(handler, timeout, batch=True))
+        self._compiled.clear()
+
+    def unsubscribe(self, event_type: type, handler: Handler):
+        """Remove handler from event"""
+        subscriptions = self._handlers.get(event_type, [])
+        self._handlers[event_type] = [s for s in subscriptions if s.handler != handler]
+        self._compiled.clear()
+
+    def configure(self, event_type: type, policy: DispatchPolicy):
+        """Set dispatch policy for event type (and its subclasses)"""
+        self._policies[event_type] = policy
+        self._compiled.clear()
+        self._semaphores.clear()
+
+    def _compile(self, event_type: type) -> Tuple[Tuple[_Subscription, ...], DispatchPolicy]:
+        mro = event_type.__mro__
+        subscriptions = tuple(s for cls in mro for s in self._handlers.get(cls, ()))
+        policy = next((self._policies[cls] for cls in mro if cls in self._policies),
+                      self._default_policy)
+        compiled = (subscriptions, policy)
+        self._compiled[event_type] = compiled
+        return compiled
+
+    def _route(self, event_type: type) -> Tuple[Tuple[_Subscription, ...], DispatchPolicy]:
+        compiled = self._compiled.get(event_type)
+        return compiled if compiled is not None else self._compile(event_type)
+
+    def _semaphore(self, event_type: type, policy: DispatchPolicy) -> Optional[asyncio.Semaphore]:
+        """Semaphore shared by every dispatch of event_type, created on the running loop"""
+        if not policy.max_concurrency:
+            return None
+        loop = asyncio.get_running_loop()
+        if self._semaphore_loop is not loop:
+            self._semaphores = {}
+            self._semaphore_loop = loop
+        semaphore = self._semaphores.get(event_type)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(policy.max_concurrency)
+            self._semaphores[event_type] = semaphore
+        return semaphore
+
+    async def _run(self, event: DomainEvent, argument, subscription: _Subscription,
+                   policy: DispatchPolicy, semaphore: Optional[asyncio.Semaphore]):
+        timeout = subscription.timeout if subscription.timeout is not None else policy.timeout
+        if semaphore is None:
+            await self._guard(event, argument, subscription, timeout)
+            return
+        async with semaphore:
+            await self._guard(event, argument, subscription, timeout)
+
+    async def _guard(self, event: DomainEvent, argument, subscription: _Subscription,
+                     timeout: Optional[float]):
+        try:
+            await asyncio.wait_for(subscription.handler(argument), timeout)
+        except Exception as e:
+            self._on_error(event, subscription.handler, e)
+
+    async def _deliver(self, subscription: _Subscription, items: List[tuple]):
+        for event, policy, semaphore in items:
+            await self._run(event, event, subscription, policy, semaphore)
 
     async def publish(self, event: DomainEvent):
         """Publish event to all subscribers"""
         event_type = type(event)
-        if event_type in self._handlers:
-            for handler in self._handlers[event_type]:
-                await handler(event)
+        subscriptions, policy = self._route(event_type)
+        semaphore = self._semaphore(event_type, policy)
+        if len(subscriptions) == 1:
+            subscription = subscriptions[0]
+            await self._run(event, [event] if subscription.batch else event, subscription, policy, semaphore)
+            return
+        await asyncio.gather(*(
+            self._run(event, [event] if subscription.batch else event, subscription, policy, semaphore)
+            for subscription in subscriptions
+        ))
+
+    async def publish_many(self, events: Iterable[DomainEvent]):
+        """Publish events; batch handlers get one list per event type
+
+        Every other handler receives its events one at a time in publish
+        order, including handlers subscribed to a base type.
+        """
+        routes: Dict[type, tuple] = {}
+        ordered: Dict[int, Tuple[_Subscription, List[tuple]]] = {}
+        batches: Dict[Tuple[int, type], tuple] = {}
+        for event in events:
+            event_type = type(event)
+            route = routes.get(event_type)
+            if route is None:
+                subscriptions, policy = self._route(event_type)
+                route = (subscriptions, policy, self._semaphore(event_type, policy))
+                routes[event_type] = route
+            subscriptions, policy, semaphore = route
+            for subscription in subscriptions:
+                if subscription.batch:
+                    key = (id(subscription), event_type)
+                    if key not in batches:
+                        batches[key] = (subscription, policy, semaphore, [])
+                    batches[key][3].append(event)
+                else:
+                    if id(subscription) not in ordered:
+                        ordered[id(subscription)] = (subscription, [])
+                    ordered[id(subscription)][1].append((event, policy, semaphore))
+
+        await asyncio.gather(
+            *(self._deliver(subscription, items) for subscription, items in ordered.values()),
+            *(self._run(group[0], group, subscription, policy, semaphore)
+              for subscription, policy, semaphore, group in batches.values())
+        )
+
+    def start(self):
+        """Start queue workers (requires a running event loop)"""
+        if self._workers:
+            return
+        self._queue = asyncio.Queue(maxsize=self._queue_size)
+        self._workers = [
+            asyncio.create_task(self._drain()) for _ in range(self._worker_count)
+        ]
+
+    async def enqueue(self, event: DomainEvent):
+        """Queue event for background dispatch; waits while the queue is full"""
+        if not self._workers:
+            self.start()
+        await self._queue.put(event)
+
+    async def enqueue_many(self, events: Iterable[DomainEvent]):
+        """Queue events for background dispatch"""
+        for event in events:
+            await self.enqueue(event)
+
+    async def _drain(self):
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self._max_batch and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            try:
+                await self.publish_many(batch)
+            except Exception:
+                logger.exception("Dispatch of %d queued events failed", len(batch))
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def flush(self):
+        """Wait until every queued event is dispatched"""
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def stop(self):
+        """Flush queued events and stop workers"""
+        if not self._workers:
+            return
+        await self.flush()
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._queue = None
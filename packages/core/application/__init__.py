@@ -1,11 +1,15 @@
 from .UseCase import UseCase
 from .DTO import DTO
 from .Result import Result
-from .EventBus import EventBus
+from .EventBus import EventBus, DispatchPolicy
+from .CachedUseCase import cached_use_case, UseCaseCache
 
 __all__ = [
     'UseCase',
     'DTO',
     'Result',
-    'EventBus'
+    'EventBus',
+    'DispatchPolicy',
+    'cached_use_case',
+    'UseCaseCache'
 ]
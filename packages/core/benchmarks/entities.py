@@ -0,0 +1,126 @@
+"""
+Benchmark de criação de Entity/ValueObject
+
+Compara o layout antigo (uuid4 eager, dois utcnow, tudo em __dict__)
+com Entity em __slots__ (id lazy/em lote, um timestamp) e
+SlottedValueObject (hash cacheado). Resultados escalados para 1M.
+
+Uso: python benchmarks/entities.py [instancias]
+"""
+
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from uuid import uuid4
+
+packages_path = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(packages_path))
+
+from core import Entity, ValueObject, SlottedValueObject  # noqa: E402
+
+
+class LegacyEntity:
+    """Entity layout before __slots__"""
+    def __init__(self, id=None):
+        self._id = id or uuid4()
+        self._created_at = datetime.utcnow()
+        self._updated_at = datetime.utcnow()
+
+
+class LegacyThumbnail(LegacyEntity):
+    def __init__(self, timestamp: float = 0.0, url: str = ""):
+        super().__init__()
+        self.timestamp = timestamp
+        self.url = url
+
+
+class DictThumbnail(Entity):
+    def __init__(self, timestamp: float = 0.0, url: str = ""):
+        super().__init__()
+        self.timestamp = timestamp
+        self.url = url
+
+
+class SlottedThumbnail(Entity):
+    __slots__ = ("timestamp", "url")
+
+    def __init__(self, timestamp: float = 0.0, url: str = ""):
+        super().__init__()
+        self.timestamp = timestamp
+        self.url = url
+
+
+class DictPoint(ValueObject):
+    def __init__(self, x: int, y: int):
+        self.x = x
+        self.y = y
+
+
+class SlottedPoint(SlottedValueObject):
+    __slots__ = ("x", "y")
+
+    def __init__(self, x: int, y: int):
+        self.x = x
+        self.y = y
+
+
+def measure(factory, count: int):
+    """Return (seconds, bytes) to build count instances"""
+    start = time.perf_counter()
+    items = [factory(i) for i in range(count)]
+    elapsed = time.perf_counter() - start
+    del items
+
+    tracemalloc.start()
+    items = [factory(i) for i in range(count)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del items
+    return elapsed, size
+
+
+def with_id(entity: Entity) -> Entity:
+    entity.id
+    return entity
+
+
+def measure_hash(items, rounds: int = 5) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for item in items:
+            hash(item)
+    return time.perf_counter() - start
+
+
+def report(name: str, seconds: float, size: int, count: int):
+    scale = 1_000_000 / count
+    print(f"{name:<32} {seconds * scale:8.2f} s/M {size * scale / 2**20:10.1f} MiB/M")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    print(f"{count} instances, scaled per million\n")
+
+    cases = [
+        ("legacy entity (eager uuid4)", lambda i: LegacyThumbnail(i, "u")),
+        ("entity, subclass with __dict__", lambda i: DictThumbnail(i, "u")),
+        ("entity, subclass with __slots__", lambda i: SlottedThumbnail(i, "u")),
+        ("  + id accessed", lambda i: with_id(SlottedThumbnail(i, "u"))),
+        ("value object (__dict__)", lambda i: DictPoint(i, i)),
+        ("slotted value object", lambda i: SlottedPoint(i, i)),
+    ]
+    for name, factory in cases:
+        seconds, size = measure(factory, count)
+        report(name, seconds, size, count)
+
+    print()
+    dict_points = [DictPoint(i, i) for i in range(count)]
+    slotted_points = [SlottedPoint(i, i) for i in range(count)]
+    report("hash x5, value object", measure_hash(dict_points), 0, count)
+    report("hash x5, slotted value object", measure_hash(slotted_points), 0, count)
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,8 @@ from .DomainEvent import DomainEvent
 class AggregateRoot(Entity):
     """Aggregate root with domain events"""
     
+    __slots__ = ("_domain_events",)
+    
     def __init__(self, id: UUID | None = None):
         super().__init__(id)
         self._domain_events: List[DomainEvent] = []
@@ -1,19 +1,30 @@
 from abc import ABC
 from datetime import datetime
 from typing import Any
-from uuid import UUID, uuid4
+from uuid import UUID
+from .Identity import new_id
 
 
 class Entity(ABC):
-    """Base entity with identity and timestamps"""
+    """Base entity with identity and timestamps
+    
+    Base fields live in __slots__. Subclasses that also declare __slots__
+    have no per-instance __dict__; subclasses without it keep one for
+    their own attributes. The id is generated on first access.
+    """
+    
+    __slots__ = ("_id", "_created_at", "_updated_at", "__weakref__")
     
     def __init__(self, id: UUID | None = None):
-        self._id = id or uuid4()
-        self._created_at = datetime.utcnow()
-        self._updated_at = datetime.utcnow()
+        now = datetime.utcnow()
+        self._id = id
+        self._created_at = now
+        self._updated_at = now
 
     @property
     def id(self) -> UUID:
+        if self._id is None:
+            self._id = new_id()
         return self._id
 
     @property
@@ -0,0 +1,175 @@
+import inspect
+import math
+from array import array
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Generic, Iterable, Iterator, List, Optional, Type, TypeVar
+from uuid import UUID
+from .Identity import new_id
+
+T = TypeVar('T')
+
+TIMESTAMP = "T"
+OBJECT = "O"
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _to_seconds(value: Optional[datetime]) -> float:
+    return math.nan if value is None else (value - _EPOCH).total_seconds()
+
+
+def _to_datetime(value: float) -> Optional[datetime]:
+    return None if math.isnan(value) else _EPOCH + timedelta(seconds=value)
+
+
+def _new_column(typecode: str, values: Iterable[Any] = ()):
+    if typecode == OBJECT:
+        return list(values)
+    return array("d" if typecode == TIMESTAMP else typecode, values)
+
+
+class EntityColumns(Generic[T]):
+    """Struct-of-arrays collection of entities of one type
+    
+    Ids are packed as 16-byte UUIDs, created_at, updated_at and TIMESTAMP columns as
+    float seconds (NaN for None), numeric columns in typed arrays and
+    OBJECT columns in plain lists. Filtering and sorting read columns
+    only; entities are built on access through __getitem__/__iter__.
+    """
+    
+    TIMESTAMP = TIMESTAMP
+    OBJECT = OBJECT
+    
+    def __init__(self, entity_type: Type[T], columns: Dict[str, str]):
+        self.entity_type = entity_type
+        self.columns = dict(columns)
+        self._ids = bytearray()
+        self._created = array("d")
+        self._updated = array("d")
+        self._data: Dict[str, Any] = {
+            name: _new_column(typecode) for name, typecode in self.columns.items()
+        }
+        params = inspect.signature(entity_type.__init__).parameters
+        self._init_fields = [name for name in self.columns if name in params]
+        self._extra_fields = [name for name in self.columns if name not in params]
+
+    @classmethod
+    def from_entities(cls, entity_type: Type[T], columns: Dict[str, str],
+                      entities: Iterable[T]) -> "EntityColumns[T]":
+        """Build collection from existing entities"""
+        collection = cls(entity_type, columns)
+        for entity in entities:
+            collection.add(entity)
+        return collection
+
+    def append(self, id: UUID = None, created_at: datetime = None,
+               updated_at: datetime = None, **values):
+        """Append a row without building an entity (updated_at defaults to created_at)
+        
+        Every value is converted and checked before any column grows, so a
+        missing numeric value or a wrong type raises and leaves the
+        collection unchanged.
+        """
+        key = (id or new_id()).bytes
+        created = _to_seconds(created_at or datetime.utcnow())
+        updated = created if updated_at is None else _to_seconds(updated_at)
+        row = []
+        for name, typecode in self.columns.items():
+            value = values.get(name)
+            if typecode == TIMESTAMP:
+                value = _to_seconds(value)
+            elif typecode != OBJECT:
+                if value is None:
+                    raise ValueError(f"Missing value for column '{name}'")
+                value = array(typecode, (value,))[0]
+            row.append(value)
+        self._ids += key
+        self._created.append(created)
+        self._updated.append(updated)
+        for column, value in zip(self._data.values(), row):
+            column.append(value)
+
+    def add(self, entity: T):
+        """Append an entity's fields"""
+        values = {name: getattr(entity, name) for name in self.columns}
+        self.append(entity.id, entity.created_at, entity.updated_at, **values)
+
+    def __len__(self) -> int:
+        return len(self._created)
+
+    def __getitem__(self, index: int) -> T:
+        if index < 0:
+            index += len(self)
+        values = {name: self._value(name, index) for name in self.columns}
+        entity = self.entity_type(
+            id=self.id_at(index),
+            **{name: values[name] for name in self._init_fields}
+        )
+        for name in self._extra_fields:
+            setattr(entity, name, values[name])
+        entity._created_at = _to_datetime(self._created[index])
+        entity._updated_at = _to_datetime(self._updated[index])
+        return entity
+
+    def __iter__(self) -> Iterator[T]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def to_list(self) -> List[T]:
+        """Materialize every entity"""
+        return list(self)
+
+    def id_at(self, index: int) -> UUID:
+        """Id of row without materializing the entity"""
+        return UUID(bytes=bytes(self._ids[16 * index:16 * index + 16]))
+
+    def column(self, name: str):
+        """Raw column (typed array, list, or float seconds for timestamps)"""
+        if name == "created_at":
+            return self._created
+        if name == "updated_at":
+            return self._updated
+        return self._data[name]
+
+    def values(self, name: str) -> Iterable[Any]:
+        """Column values as entities hold them (id as UUID, timestamps as datetime)
+        
+        Raises KeyError for names that are not columns.
+        """
+        if name == "id":
+            return (self.id_at(index) for index in range(len(self)))
+        if name in ("created_at", "updated_at") or self.columns.get(name) == TIMESTAMP:
+            return map(_to_datetime, self.column(name))
+        return self.column(name)
+
+    def where(self, predicate: Callable[..., bool], *names: str) -> "EntityColumns[T]":
+        """Rows where predicate(*column_values) holds, reading only the named columns"""
+        columns = [self.column(name) for name in names]
+        return self.take([
+            index for index, values in enumerate(zip(*columns)) if predicate(*values)
+        ])
+
+    def sort_by(self, name: str, reverse: bool = False) -> "EntityColumns[T]":
+        """Rows ordered by one column"""
+        column = self.column(name)
+        return self.take(sorted(range(len(self)), key=column.__getitem__, reverse=reverse))
+
+    def take(self, indices: Iterable[int]) -> "EntityColumns[T]":
+        """New collection with the given rows"""
+        indices = list(indices)
+        subset = EntityColumns.__new__(EntityColumns)
+        subset.entity_type = self.entity_type
+        subset.columns = self.columns
+        subset._init_fields = self._init_fields
+        subset._extra_fields = self._extra_fields
+        subset._ids = bytearray(b"".join(self._ids[16 * i:16 * i + 16] for i in indices))
+        subset._created = array("d", (self._created[i] for i in indices))
+        subset._updated = array("d", (self._updated[i] for i in indices))
+        subset._data = {
+            name: _new_column(typecode, (self._data[name][i] for i in indices))
+            for name, typecode in self.columns.items()
+        }
+        return subset
+
+    def _value(self, name: str, index: int) -> Any:
+        value = self._data[name][index]
+        return _to_datetime(value) if self.columns[name] == TIMESTAMP else value
@@ -1,12 +1,16 @@
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar, Optional, List
+from typing import Generic, TypeVar, Optional, List, Iterable, AsyncIterator
 from uuid import UUID
 
 T = TypeVar('T')
 
 
 class Repository(ABC, Generic[T]):
-    """Repository pattern interface"""
+    """Repository pattern interface
+    
+    Bulk and streaming methods have defaults built on the single-entity
+    methods; implementations should override them with batched queries.
+    """
     
     @abstractmethod
     async def save(self, entity: T) -> T:
@@ -27,3 +31,48 @@ class Repository(ABC, Generic[T]):
     async def delete(self, id: UUID) -> None:
         """Delete entity"""
         pass
+
+    async def save_many(self, entities: Iterable[T]) -> List[T]:
+        """Save entities"""
+        return [await self.save(entity) for entity in entities]
+
+    async def find_by_ids(self, ids: Iterable[UUID]) -> List[T]:
+        """Find entities by IDs, skipping missing ones"""
+        found = [await self.find_by_id(id) for id in ids]
+        return [entity for entity in found if entity is not None]
+
+    async def delete_many(self, ids: Iterable[UUID]) -> None:
+        """Delete entities"""
+        for id in ids:
+            await self.delete(id)
+
+    async def find_page(self, after: Optional[UUID] = None, limit: int = 1000) -> List[T]:
+        """Find up to limit entities ordered by ID, with ID greater than after
+        
+        The default loads and sorts every entity per page; override it with
+        a keyset query (WHERE id > :after ORDER BY id LIMIT :limit).
+        """
+        entities = sorted(await self.find_all(), key=lambda entity: entity.id)
+        if after is not None:
+            entities = [entity for entity in entities if entity.id > after]
+        return entities[:limit]
+
+    async def stream_all(self, batch_size: int = 1000) -> AsyncIterator[T]:
+        """Iterate all entities
+        
+        The default iterates a single find_all(); implementations with a
+        real find_page should override it with keyset_stream.
+        """
+        for entity in await self.find_all():
+            yield entity
+
+    async def keyset_stream(self, batch_size: int = 1000) -> AsyncIterator[T]:
+        """Iterate all entities using keyset pagination over IDs (find_page)"""
+        after = None
+        while True:
+            page = await self.find_page(after, batch_size)
+            for entity in page:
+                yield entity
+            if len(page) < batch_size:
+                return
+            after = page[-1].id
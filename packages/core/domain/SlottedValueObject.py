@@ -0,0 +1,45 @@
+from typing import Any, Tuple
+from .ValueObject import ValueObject
+
+
+class SlottedValueObject(ValueObject):
+    """Value object stored in __slots__ with a cached hash
+    
+    Subclasses must declare their fields in __slots__ and must not change
+    them after construction: the hash is computed once on first use.
+    Attributes kept in an instance __dict__ (e.g. from a base without
+    __slots__) also take part in equality.
+    """
+    
+    __slots__ = ("_hash",)
+    _fields: Tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "__slots__" not in cls.__dict__:
+            raise TypeError(f"{cls.__name__} must declare __slots__")
+        cls._fields = tuple(
+            name
+            for klass in reversed(cls.__mro__)
+            for name in getattr(klass, "__slots__", ())
+            if name not in ("_hash", "__weakref__")
+        )
+
+    def _values(self) -> Tuple[Any, ...]:
+        values = tuple(getattr(self, name, None) for name in self._fields)
+        extra = getattr(self, "__dict__", None)
+        if extra:
+            values += tuple(sorted(extra.items()))
+        return values
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, self.__class__):
+            return False
+        return self._values() == other._values()
+
+    def __hash__(self) -> int:
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash(self._values())
+            return self._hash
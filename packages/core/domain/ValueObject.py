@@ -5,6 +5,8 @@ from typing import Any
 class ValueObject(ABC):
     """Immutable value object with equality by value"""
     
+    __slots__ = ()
+    
     def __eq__(self, other: Any) -> bool:
         if not isinstance(other, self.__class__):
             return False
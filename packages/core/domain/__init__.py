@@ -1,5 +1,7 @@
 from .Entity import Entity
 from .ValueObject import ValueObject
+from .SlottedValueObject import SlottedValueObject
+from .Identity import new_id
 from .AggregateRoot import AggregateRoot
 from .DomainEvent import DomainEvent
 from .DomainException import (
@@ -9,15 +11,19 @@ from .DomainException import (
     NotFoundException
 )
 from .Repository import Repository
+from .EntityColumns import EntityColumns
 
 __all__ = [
     'Entity',
     'ValueObject',
+    'SlottedValueObject',
+    'new_id',
     'AggregateRoot',
     'DomainEvent',
     'DomainException',
     'ValidationException',
     'BusinessRuleViolationException',
     'NotFoundException',
-    'Repository'
+    'Repository',
+    'EntityColumns'
 ]
@@ -1,14 +1,29 @@
 from .database.UnitOfWork import UnitOfWork
+from .database.TrackingUnitOfWork import TrackingUnitOfWork
 from .database.Connection import Connection
+from .database.ConnectionPool import ConnectionPool, PoolStats, Lease
+from .database.InMemoryRepository import InMemoryRepository
 from .messaging.MessageBroker import MessageBroker
+from .messaging.MemoryBroker import MemoryBroker
 from .cache.Cache import Cache
+from .cache.MemoryCache import MemoryCache, CacheStats
+from .cache.TieredCache import TieredCache
 from .logger.Logger import Logger, LogLevel
 
 __all__ = [
     'UnitOfWork',
+    'TrackingUnitOfWork',
     'Connection',
+    'ConnectionPool',
+    'PoolStats',
+    'Lease',
+    'InMemoryRepository',
     'MessageBroker',
+    'MemoryBroker',
     'Cache',
+    'MemoryCache',
+    'CacheStats',
+    'TieredCache',
     'Logger',
     'LogLevel'
 ]
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional, Any
+from typing import Optional, Any, Callable, Awaitable
 
 
 class Cache(ABC):
@@ -24,3 +24,12 @@ class Cache(ABC):
     async def clear(self):
         """Clear all cache"""
         pass
+
+    async def get_or_set(self, key: str, factory: Callable[[], Awaitable[Any]],
+                         ttl: int = None) -> Any:
+        """Get value, computing and storing it on miss"""
+        value = await self.get(key)
+        if value is None:
+            value = await factory()
+            await self.set(key, value, ttl)
+        return value
@@ -0,0 +1,221 @@
+import asyncio
+import heapq
+import sys
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Any, Callable, Awaitable, Dict, List, Tuple
+from .Cache import Cache
+
+
+@dataclass
+class CacheStats:
+    """Cache counters snapshot"""
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+
+_LEAVES = (str, bytes, bytearray, int, float, complex, bool, type(None))
+
+
+def deep_sizeof(value: Any) -> int:
+    """Approximate size in bytes of value and everything it references
+    
+    Follows containers, instance __dict__ and __slots__; objects shared
+    within value are counted once.
+    """
+    seen = set()
+    stack = [value]
+    size = 0
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        size += sys.getsizeof(item)
+        if isinstance(item, _LEAVES):
+            continue
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+        if hasattr(item, "__dict__") and not isinstance(item, type):
+            stack.append(vars(item))
+        for klass in type(item).__mro__:
+            for name in klass.__dict__.get("__slots__", ()):
+                if hasattr(item, name) and name not in ("__dict__", "__weakref__"):
+                    stack.append(getattr(item, name))
+    return size
+
+
+@dataclass
+class _Entry:
+    value: Any
+    expires_at: Optional[float]
+    size: int
+
+
+class MemoryCache(Cache):
+    """In-process LRU cache with per-key TTL
+
+    Bounded by entry count and, when max_bytes is set, by approximate size
+    in bytes as measured by sizeof (deep_sizeof by default, which walks
+    the whole value). Expired keys are dropped lazily on read and
+    periodically by purge_expired(), which start() schedules.
+    """
+    
+    def __init__(self, max_entries: int = 10000, max_bytes: int = None,
+                 default_ttl: int = None, cleanup_interval: float = 60.0,
+                 sizeof: Callable[[Any], int] = deep_sizeof):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self.default_ttl = default_ttl
+        self.cleanup_interval = cleanup_interval
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._expiry: List[Tuple[float, str]] = []
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._bytes = 0
+        self._stats = CacheStats()
+        self._cleanup_task: Optional[asyncio.Task] = None
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Get value"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self._stats.misses += 1
+            return None
+        if entry.expires_at is not None and entry.expires_at <= time.monotonic():
+            self._remove(key)
+            self._stats.expirations += 1
+            self._stats.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self._stats.hits += 1
+        return entry.value
+
+    async def set(self, key: str, value: Any, ttl: int = None):
+        """Set value with optional TTL (seconds)"""
+        ttl = ttl if ttl is not None else self.default_ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        if key in self._entries:
+            self._remove(key)
+        size = sys.getsizeof(key) + self.sizeof(value) if self.max_bytes is not None else 0
+        entry = _Entry(value, expires_at, size)
+        self._entries[key] = entry
+        self._bytes += entry.size
+        if expires_at is not None:
+            heapq.heappush(self._expiry, (expires_at, key))
+        self._evict()
+
+    async def delete(self, key: str):
+        """Delete key"""
+        if key in self._entries:
+            self._remove(key)
+
+    async def clear(self):
+        """Clear all cache"""
+        self._entries.clear()
+        self._expiry.clear()
+        self._bytes = 0
+
+    async def get_or_set(self, key: str, factory: Callable[[], Awaitable[Any]],
+                         ttl: int = None) -> Any:
+        """Get value; concurrent misses on the same key share one factory call"""
+        value = await self.get(key)
+        if value is not None:
+            return value
+        pending = self._inflight.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await factory()
+            await self.set(key, value, ttl)
+            future.set_result(value)
+            return value
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()
+            raise
+        finally:
+            if not future.done():
+                future.cancel()
+            del self._inflight[key]
+
+    def purge_expired(self) -> int:
+        """Drop expired entries, returning how many were removed"""
+        now = time.monotonic()
+        removed = 0
+        while self._expiry and self._expiry[0][0] <= now:
+            expires_at, key = heapq.heappop(self._expiry)
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at == expires_at:
+                self._remove(key)
+                removed += 1
+        self._stats.expirations += removed
+        return removed
+
+    def start(self):
+        """Start periodic expiry (requires a running event loop)"""
+        if self._cleanup_task is None:
+            self._cleanup_task = asyncio.create_task(self._cleanup_loop())
+
+    async def stop(self):
+        """Stop periodic expiry"""
+        if self._cleanup_task is None:
+            return
+        self._cleanup_task.cancel()
+        await asyncio.gather(self._cleanup_task, return_exceptions=True)
+        self._cleanup_task = None
+
+    @property
+    def stats(self) -> CacheStats:
+        """Current counters"""
+        return CacheStats(
+            hits=self._stats.hits,
+            misses=self._stats.misses,
+            evictions=self._stats.evictions,
+            expirations=self._stats.expirations,
+            entries=len(self._entries),
+            bytes=self._bytes
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def _cleanup_loop(self):
+        while True:
+            await asyncio.sleep(self.cleanup_interval)
+            self.purge_expired()
+
+    def _remove(self, key: str):
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+    def _over_limit(self) -> bool:
+        if len(self._entries) > self.max_entries:
+            return True
+        return self.max_bytes is not None and self._bytes > self.max_bytes
+
+    def _evict(self):
+        while self._entries and self._over_limit():
+            key, entry = self._entries.popitem(last=False)
+            self._bytes -= entry.size
+            self._stats.evictions += 1
+        if len(self._expiry) > 2 * self.max_entries:
+            self._compact_expiry()
+
+    def _compact_expiry(self):
+        self._expiry = [
+            (entry.expires_at, key) for key, entry in self._entries.items()
+            if entry.expires_at is not None
+        ]
+        heapq.heapify(self._expiry)
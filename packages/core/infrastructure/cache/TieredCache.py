@@ -0,0 +1,77 @@
+from typing import Optional, Any
+from uuid import uuid4
+from .Cache import Cache
+from .MemoryCache import MemoryCache
+from ..messaging.MessageBroker import MessageBroker
+
+
+class TieredCache(Cache):
+    """Two-tier cache: per-process L1 in front of a shared L2
+
+    Writes go to both tiers and broadcast an invalidation on the broker
+    topic so other processes drop their L1 copy. L1 entries also expire
+    after l1_ttl to bound staleness if an invalidation is missed. Every
+    write or invalidation bumps an epoch, and a get skips the L1 fill when
+    the epoch moved while it was reading L2.
+    """
+    
+    def __init__(self, l2: Cache, broker: MessageBroker, l1: Cache = None,
+                 topic: str = "cache.invalidate", l1_ttl: int = 30):
+        self.l1 = l1 or MemoryCache(max_entries=1000)
+        self.l2 = l2
+        self.broker = broker
+        self.topic = topic
+        self.l1_ttl = l1_ttl
+        self._origin = str(uuid4())
+        self._epoch = 0
+
+    async def start(self):
+        """Subscribe to invalidation topic"""
+        await self.broker.subscribe(self.topic, self._on_invalidate)
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Get value from L1, falling back to L2"""
+        value = await self.l1.get(key)
+        if value is not None:
+            return value
+        epoch = self._epoch
+        value = await self.l2.get(key)
+        if value is not None and epoch == self._epoch:
+            await self.l1.set(key, value, self._l1_ttl(None))
+        return value
+
+    async def set(self, key: str, value: Any, ttl: int = None):
+        """Set value on both tiers and invalidate other L1s"""
+        self._epoch += 1
+        await self.l2.set(key, value, ttl)
+        await self.l1.set(key, value, self._l1_ttl(ttl))
+        await self._broadcast({"key": key})
+
+    async def delete(self, key: str):
+        """Delete key on both tiers and invalidate other L1s"""
+        self._epoch += 1
+        await self.l2.delete(key)
+        await self.l1.delete(key)
+        await self._broadcast({"key": key})
+
+    async def clear(self):
+        """Clear both tiers and every L1"""
+        self._epoch += 1
+        await self.l2.clear()
+        await self.l1.clear()
+        await self._broadcast({"clear": True})
+
+    def _l1_ttl(self, ttl: Optional[int]) -> int:
+        return self.l1_ttl if ttl is None else min(ttl, self.l1_ttl)
+
+    async def _broadcast(self, message: dict):
+        await self.broker.publish(self.topic, {**message, "origin": self._origin})
+
+    async def _on_invalidate(self, message: dict):
+        if message.get("origin") == self._origin:
+            return
+        self._epoch += 1
+        if message.get("clear"):
+            await self.l1.clear()
+            return
+        await self.l1.delete(message["key"])
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Any, AsyncIterator, Iterable, List
 
 
 class Connection(ABC):
@@ -18,3 +19,30 @@ class Connection(ABC):
     async def execute(self, query: str, params: dict = None):
         """Execute query"""
         pass
+
+    async def execute_many(self, query: str, params_list: Iterable[dict]):
+        """Execute query once per parameter set
+        
+        Drivers should override with a single pipelined/batched round trip;
+        the default falls back to one execute per parameter set.
+        """
+        for params in params_list:
+            await self.execute(query, params)
+
+    async def stream(self, query: str, params: dict = None,
+                     chunk_size: int = 1000) -> AsyncIterator[List[Any]]:
+        """Yield result rows in chunks of up to chunk_size
+        
+        Drivers should override with a server-side cursor; the default
+        slices the full result returned by execute.
+        """
+        rows = await self.execute(query, params) or []
+        for start in range(0, len(rows), chunk_size):
+            yield rows[start:start + chunk_size]
+
+    async def iter_rows(self, query: str, params: dict = None,
+                        chunk_size: int = 1000) -> AsyncIterator[Any]:
+        """Yield result rows one at a time, fetched in chunks"""
+        async for chunk in self.stream(query, params, chunk_size):
+            for row in chunk:
+                yield row
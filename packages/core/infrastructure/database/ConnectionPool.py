@@ -0,0 +1,222 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Deque, Dict, List, Optional, Tuple, Type
+from .Connection import Connection
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class PoolStats:
+    """Connection pool counters snapshot"""
+    size: int = 0
+    max_size: int = 0
+    in_use: int = 0
+    idle: int = 0
+    waiting: int = 0
+    acquired: int = 0
+    timeouts: int = 0
+    created: int = 0
+    closed: int = 0
+    wait_seconds: float = 0.0
+
+
+@dataclass
+class Lease:
+    """Connection checked out from the pool"""
+    connection: Connection
+    acquired_at: float
+    owner: str
+
+
+async def _ping(connection: Connection) -> bool:
+    await connection.execute("SELECT 1")
+    return True
+
+
+class ConnectionPool:
+    """Async pool over any Connection factory
+
+    Keeps between min_size and max_size connections. Idle connections
+    beyond min_size are closed after max_idle seconds, and idle ones are
+    health checked every health_check_interval seconds. connection() only
+    discards a connection when its block raises one of discard_on (the
+    driver's connection-level errors); any other error returns it to the pool.
+    """
+    
+    def __init__(self, factory: Callable[[], Connection], min_size: int = 1,
+                 max_size: int = 10, acquire_timeout: float = 30.0,
+                 max_idle: float = 300.0, health_check_interval: float = 30.0,
+                 health_check: Callable[[Connection], Awaitable[bool]] = _ping,
+                 discard_on: Tuple[Type[BaseException], ...] = (OSError, asyncio.CancelledError)):
+        self.factory = factory
+        self.min_size = min_size
+        self.max_size = max_size
+        self.acquire_timeout = acquire_timeout
+        self.max_idle = max_idle
+        self.health_check_interval = health_check_interval
+        self.health_check = health_check
+        self.discard_on = discard_on
+        self._idle: Deque[Tuple[Connection, float]] = deque()
+        self._leases: Dict[int, Lease] = {}
+        self._slots = asyncio.Semaphore(max_size)
+        self._size = 0
+        self._stats = PoolStats(max_size=max_size)
+        self._maintenance: Optional[asyncio.Task] = None
+        self._closed = False
+
+    async def open(self):
+        """Create min_size connections and start background maintenance"""
+        self._closed = False
+        await self._fill()
+        if self._maintenance is None:
+            self._maintenance = asyncio.create_task(self._maintain())
+
+    async def close(self):
+        """Stop maintenance and close idle connections; leased ones close on release"""
+        self._closed = True
+        if self._maintenance is not None:
+            self._maintenance.cancel()
+            await asyncio.gather(self._maintenance, return_exceptions=True)
+            self._maintenance = None
+        while self._idle:
+            connection, _ = self._idle.pop()
+            await self._discard(connection)
+
+    async def acquire(self, timeout: float = None) -> Connection:
+        """Lease a connection, waiting up to timeout for a free slot"""
+        if self._closed:
+            raise RuntimeError("Connection pool is closed")
+        timeout = timeout if timeout is not None else self.acquire_timeout
+        start = time.monotonic()
+        self._stats.waiting += 1
+        try:
+            await asyncio.wait_for(self._slots.acquire(), timeout)
+        except asyncio.TimeoutError:
+            self._stats.timeouts += 1
+            raise TimeoutError(f"Timed out after {timeout}s acquiring connection")
+        finally:
+            self._stats.waiting -= 1
+            self._stats.wait_seconds += time.monotonic() - start
+
+        try:
+            connection = self._idle.pop()[0] if self._idle else await self._create()
+        except BaseException:
+            self._slots.release()
+            raise
+        task = asyncio.current_task()
+        self._leases[id(connection)] = Lease(connection, time.monotonic(), task.get_name() if task else "")
+        self._stats.acquired += 1
+        return connection
+
+    async def release(self, connection: Connection, discard: bool = False):
+        """Return a leased connection (discard=True closes it instead)"""
+        if self._leases.pop(id(connection), None) is None:
+            raise ValueError("Connection is not leased from this pool")
+        try:
+            if discard or self._closed:
+                await self._discard(connection)
+            else:
+                self._idle.append((connection, time.monotonic()))
+        finally:
+            self._slots.release()
+
+    @asynccontextmanager
+    async def connection(self, timeout: float = None):
+        """Lease a connection for the duration of the block"""
+        connection = await self.acquire(timeout)
+        try:
+            yield connection
+        except BaseException as e:
+            await self.release(connection, discard=isinstance(e, self.discard_on))
+            raise
+        await self.release(connection)
+
+    @property
+    def leases(self) -> List[Lease]:
+        """Currently leased connections"""
+        return list(self._leases.values())
+
+    @property
+    def stats(self) -> PoolStats:
+        """Current counters"""
+        return PoolStats(
+            size=self._size,
+            max_size=self.max_size,
+            in_use=len(self._leases),
+            idle=len(self._idle),
+            waiting=self._stats.waiting,
+            acquired=self._stats.acquired,
+            timeouts=self._stats.timeouts,
+            created=self._stats.created,
+            closed=self._stats.closed,
+            wait_seconds=self._stats.wait_seconds
+        )
+
+    async def reap_idle(self):
+        """Close connections idle longer than max_idle, keeping min_size"""
+        now = time.monotonic()
+        while self._idle and self._size > self.min_size and now - self._idle[0][1] > self.max_idle:
+            connection, _ = self._idle.popleft()
+            await self._discard(connection)
+
+    async def check_health(self):
+        """Health check idle connections, replacing broken ones
+        
+        A connection under check holds a pool slot like a lease, so
+        concurrent acquires cannot grow the pool past max_size meanwhile.
+        """
+        for _ in range(len(self._idle)):
+            if not self._idle or self._slots.locked():
+                break
+            await self._slots.acquire()
+            connection, idle_since = self._idle.popleft()
+            try:
+                if await self._healthy(connection):
+                    self._idle.append((connection, idle_since))
+                else:
+                    await self._discard(connection)
+            finally:
+                self._slots.release()
+        await self._fill()
+
+    async def _healthy(self, connection: Connection) -> bool:
+        try:
+            return await self.health_check(connection)
+        except Exception:
+            return False
+
+    async def _maintain(self):
+        while True:
+            await asyncio.sleep(self.health_check_interval)
+            try:
+                await self.reap_idle()
+                await self.check_health()
+            except Exception:
+                logger.exception("Connection pool maintenance failed")
+
+    async def _fill(self):
+        while self._size < self.min_size:
+            self._idle.append((await self._create(), time.monotonic()))
+
+    async def _create(self) -> Connection:
+        connection = self.factory()
+        self._size += 1
+        try:
+            await connection.connect()
+        except BaseException:
+            self._size -= 1
+            raise
+        self._stats.created += 1
+        return connection
+
+    async def _discard(self, connection: Connection):
+        self._size -= 1
+        self._stats.closed += 1
+        try:
+            await connection.disconnect()
+        except Exception:
+            pass
@@ -0,0 +1,127 @@
+import heapq
+from bisect import bisect_right
+from typing import Any, AsyncIterator, Dict, Hashable, Iterable, List, Optional, Set, Tuple, TypeVar
+from uuid import UUID
+from ...domain.Repository import Repository
+
+T = TypeVar('T')
+
+
+class InMemoryRepository(Repository[T]):
+    """Reference in-memory repository
+    
+    Entities are stored by id. Writes only record added and removed ids;
+    the sorted id list used for keyset pagination is brought up to date
+    on the next page read by merging the sorted additions in, so writes
+    are O(1) and bulk loads O(n log n) overall.
+    Attributes named in indexed_by get hash indexes queried by find_by.
+    """
+    
+    def __init__(self, indexed_by: Iterable[str] = ()):
+        self._entities: Dict[UUID, T] = {}
+        self._ids: List[UUID] = []
+        self._added: Set[UUID] = set()
+        self._removed: Set[UUID] = set()
+        self._indexes: Dict[str, Dict[Hashable, Dict[UUID, T]]] = {
+            attribute: {} for attribute in indexed_by
+        }
+        self._indexed_values: Dict[UUID, Tuple[Any, ...]] = {}
+
+    async def save(self, entity: T) -> T:
+        """Save entity"""
+        self._store(entity)
+        return entity
+
+    async def find_by_id(self, id: UUID) -> Optional[T]:
+        """Find by ID"""
+        return self._entities.get(id)
+
+    async def find_all(self) -> List[T]:
+        """Find all entities"""
+        return list(self._entities.values())
+
+    async def delete(self, id: UUID) -> None:
+        """Delete entity"""
+        self._remove(id)
+
+    async def save_many(self, entities: Iterable[T]) -> List[T]:
+        """Save entities"""
+        entities = list(entities)
+        for entity in entities:
+            self._store(entity)
+        return entities
+
+    async def find_by_ids(self, ids: Iterable[UUID]) -> List[T]:
+        """Find entities by IDs, skipping missing ones"""
+        get = self._entities.get
+        return [entity for entity in map(get, ids) if entity is not None]
+
+    async def delete_many(self, ids: Iterable[UUID]) -> None:
+        """Delete entities"""
+        for id in ids:
+            self._remove(id)
+
+    async def find_page(self, after: Optional[UUID] = None, limit: int = 1000) -> List[T]:
+        """Find up to limit entities ordered by ID, with ID greater than after"""
+        ids = self._sorted_ids()
+        start = 0 if after is None else bisect_right(ids, after)
+        return [self._entities[id] for id in ids[start:start + limit]]
+
+    async def stream_all(self, batch_size: int = 1000) -> AsyncIterator[T]:
+        """Iterate all entities ordered by ID, page by page"""
+        async for entity in self.keyset_stream(batch_size):
+            yield entity
+
+    async def find_by(self, attribute: str, value: Hashable) -> List[T]:
+        """Find entities by an indexed attribute value"""
+        if attribute not in self._indexes:
+            raise KeyError(f"Attribute not indexed: {attribute}")
+        return list(self._indexes[attribute].get(value, {}).values())
+
+    async def count(self) -> int:
+        """Number of stored entities"""
+        return len(self._entities)
+
+    def _store(self, entity: T):
+        id = entity.id
+        if id in self._entities:
+            self._unindex(id)
+        elif id in self._removed:
+            self._removed.discard(id)
+        else:
+            self._added.add(id)
+        self._entities[id] = entity
+        self._index(entity)
+
+    def _remove(self, id: UUID):
+        if self._entities.pop(id, None) is None:
+            return
+        self._unindex(id)
+        if id in self._added:
+            self._added.discard(id)
+        else:
+            self._removed.add(id)
+
+    def _sorted_ids(self) -> List[UUID]:
+        if self._removed:
+            removed = self._removed
+            self._ids = [id for id in self._ids if id not in removed]
+            self._removed = set()
+        if self._added:
+            self._ids = list(heapq.merge(self._ids, sorted(self._added)))
+            self._added = set()
+        return self._ids
+
+    def _index(self, entity: T):
+        values = tuple(getattr(entity, attribute, None) for attribute in self._indexes)
+        for (attribute, index), value in zip(self._indexes.items(), values):
+            index.setdefault(value, {})[entity.id] = entity
+        self._indexed_values[entity.id] = values
+
+    def _unindex(self, id: UUID):
+        values = self._indexed_values.pop(id)
+        for (attribute, index), value in zip(self._indexes.items(), values):
+            bucket = index[value]
+            del bucket[id]
+            if not bucket:
+                del index[value]
@@ -0,0 +1,113 @@
+from abc import abstractmethod
+from datetime import datetime
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+from uuid import UUID
+from .UnitOfWork import UnitOfWork
+from ...domain.AggregateRoot import AggregateRoot
+from ...domain.Entity import Entity
+from ...domain.Repository import Repository
+
+if TYPE_CHECKING:
+    from ...application.EventBus import EventBus
+
+
+class TrackingUnitOfWork(UnitOfWork):
+    """Unit of Work with identity map and dirty tracking
+    
+    Entities loaded through find() are cached by id for the transaction.
+    An entity is dirty when _touch() replaced its updated_at after it was
+    loaded. commit() saves new and dirty entities with one save_many per
+    repository, deletes removed ones, commits the transaction and then
+    publishes the collected aggregate events in bulk. Aggregates keep their
+    events until the transaction commits, so a failed commit loses nothing;
+    the context manager rolls back on a failed commit.
+    """
+    
+    def __init__(self, event_bus: "EventBus" = None):
+        self.event_bus = event_bus
+        self._identity_map: Dict[UUID, Tuple[Entity, Repository, Optional[datetime]]] = {}
+        self._removed: Dict[UUID, Tuple[Entity, Repository]] = {}
+
+    @abstractmethod
+    async def _commit_transaction(self):
+        """Commit the underlying transaction"""
+        pass
+
+    @abstractmethod
+    async def _rollback_transaction(self):
+        """Rollback the underlying transaction"""
+        pass
+
+    async def find(self, repository: Repository, id: UUID) -> Optional[Entity]:
+        """Find by ID, served from the identity map when already loaded"""
+        if id in self._removed:
+            return None
+        tracked = self._identity_map.get(id)
+        if tracked is not None:
+            return tracked[0]
+        entity = await repository.find_by_id(id)
+        if entity is not None:
+            self._identity_map[id] = (entity, repository, entity.updated_at)
+        return entity
+
+    def add(self, repository: Repository, entity: Entity):
+        """Track new entity to be saved on commit"""
+        self._removed.pop(entity.id, None)
+        self._identity_map[entity.id] = (entity, repository, None)
+
+    def remove(self, repository: Repository, entity: Entity):
+        """Track entity to be deleted on commit"""
+        self._identity_map.pop(entity.id, None)
+        self._removed[entity.id] = (entity, repository)
+
+    @property
+    def dirty(self) -> List[Entity]:
+        """New entities and loaded entities touched since loading"""
+        # Identity check: _touch() always assigns a new datetime object
+        return [
+            entity for entity, _, loaded_at in self._identity_map.values()
+            if entity.updated_at is not loaded_at
+        ]
+
+    async def commit(self):
+        """Flush changes in batches, commit and publish domain events"""
+        for repository, entities in self._group_dirty().items():
+            await repository.save_many(entities)
+        for repository, ids in self._group_removed().items():
+            await repository.delete_many(ids)
+        aggregates = self._aggregates()
+        events = [event for aggregate in aggregates for event in aggregate.domain_events]
+        await self._commit_transaction()
+        for aggregate in aggregates:
+            aggregate.clear_domain_events()
+        self._reset()
+        if self.event_bus is not None and events:
+            await self.event_bus.publish_many(events)
+
+    async def rollback(self):
+        """Rollback and discard tracked state"""
+        await self._rollback_transaction()
+        self._reset()
+
+    def _group_dirty(self) -> Dict[Repository, List[Entity]]:
+        groups: Dict[Repository, List[Entity]] = {}
+        for entity, repository, loaded_at in self._identity_map.values():
+            if entity.updated_at is not loaded_at:
+                groups.setdefault(repository, []).append(entity)
+        return groups
+
+    def _group_removed(self) -> Dict[Repository, List[UUID]]:
+        groups: Dict[Repository, List[UUID]] = {}
+        for id, (_, repository) in self._removed.items():
+            groups.setdefault(repository, []).append(id)
+        return groups
+
+    def _aggregates(self) -> List[AggregateRoot]:
+        return [
+            entity for entity, _, _ in self._identity_map.values()
+            if isinstance(entity, AggregateRoot)
+        ]
+
+    def _reset(self):
+        self._identity_map.clear()
+        self._removed.clear()
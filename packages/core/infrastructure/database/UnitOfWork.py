@@ -21,5 +21,9 @@ class UnitOfWork(ABC):
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         if exc_type:
             await self.rollback()
-        else:
+            return
+        try:
             await self.commit()
+        except BaseException:
+            await self.rollback()
+            raise
@@ -0,0 +1,29 @@
+import asyncio
+from typing import Callable, Awaitable, Dict, List
+from .MessageBroker import MessageBroker
+
+
+class MemoryBroker(MessageBroker):
+    """In-process message broker for local development and tests"""
+    
+    def __init__(self):
+        self._subscribers: Dict[str, List[Callable[[dict], Awaitable[None]]]] = {}
+        self.connected = False
+
+    async def publish(self, topic: str, message: dict):
+        """Deliver message to every subscriber of topic"""
+        handlers = self._subscribers.get(topic, [])
+        await asyncio.gather(*(handler(message) for handler in handlers))
+
+    async def subscribe(self, topic: str, handler: Callable[[dict], Awaitable[None]]):
+        """Subscribe to topic"""
+        self._subscribers.setdefault(topic, []).append(handler)
+
+    async def connect(self):
+        """Connect (no-op)"""
+        self.connected = True
+
+    async def disconnect(self):
+        """Disconnect and drop subscribers"""
+        self.connected = False
+        self._subscribers.clear()
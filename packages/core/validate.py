@@ -85,6 +85,150 @@ def test_value_object():
         return False
 
 
+def test_slotted_domain_objects():
+    """Test slotted Entity subclasses and SlottedValueObject"""
+    print("\n[TEST] Testing slotted domain objects...")
+    
+    try:
+        from core import Entity, SlottedValueObject
+        
+        class Thumbnail(Entity):
+            __slots__ = ("url",)
+            
+            def __init__(self, id=None, url=""):
+                super().__init__(id)
+                self.url = url
+        
+        class Point(SlottedValueObject):
+            __slots__ = ("x", "y")
+            
+            def __init__(self, x: int, y: int):
+                self.x = x
+                self.y = y
+        
+        thumbnail = Thumbnail(url="a.jpg")
+        assert not hasattr(thumbnail, "__dict__")
+        assert thumbnail.id == thumbnail.id
+        assert thumbnail.id.version == 4
+        assert thumbnail.created_at == thumbnail.updated_at
+        
+        assert Point(1, 2) == Point(1, 2)
+        assert Point(1, 2) != Point(2, 1)
+        assert hash(Point(1, 2)) == hash(Point(1, 2))
+        assert not hasattr(Point(1, 2), "__dict__")
+        
+        try:
+            class Money(SlottedValueObject):
+                def __init__(self, amount):
+                    self.amount = amount
+            assert False, "subclass without __slots__ accepted"
+        except TypeError:
+            pass
+        
+        class Loose:
+            pass
+        
+        class Tagged(Point, Loose):
+            __slots__ = ()
+            
+            def __init__(self, x: int, y: int, tag: str):
+                super().__init__(x, y)
+                self.tag = tag
+        
+        assert Tagged(1, 2, "a") == Tagged(1, 2, "a")
+        assert Tagged(1, 2, "a") != Tagged(1, 2, "b")
+        assert hash(Tagged(1, 2, "a")) == hash(Tagged(1, 2, "a"))
+        
+        print("[OK] Slotted domain objects work")
+        return True
+    except Exception as e:
+        print(f"[FAIL] Slotted domain objects failed: {e}")
+        return False
+
+
+def test_new_id_threads():
+    """Test new_id uniqueness across threads"""
+    print("\n[TEST] Testing new_id across threads...")
+    
+    try:
+        from core.domain.Identity import new_id
+        import threading
+        
+        results = []
+        
+        def generate():
+            results.append([new_id() for _ in range(20000)])
+        
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            threads = [threading.Thread(target=generate) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(interval)
+        
+        ids = [id for batch in results for id in batch]
+        assert len(ids) == 160000
+        assert len(set(ids)) == len(ids)
+        assert all(id.version == 4 for id in ids[:1000])
+        
+        print("[OK] new_id is unique across threads")
+        return True
+    except Exception as e:
+        print(f"[FAIL] new_id across threads failed: {e}")
+        return False
+
+
+def test_entity_columns():
+    """Test EntityColumns storage, filtering and materialization"""
+    print("\n[TEST] Testing EntityColumns...")
+    
+    try:
+        from core import Entity, EntityColumns
+        
+        class Thumbnail(Entity):
+            def __init__(self, id=None, timestamp: float = 0.0, url: str = ""):
+                super().__init__(id)
+                self.timestamp = timestamp
+                self.url = url
+        
+        columns = {"timestamp": "d", "url": EntityColumns.OBJECT}
+        thumbnails = [Thumbnail(timestamp=i, url=f"{i}.jpg") for i in range(10)]
+        thumbnails[0]._touch()
+        collection = EntityColumns.from_entities(Thumbnail, columns, thumbnails)
+        
+        assert len(collection) == 10
+        late = collection.where(lambda ts: ts >= 5, "timestamp").sort_by("timestamp", reverse=True)
+        assert [t.url for t in late] == [f"{i}.jpg" for i in range(9, 4, -1)]
+        
+        first = collection[0]
+        assert isinstance(first, Thumbnail)
+        assert first.id == thumbnails[0].id
+        assert first.created_at == thumbnails[0].created_at
+        assert first.updated_at == thumbnails[0].updated_at != first.created_at
+        assert collection.take([0])[0].updated_at == thumbnails[0].updated_at
+        
+        rows = EntityColumns(Thumbnail, {"timestamp": "d", "frames": "q"})
+        rows.append(timestamp=1.0, frames=3)
+        for bad in ({"timestamp": 2.0}, {"timestamp": "x", "frames": 1}, {"timestamp": 2.0, "frames": 2 ** 70}):
+            try:
+                rows.append(**bad)
+                assert False, f"accepted {bad}"
+            except (TypeError, ValueError, OverflowError):
+                pass
+        assert len(rows) == 1 and len(rows.column("frames")) == 1 and len(rows._ids) == 16
+        assert rows[0].timestamp == 1.0
+        
+        print("[OK] EntityColumns works")
+        return True
+    except Exception as e:
+        print(f"[FAIL] EntityColumns failed: {e}")
+        return False
+
+
 def test_use_case():
     """Test UseCase"""
     print("\n[TEST] Testing UseCase...")
@@ -169,6 +313,672 @@ def test_event_bus():
         return False
 
 
+def test_event_bus_dispatch():
+    """Test EventBus subclass routing, concurrency and isolation"""
+    print("\n[TEST] Testing EventBus dispatch...")
+    
+    try:
+        from core import EventBus, DomainEvent, DispatchPolicy
+        import asyncio
+        import time
+        
+        class BaseEvent(DomainEvent):
+            pass
+        
+        class ChildEvent(BaseEvent):
+            pass
+        
+        errors = []
+        bus = EventBus(on_error=lambda event, handler, error: errors.append(error))
+        bus.configure(BaseEvent, DispatchPolicy(timeout=0.5))
+        received = []
+        
+        async def slow(event):
+            await asyncio.sleep(0.05)
+            received.append("slow")
+        
+        async def failing(event):
+            raise RuntimeError("boom")
+        
+        async def hanging(event):
+            await asyncio.sleep(10)
+        
+        def raising_on_call(event):
+            raise ValueError("not a coroutine")
+        
+        async def wrong_arity():
+            pass
+        
+        bus.subscribe(BaseEvent, slow)
+        bus.subscribe(ChildEvent, slow)
+        bus.subscribe(ChildEvent, failing)
+        bus.subscribe(ChildEvent, hanging, timeout=0.05)
+        bus.subscribe(ChildEvent, raising_on_call)
+        bus.subscribe(ChildEvent, wrong_arity)
+        
+        start = time.perf_counter()
+        asyncio.run(bus.publish(ChildEvent()))
+        elapsed = time.perf_counter() - start
+        
+        assert received == ["slow", "slow"]
+        assert len(errors) == 4
+        assert elapsed < 0.2
+        
+        class LimitedEvent(DomainEvent):
+            pass
+        
+        limited = EventBus()
+        limited.configure(LimitedEvent, DispatchPolicy(max_concurrency=1))
+        running = []
+        peak = []
+        
+        async def tracked(event):
+            running.append(event)
+            peak.append(len(running))
+            await asyncio.sleep(0.01)
+            running.remove(event)
+        
+        for _ in range(3):
+            limited.subscribe(LimitedEvent, tracked)
+        
+        async def publish_concurrently():
+            await asyncio.gather(*(limited.publish(LimitedEvent()) for _ in range(5)))
+        
+        asyncio.run(publish_concurrently())
+        asyncio.run(publish_concurrently())
+        assert len(peak) == 30 and max(peak) == 1
+        
+        print("[OK] EventBus dispatch works")
+        return True
+    except Exception as e:
+        print(f"[FAIL] EventBus dispatch failed: {e}")
+        return False
+
+
+def test_event_bus_queue():
+    """Test EventBus batched publish and queued mode"""
+    print("\n[TEST] Testing EventBus queue...")
+    
+    try:
+        from core import EventBus, DomainEvent
+        import asyncio
+        import logging
+        
+        class TestEvent(DomainEvent):
+            pass
+        
+        bus = EventBus(queue_size=10, workers=2)
+        single = []
+        batches = []
+        
+        async def handler(event):
+            single.append(event)
+        
+        async def batch_handler(events):
+            batches.append(len(events))
+        
+        bus.subscribe(TestEvent, handler)
+        bus.subscribe_batch(TestEvent, batch_handler)
+        
+        async def run():
+            await bus.publish_many([TestEvent() for _ in range(5)])
+            await bus.enqueue_many([TestEvent() for _ in range(50)])
+            await bus.stop()
+        
+        asyncio.run(run())
+        
+        assert len(single) == 55
+        assert batches[0] == 5
+        assert sum(batches) == 55
+        
+        class OtherEvent(DomainEvent):
+            pass
+        
+        ordered = EventBus()
+        seen = []
+        grouped = []
+        
+        async def record(event):
+            seen.append(type(event).__name__)
+        
+        async def record_batch(events):
+            grouped.append([type(event).__name__ for event in events])
+        
+        ordered.subscribe(DomainEvent, record)
+        ordered.subscribe_batch(DomainEvent, record_batch)
+        asyncio.run(ordered.publish_many([TestEvent(), OtherEvent(), TestEvent(), OtherEvent()]))
+        assert seen == ["TestEvent", "OtherEvent", "TestEvent", "OtherEvent"]
+        assert sorted(grouped) == [["OtherEvent"] * 2, ["TestEvent"] * 2]
+        
+        def broken_on_error(event, handler, error):
+            raise RuntimeError("on_error failed")
+        
+        async def failing(event):
+            raise RuntimeError("boom")
+        
+        fragile = EventBus(on_error=broken_on_error, workers=1)
+        fragile.subscribe(TestEvent, failing)
+        fragile.subscribe(TestEvent, handler)
+        
+        async def survive():
+            await fragile.enqueue_many([TestEvent() for _ in range(3)])
+            await fragile.flush()
+            await fragile.enqueue(TestEvent())
+            await asyncio.wait_for(fragile.stop(), 1)
+        
+        logging.getLogger("core.application.EventBus").disabled = True
+        try:
+            asyncio.run(survive())
+        finally:
+            logging.getLogger("core.application.EventBus").disabled = False
+        assert len(single) == 59
+        
+        print("[OK] EventBus queue works")
+        return True
+    except Exception as e:
+        print(f"[FAIL] EventBus queue failed: {e}")
+        return False
+
+
+def test_memory_cache():
+    """Test MemoryCache eviction, TTL and single-flight"""
+    print("\n[TEST] Testing MemoryCache...")
+    
+    try:
+        from core import MemoryCache
+        import asyncio
+        
+        async def run():
+            cache = MemoryCache(max_entries=2)
+            await cache.set("a", 1)
+            await cache.set("b", 2)
+            await cache.get("a")
+            await cache.set("c", 3)
+            assert await cache.get("b") is None
+            assert await cache.get("a") == 1
+            
+            await cache.set("t", 1, ttl=0)
+            assert await cache.get("t") is None
+            
+            calls = []
+            
+            async def compute():
+                calls.append(1)
+                await asyncio.sleep(0.01)
+                return "value"
+            
+            values = await asyncio.gather(*(cache.get_or_set("k", compute) for _ in range(5)))
+            assert values == ["value"] * 5
+            assert len(calls) == 1
+            assert cache.stats.evictions >= 1
+            
+            bounded = MemoryCache(max_bytes=15000)
+            await bounded.set("rows", [{"name": str(i) * 1000} for i in range(5)])
+            assert 5000 < bounded.stats.bytes < 15000
+            await bounded.set("more", [{"name": str(i) * 1000} for i in range(10)])
+            assert await bounded.get("rows") is None and bounded.stats.bytes <= 15000
+            
+            counted = MemoryCache(max_bytes=2, sizeof=len)
+            await counted.set("a", [1, 2, 3])
+            assert len(counted) == 0
+        
+        asyncio.run(run())
+        
+        print("[OK] MemoryCache works")
+        return True
+    except Exception as e:
+        print(f"[FAIL] MemoryCache failed: {e}")
+        return False
+
+
+def test_tiered_cache():
+    """Test TieredCache invalidation across L1s"""
+    print("\n[TEST] Testing TieredCache...")
+    
+    try:
+        from core import TieredCache, MemoryCache, MemoryBroker
+        import asyncio
+        
+        async def run():
+            broker = MemoryBroker()
+            shared = MemoryCache()
+            worker_a = TieredCache(shared, broker)
+            worker_b = TieredCache(shared, broker)
+            await worker_a.start()
+            await worker_b.start()
+            
+            await worker_a.set("k", 1)
+            assert await worker_b.get("k") == 1
+            await worker_a.set("k", 2)
+            assert await worker_b.l1.get("k") is None
+            assert await worker_b.get("k") == 2
+        
+        class SlowCache(MemoryCache):
+            async def get(self, key):
+                value = await super().get(key)
+                self.reading.set()
+                await self.resume.wait()
+                return value
+        
+        async def invalidated_during_l2_read():
+            broker = MemoryBroker()
+            shared = SlowCache()
+            shared.reading, shared.resume = asyncio.Event(), asyncio.Event()
+            writer = TieredCache(MemoryCache(), broker)
+            reader = TieredCache(shared, broker)
+            await writer.start()
+            await reader.start()
+            await shared.set("k", 1)
+            
+            pending = asyncio.create_task(reader.get("k"))
+            await shared.reading.wait()
+            await writer.set("k", 2)
+            shared.resume.set()
+            assert await pending == 1
+            assert await reader.l1.get("k") is None
+        
+        asyncio.run(run())
+        asyncio.run(invalidated_during_l2_read())
+        
+        print("[OK] TieredCache works")
+        return True
+    except Exception as e:
+        print(f"[FAIL] TieredCache failed: {e}")
+        return False
+
+
+def test_cached_use_case():
+    """Test cached_use_case memoization and invalidation"""
+    print("\n[TEST] Testing cached_use_case...")
+    
+    try:
+        from core import UseCase, DTO, Result, MemoryCache, EventBus, DomainEvent, cached_use_case
+        from dataclasses import dataclass
+        import asyncio
+        
+        @dataclass
+        class Request(DTO):
+            value: int
+        
+        class Changed(DomainEvent):
+            pass
+        
+        bus = EventBus()
+        calls = []
+        
+        @cached_use_case(MemoryCache(), ttl=60, event_bus=bus, invalidate_on=[Changed])
+        class Square(UseCase[Request, Result[int]]):
+            async def execute(self, request: Request) -> Result[int]:
+                calls.append(request.value)
+                await asyncio.sleep(0.01)
+                if request.value < 0:
+                    return Result.fail("negative")
+                return Result.ok(request.value ** 2)
+        
+        async def run():
+            use_case = Square()
+            results = await asyncio.gather(*(use_case.execute(Request(3)) for _ in range(5)))
+            assert all(r.value == 9 for r in results)
+            assert calls == [3]
+            
+            await use_case.execute(Request(-1))
+            await use_case.execute(Request(-1))
+            assert calls == [3, -1, -1]
+            
+            await bus.publish(Changed())
+            await use_case.execute(Request(3))
+            assert calls == [3, -1, -1, 3]
+        
+        asyncio.run(run())
+        
+        # Generation lives in the shared backend: another worker's
+        # invalidation is seen here and a restart does not revive old keys
+        shared = MemoryCache()
+        shared_calls = []
+        
+        def build():
+            class Double(UseCase[Request, Result[int]]):
+                async def execute(self, request: Request) -> Result[int]:
+                    shared_calls.append(request.value)
+                    return Result.ok(request.value * 2)
+            return cached_use_case(shared, ttl=60)(Double)
+        
+        async def run_shared():
+            worker_a, worker_b = build(), build()
+            await worker_a().execute(Request(2))
+            await worker_b().execute(Request(2))
+            assert shared_calls == [2]
+            await worker_b.use_case_cache.invalidate()
+            await worker_a().execute(Request(2))
+            assert shared_calls == [2, 2]
+            restarted = build()
+            await restarted().execute(Request(2))
+            assert shared_calls == [2, 2]
+            assert worker_a.use_case_cache.name.endswith("build.<locals>.Double")
+            assert worker_a.use_case_cache.name.startswith(__name__)
+        
+        asyncio.run(run_shared())
+        
+        @dataclass
+        class Other(DTO):
+            value: int
+        
+        @dataclass
+        class Tagged(DTO):
+            tags: frozenset
+        
+        cache = Square.use_case_cache
+        assert cache.key(Request(3), "g") != cache.key(Other(3), "g")
+        first = Tagged(frozenset(f"tag{i}" for i in range(50)))
+        second = Tagged(frozenset(sorted(first.tags, reverse=True)))
+        assert cache.key(first, "g") == cache.key(second, "g")
+        assert cache.key(first, "g") != cache.key(Tagged(frozenset({"tag0"})), "g")
+        
+        print("[OK] cached_use_case works")
+        return True
+    except Exception as e:
+        print(f"[FAIL] cached_use_case failed: {e}")
+        return False
+
+
+def test_connection_pool():
+    """Test ConnectionPool leasing, timeouts and reaping"""
+    print("\n[TEST] Testing ConnectionPool...")
+    
+    try:
+        from core import ConnectionPool, Connection
+        import asyncio
+        import logging
+        
+        class FakeConnection(Connection):
+            async def connect(self):
+                pass
+            
+            async def disconnect(self):
+                pass
+            
+            async def execute(self, query: str, params: dict = None):
+                return []
+        
+        async def run():
+            pool = ConnectionPool(FakeConnection, min_size=1, max_size=2,
+                                  acquire_timeout=0.05, max_idle=0)
+            await pool.open()
+            first = await pool.acquire()
+            second = await pool.acquire()
+            assert len(pool.leases) == 2
+            try:
+                await pool.acquire()
+                raise AssertionError("acquire should time out")
+            except TimeoutError:
+                pass
+            await pool.release(first)
+            await pool.release(second)
+            
+            async with pool.connection() as connection:
+                await connection.execute("SELECT 1")
+            
+            await pool.reap_idle()
+            assert pool.stats.size == 1
+            assert pool.stats.timeouts == 1
+            await pool.close()
+        
+        async def slow_check(connection):
+            await asyncio.sleep(0.05)
+            return True
+        
+        async def bounded_during_health_check():
+            pool = ConnectionPool(FakeConnection, min_size=2, max_size=2,
+                                  acquire_timeout=1, health_check=slow_check)
+            await pool.open()
+            check = asyncio.create_task(pool.check_health())
+            await asyncio.sleep(0.01)
+            leased = await asyncio.gather(pool.acquire(), pool.acquire())
+            assert pool.stats.size <= 2
+            await check
+            for connection in leased:
+                await pool.release(connection)
+            assert pool.stats.size == 2
+            await pool.close()
+        
+        async def keeps_connection_on_query_errors():
+            pool = ConnectionPool(FakeConnection, min_size=1, max_size=1)
+            await pool.open()
+            try:
+                async with pool.connection() as connection:
+                    raise ValueError("duplicate key")
+            except ValueError:
+                pass
+            async with pool.connection() as again:
+                assert again is connection
+            try:
+                async with pool.connection():
+                    raise ConnectionResetError("server closed the connection")
+            except ConnectionResetError:
+                pass
+            assert pool.stats.closed == 1 and pool.stats.idle == 0
+            async with pool.connection() as fresh:
+                assert fresh is not connection
+            await pool.close()
+        
+        asyncio.run(run())
+        asyncio.run(bounded_during_health_check())
+        asyncio.run(keeps_connection_on_query_errors())
+        
+        class FlakyConnection(FakeConnection):
+            failures = 1
+            
+            async def connect(self):
+                if FlakyConnection.failures:
+                    FlakyConnection.failures -= 1
+                    raise ConnectionError("refused")
+        
+        async def maintenance_survives_errors():
+            pool = ConnectionPool(FlakyConnection, min_size=0, max_size=2,
+                                  health_check_interval=0.01)
+            await pool.open()
+            pool.min_size = 1
+            await asyncio.sleep(0.1)
+            assert not pool._maintenance.done()
+            assert pool.stats.size == 1
+            await pool.close()
+        
+        logging.getLogger("core.infrastructure.database.ConnectionPool").disabled = True
+        try:
+            asyncio.run(maintenance_survives_errors())
+        finally:
+            logging.getLogger("core.infrastructure.database.ConnectionPool").disabled = False
+        
+        print("[OK] ConnectionPool works")
+        return True
+    except Exception as e:
+        print(f"[FAIL] ConnectionPool failed: {e}")
+        return False
+
+
+def test_connection_bulk():
+    """Test Connection execute_many and streaming defaults"""
+    print("\n[TEST] Testing Connection bulk...")
+    
+    try:
+        from core import Connection
+        import asyncio
+        
+        class FakeConnection(Connection):
+            def __init__(self):
+                self.executed = []
+            
+            async def connect(self):
+                pass
+            
+            async def disconnect(self):
+                pass
+            
+            async def execute(self, query: str, params: dict = None):
+                self.executed.append(params)
+                return list(range(25))
+        
+        async def run():
+            connection = FakeConnection()
+            await connection.execute_many("INSERT", [{"id": i} for i in range(3)])
+            assert len(connection.executed) == 3
+            
+            chunks = [chunk async for chunk in connection.stream("SELECT", chunk_size=10)]
+            assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+            rows = [row async for row in connection.iter_rows("SELECT")]
+            assert rows == list(range(25))
+        
+        asyncio.run(run())
+        
+        print("[OK] Connection bulk works")
+        return True
+    except Exception as e:
+        print(f"[FAIL] Connection bulk failed: {e}")
+        return False
+
+
+def test_in_memory_repository():
+    """Test InMemoryRepository bulk, streaming and indexes"""
+    print("\n[TEST] Testing InMemoryRepository...")
+    
+    try:
+        from core import Entity, InMemoryRepository
+        import asyncio
+        
+        class Item(Entity):
+            def __init__(self, id=None, group=""):
+                super().__init__(id)
+                self.group = group
+        
+        async def run():
+            repository = InMemoryRepository(indexed_by=["group"])
+            items = await repository.save_many(Item(group=str(i % 3)) for i in range(25))
+            
+            found = await repository.find_by_ids([items[0].id, items[1].id])
+            assert found == items[:2]
+            assert len(await repository.find_by("group", "0")) == 9
+            
+            streamed = [item async for item in repository.stream_all(batch_size=10)]
+            assert sorted(streamed, key=lambda item: item.id) == streamed
+            assert len(streamed) == 25
+            
+            items[0].group = "x"
+            await repository.save(items[0])
+            assert await repository.find_by("group", "x") == [items[0]]
+            
+            await repository.delete_many(item.id for item in items[:5])
+            assert await repository.count() == 20
+            assert await repository.find_by("group", "x") == []
+            
+            await repository.save(items[0])
+            await repository.delete(items[6].id)
+            extra = await repository.save_many(Item() for _ in range(3))
+            streamed = [item async for item in repository.stream_all(batch_size=4)]
+            expected = sorted([items[0], *items[5:6], *items[7:], *extra], key=lambda item: item.id)
+            assert streamed == expected
+        
+        asyncio.run(run())
+        
+        print("[OK] InMemoryRepository works")
+        return True
+    except Exception as e:
+        print(f"[FAIL] InMemoryRepository failed: {e}")
+        return False
+
+
+def test_tracking_unit_of_work():
+    """Test TrackingUnitOfWork identity map, dirty flush and events"""
+    print("\n[TEST] Testing TrackingUnitOfWork...")
+    
+    try:
+        from core import (
+            AggregateRoot, DomainEvent, EventBus, InMemoryRepository, TrackingUnitOfWork
+        )
+        import asyncio
+        
+        class Renamed(DomainEvent):
+            pass
+        
+        class Item(AggregateRoot):
+            def rename(self):
+                self._touch()
+                self.add_domain_event(Renamed())
+        
+        class CountingRepository(InMemoryRepository):
+            def __init__(self):
+                super().__init__()
+                self.reads = 0
+                self.saved = []
+            
+            async def find_by_id(self, id):
+                self.reads += 1
+                return await super().find_by_id(id)
+            
+            async def save_many(self, entities):
+                self.saved.append(len(list(entities)))
+                return await super().save_many(entities)
+        
+        class FakeUnitOfWork(TrackingUnitOfWork):
+            async def _commit_transaction(self):
+                pass
+            
+            async def _rollback_transaction(self):
+                pass
+        
+        async def run():
+            bus = EventBus()
+            published = []
+            
+            async def handler(events):
+                published.extend(events)
+            
+            bus.subscribe_batch(Renamed, handler)
+            repository = CountingRepository()
+            items = await repository.save_many([Item() for _ in range(3)])
+            repository.saved.clear()
+            
+            async with FakeUnitOfWork(bus) as uow:
+                first = await uow.find(repository, items[0].id)
+                assert await uow.find(repository, items[0].id) is first
+                await uow.find(repository, items[1].id)
+                first.rename()
+                uow.add(repository, Item())
+            
+            assert repository.reads == 2
+            assert repository.saved == [2]
+            assert len(published) == 1
+            
+            class FailingUnitOfWork(FakeUnitOfWork):
+                rolled_back = 0
+                
+                async def _commit_transaction(self):
+                    raise ConnectionError("commit failed")
+                
+                async def _rollback_transaction(self):
+                    FailingUnitOfWork.rolled_back += 1
+            
+            failing = FailingUnitOfWork(bus)
+            try:
+                async with failing as uow:
+                    renamed = await uow.find(repository, items[2].id)
+                    renamed.rename()
+                raise AssertionError("commit should fail")
+            except ConnectionError:
+                pass
+            assert FailingUnitOfWork.rolled_back == 1
+            assert len(renamed.domain_events) == 1
+            assert failing.dirty == []
+            assert len(published) == 1
+        
+        asyncio.run(run())
+        
+        print("[OK] TrackingUnitOfWork works")
+        return True
+    except Exception as e:
+        print(f"[FAIL] TrackingUnitOfWork failed: {e}")
+        return False
+
+
 def test_config():
     """Test Config"""
     print("\n[TEST] Testing Config...")
@@ -200,9 +1010,21 @@ def main():
         test_imports,
         test_entity,
         test_value_object,
+        test_slotted_domain_objects,
+        test_new_id_threads,
+        test_entity_columns,
         test_use_case,
         test_result,
         test_event_bus,
+        test_event_bus_dispatch,
+        test_event_bus_queue,
+        test_memory_cache,
+        test_tiered_cache,
+        test_cached_use_case,
+        test_connection_pool,
+        test_connection_bulk,
+        test_in_memory_repository,
+        test_tracking_unit_of_work,
         test_config,
     ]
     
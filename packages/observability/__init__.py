@@ -2,19 +2,32 @@
 Observability Package - Metrics and Logging
 
 Provides:
-- Prometheus metrics
-- Structured JSON logging
+- Prometheus metrics with cached exposition rendering
+- Non-blocking structured JSON logging
 - FastAPI middleware for metrics
 """
 
 from .metrics.Metrics import Metrics
 from .metrics.MetricsMiddleware import MetricsMiddleware
-from .logging.StructuredLogger import StructuredLogger
+from .metrics.ExpositionRenderer import ExpositionRenderer, RenderStats
+from .logging.StructuredLogger import StructuredLogger, LoggerStats, Lazy, lazy, DROP_NEWEST, DROP_OLDEST
+from .logging.Encoders import Encoder, stdlib_encoder, orjson_encoder, default_encoder
 
 __version__ = "1.0.0"
 
 __all__ = [
     'Metrics',
     'MetricsMiddleware',
-    'StructuredLogger'
+    'ExpositionRenderer',
+    'RenderStats',
+    'StructuredLogger',
+    'LoggerStats',
+    'Lazy',
+    'lazy',
+    'Encoder',
+    'stdlib_encoder',
+    'orjson_encoder',
+    'default_encoder',
+    'DROP_NEWEST',
+    'DROP_OLDEST'
 ]
@@ -0,0 +1,91 @@
+"""
+Benchmark do ExpositionRenderer
+
+Compara o render() com o generate_latest do prometheus_client num registry
+com muitas séries, em três cenários: nada mudou entre scrapes, só uma
+família mudou e todas as famílias mudaram. Mede também o custo do marcador
+de mudança por família (lista de samples) contra o fingerprint anterior
+(tupla montada com todos os samples).
+
+Uso: python benchmarks/exposition.py [séries por família]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+packages_path = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(packages_path))
+
+from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram, generate_latest  # noqa: E402
+
+from observability import ExpositionRenderer  # noqa: E402
+from observability.metrics.ExpositionRenderer import _marker  # noqa: E402
+
+
+def fingerprint(family) -> tuple:
+    """Fingerprint anterior, para comparação"""
+    return (family.documentation, family.type, family.unit, tuple(
+        (s.name, tuple(s.labels.items()), s.value, s.timestamp, s.exemplar)
+        for s in family.samples
+    ))
+
+
+def build(series: int):
+    registry = CollectorRegistry()
+    counters = [Counter(f"requests_{i}", "requests", ["key"], registry=registry) for i in range(3)]
+    gauge = Gauge("queue_depth", "queue depth", ["key"], registry=registry)
+    histogram = Histogram("latency", "latency", ["key"], registry=registry)
+    for i in range(series):
+        for counter in counters:
+            counter.labels(str(i)).inc()
+        gauge.labels(str(i)).set(i)
+    for i in range(series // 10):
+        histogram.labels(str(i)).observe(0.1)
+    return registry, counters, gauge
+
+
+def timed(func, rounds: int) -> float:
+    func()
+    start = time.perf_counter()
+    for _ in range(rounds):
+        func()
+    return (time.perf_counter() - start) / rounds * 1000
+
+
+def main():
+    series = int(sys.argv[1]) if len(sys.argv) > 1 else 3000
+    rounds = 20
+    registry, counters, gauge = build(series)
+    renderer = ExpositionRenderer(registry)
+
+    def one_changed():
+        gauge.labels("0").inc()
+        renderer.render()
+
+    def all_changed():
+        for counter in counters:
+            counter.labels("0").inc()
+        gauge.labels("0").inc()
+        renderer.render()
+
+    families = list(registry.collect())
+    print(f"{len(families)} famílias, {series} séries por família\n")
+    print(f"{'generate_latest':<32} {timed(lambda: generate_latest(registry), rounds):8.1f} ms/scrape")
+    print(f"{'render (nada mudou)':<32} {timed(renderer.render, rounds):8.1f} ms/scrape")
+    print(f"{'render (uma família mudou)':<32} {timed(one_changed, rounds):8.1f} ms/scrape")
+    print(f"{'render (todas mudaram)':<32} {timed(all_changed, rounds):8.1f} ms/scrape")
+    print(f"{'só registry.collect()':<32} {timed(lambda: list(registry.collect()), rounds):8.1f} ms/scrape")
+
+    previous = [_marker(family) for family in families]
+    fresh = list(registry.collect())
+    print()
+    print(f"{'marcador: lista de samples':<32} "
+          f"{timed(lambda: [_marker(f) == p for f, p in zip(fresh, previous)], rounds):8.1f} ms/scrape")
+    old = [fingerprint(family) for family in families]
+    print(f"{'marcador: tupla (antigo)':<32} "
+          f"{timed(lambda: [fingerprint(f) == p for f, p in zip(fresh, old)], rounds):8.1f} ms/scrape")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Benchmark de custo por linha do StructuredLogger
+
+Mede o caminho quente (log() filtrado por nível e log() aceito) e a
+serialização feita pelo writer com cada encoder, comparando com a
+implementação anterior (dict + datetime.utcnow().isoformat() + json.dumps
+inline).
+
+Uso: python benchmarks/logger.py [linhas]
+"""
+
+import io
+import json
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from uuid import uuid4
+
+packages_path = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(packages_path))
+
+from core.infrastructure import LogLevel  # noqa: E402
+from observability import StructuredLogger, lazy, orjson_encoder, stdlib_encoder  # noqa: E402
+from observability.logging.Encoders import orjson  # noqa: E402
+
+
+def timed(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def report(name: str, seconds: float, count: int):
+    print(f"{name:<34} {seconds * 1e9 / count:8.0f} ns/linha")
+
+
+def legacy(count: int, context: dict):
+    for _ in range(count):
+        entry = {
+            "timestamp": datetime.utcnow().isoformat(),
+            "level": "info",
+            "message": "stream started",
+            **context
+        }
+        json.dumps(entry, default=str)
+
+
+def hot_path(logger: StructuredLogger, count: int, context: dict, level: LogLevel):
+    for _ in range(count):
+        logger.log(level, "stream started", context)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    context = {"camera_id": uuid4(), "stream": "main", "fps": 25, "at": datetime.utcnow()}
+    print(f"{count} linhas\n")
+
+    report("anterior (inline)", timed(lambda: legacy(count, context)), count)
+
+    encoders = [("json", stdlib_encoder)] + ([("orjson", orjson_encoder)] if orjson else [])
+    for name, encoder in encoders:
+        logger = StructuredLogger("bench", stream=io.StringIO(), buffer_size=count,
+                                  max_batch=count, flush_interval=60, level=LogLevel.INFO,
+                                  encoder=encoder)
+        logger._writer = object()  # sem thread: mede enfileirar e serializar separadamente
+        report(f"log() filtrado ({name})", timed(lambda: hot_path(logger, count, context, LogLevel.DEBUG)), count)
+        report(f"log() aceito ({name})", timed(lambda: hot_path(logger, count, context, LogLevel.INFO)), count)
+        report(f"writer: serializar ({name})", timed(logger.flush), count)
+
+    logger = StructuredLogger("bench", stream=io.StringIO(), buffer_size=count, max_batch=count,
+                              flush_interval=60, level=LogLevel.INFO)
+    logger._writer = object()
+    lazy_context = {**context, "stats": lazy(lambda: {"dropped": 0, "queue": 12})}
+    report("log() aceito (contexto lazy)", timed(lambda: hot_path(logger, count, lazy_context, LogLevel.INFO)), count)
+
+
+if __name__ == "__main__":
+    main()
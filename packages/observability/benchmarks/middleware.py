@@ -0,0 +1,94 @@
+"""
+Benchmark de overhead do MetricsMiddleware
+
+Chama a aplicação ASGI diretamente (sem servidor) com e sem middleware e
+compara o MetricsMiddleware ASGI com a versão anterior baseada em
+BaseHTTPMiddleware, que rotulava pelo path bruto.
+
+Uso: python benchmarks/middleware.py [requests]
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+from uuid import uuid4
+
+packages_path = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(packages_path))
+
+from fastapi import FastAPI  # noqa: E402
+from starlette.middleware.base import BaseHTTPMiddleware  # noqa: E402
+
+from observability import Metrics, MetricsMiddleware  # noqa: E402
+
+
+class LegacyMetricsMiddleware(BaseHTTPMiddleware):
+    """Implementação anterior, para comparação"""
+
+    def __init__(self, app, metrics: Metrics):
+        super().__init__(app)
+        self.metrics = metrics
+
+    async def dispatch(self, request, call_next):
+        start = time.time()
+        response = await call_next(request)
+        duration = time.time() - start
+        self.metrics.record_request(request.method, request.url.path, response.status_code)
+        self.metrics.record_duration(request.method, request.url.path, duration)
+        return response
+
+
+def build(middleware, namespace: str) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/streams/{stream_id}")
+    async def get_stream(stream_id: str):
+        return {"id": stream_id}
+
+    if middleware is not None:
+        app.add_middleware(middleware, metrics=Metrics(namespace=namespace))
+    return app
+
+
+async def call(app, path: str):
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+        "method": "GET", "scheme": "http", "path": path, "raw_path": path.encode(),
+        "root_path": "", "query_string": b"", "headers": [],
+        "server": ("bench", 80), "client": ("bench", 1234),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    await app(scope, receive, send)
+
+
+async def run(app, paths) -> float:
+    start = time.perf_counter()
+    for path in paths:
+        await call(app, path)
+    return time.perf_counter() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    paths = [f"/streams/{uuid4()}" for _ in range(count)]
+    apps = [
+        ("sem middleware", build(None, "bare")),
+        ("BaseHTTPMiddleware (antigo)", build(LegacyMetricsMiddleware, "legacy")),
+        ("MetricsMiddleware (ASGI)", build(MetricsMiddleware, "asgi")),
+    ]
+    print(f"{count} requests, paths distintos\n")
+    for name, app in apps:
+        asyncio.run(run(app, paths[:100]))
+        seconds = asyncio.run(run(app, paths))
+        print(f"{name:<30} {seconds * 1e6 / count:8.1f} us/request")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+import json
+from datetime import date, datetime, time
+from enum import Enum
+from typing import Any, Callable, Dict
+from uuid import UUID
+
+try:
+    import orjson
+except ImportError:  # optional: pip install myframework-observability[fast]
+    orjson = None
+
+Encoder = Callable[[Dict[str, Any]], str]
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    return str(value)
+
+
+def stdlib_encoder(entry: Dict[str, Any]) -> str:
+    """Encode with the json module (UUID, datetime, Enum and fallback to str)"""
+    return json.dumps(entry, default=_default, ensure_ascii=False)
+
+
+def orjson_encoder(entry: Dict[str, Any]) -> str:
+    """Encode with orjson (UUID, datetime and Enum handled natively)"""
+    return orjson.dumps(entry, default=_default, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def default_encoder() -> Encoder:
+    """orjson when installed, else the json module"""
+    return orjson_encoder if orjson is not None else stdlib_encoder
@@ -1,39 +1,266 @@
-import json
-import logging
-from datetime import datetime
-from typing import Dict, Any
+import atexit
+import copy
+import os
+import sys
+import threading
+import time
+import weakref
+from collections import deque
+from dataclasses import dataclass, is_dataclass
+from datetime import date, datetime, time as time_of_day
+from enum import Enum
+from typing import Dict, Any, Callable, List, TextIO, Tuple
+from uuid import UUID
 from core.infrastructure import Logger, LogLevel
+from .Encoders import Encoder, default_encoder, _default
+
+DROP_NEWEST = "drop_newest"
+DROP_OLDEST = "drop_oldest"
+
+_RANKS = {
+    LogLevel.DEBUG: 10,
+    LogLevel.INFO: 20,
+    LogLevel.WARNING: 30,
+    LogLevel.ERROR: 40,
+    LogLevel.CRITICAL: 50,
+}
+
+_loggers: "weakref.WeakSet[StructuredLogger]" = weakref.WeakSet()
+
+
+_SCALARS = frozenset((str, int, float, bool, type(None), UUID, datetime, date))
+_IMMUTABLE = (str, int, float, UUID, date, time_of_day, Enum)
+_CONTAINERS = (dict, list, set, frozenset, tuple)
+
+
+def _snapshot(context: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy of context as it is now; Lazy values stay deferred"""
+    snapshot = dict(context)
+    for key, value in snapshot.items():
+        if type(value) in _SCALARS or isinstance(value, (_IMMUTABLE, Lazy)):
+            continue
+        if isinstance(value, _CONTAINERS) or is_dataclass(value):
+            try:
+                snapshot[key] = copy.deepcopy(value)
+                continue
+            except Exception:
+                pass
+        snapshot[key] = _default(value)
+    return snapshot
+
+
+def _reset_writers():
+    # The parent still owns the records buffered before fork and writes them;
+    # the child starts empty so nothing is written twice
+    for logger in list(_loggers):
+        logger._writer = None
+        logger._write_lock = threading.Lock()
+        logger._stop = threading.Event()
+        logger._buffer.clear()
+        logger._enqueued = logger._written = logger._dropped = logger._batches = 0
+
+
+def _flush_all():
+    for logger in list(_loggers):
+        logger.flush()
+
+
+os.register_at_fork(after_in_child=_reset_writers)
+atexit.register(_flush_all)
+
+
+class Lazy:
+    """Context value computed only when the record is written"""
+
+    __slots__ = ("func",)
+
+    def __init__(self, func: Callable[[], Any]):
+        self.func = func
+
+
+def lazy(func: Callable[[], Any]) -> Lazy:
+    """Defer an expensive context value until serialization"""
+    return Lazy(func)
+
+
+class _Timestamps:
+    """UTC ISO timestamps formatted once per millisecond"""
+
+    __slots__ = ("_second", "_prefix", "_millis", "_text")
+
+    def __init__(self):
+        self._second = -1
+        self._prefix = ""
+        self._millis = -1
+        self._text = ""
+
+    def format(self, epoch: float) -> str:
+        millis = int(epoch * 1000)
+        if millis != self._millis:
+            second = millis // 1000
+            if second != self._second:
+                self._prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+                self._second = second
+            self._text = f"{self._prefix}.{millis % 1000:03d}"
+            self._millis = millis
+        return self._text
+
+
+@dataclass(frozen=True)
+class LoggerStats:
+    """Logger counters snapshot"""
+    enqueued: int = 0
+    written: int = 0
+    dropped: int = 0
+    batches: int = 0
+    queued: int = 0
 
 
 class StructuredLogger(Logger):
-    """Structured JSON logger"""
-    
-    def __init__(self, name: str = "app"):
-        self.logger = logging.getLogger(name)
-        self.logger.setLevel(logging.DEBUG)
-        
-        handler = logging.StreamHandler()
-        handler.setFormatter(logging.Formatter('%(message)s'))
-        self.logger.addHandler(handler)
+    """Structured JSON logger
+
+    log() only appends the record to a bounded in-memory buffer (a deque
+    append, no lock and no I/O); a background writer thread serializes
+    records in batches and writes each batch to the stream with one call.
+    When the buffer is full the newest record is dropped (or the oldest,
+    with overflow=DROP_OLDEST) and counted in stats. Buffered records are
+    flushed by close() (see register_hooks) and at interpreter exit.
+
+    Records below level are rejected before anything is built. The hot
+    path stores only the epoch time and a snapshot of context: scalars are
+    kept, containers and dataclasses are deep-copied and other objects are
+    converted with the encoder's str fallback, so mutating a value after
+    log() never changes the record. The timestamp text (cached per
+    millisecond), Lazy context values (evaluated when written, not when
+    logged) and encoding happen in the writer.
+    """
+
+    def __init__(self, name: str = "app", stream: TextIO = None, buffer_size: int = 10000,
+                 max_batch: int = 512, flush_interval: float = 0.05,
+                 overflow: str = DROP_NEWEST, level: LogLevel = LogLevel.DEBUG,
+                 encoder: Encoder = None):
+        if overflow not in (DROP_NEWEST, DROP_OLDEST):
+            raise ValueError(f"Unknown overflow policy: {overflow}")
+        self.name = name
+        self.stream = stream or sys.stderr
+        self.buffer_size = buffer_size
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self.overflow = overflow
+        self.encoder = encoder or default_encoder()
+        self.set_level(level)
+        self._timestamps = _Timestamps()
+        self._buffer: deque = deque(maxlen=buffer_size if overflow == DROP_OLDEST else None)
+        self._write_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._writer: threading.Thread = None
+        self._enqueued = 0
+        self._written = 0
+        self._dropped = 0
+        self._batches = 0
+        _loggers.add(self)
 
     def log(self, level: LogLevel, message: str, context: Dict[str, Any] = None):
         """Log with structured context"""
-        log_entry = {
-            "timestamp": datetime.utcnow().isoformat(),
+        if _RANKS[level] < self._rank:
+            return
+        buffer = self._buffer
+        if len(buffer) >= self.buffer_size:
+            self._dropped += 1
+            if self.overflow == DROP_NEWEST:
+                return
+        buffer.append((time.time(), level, message, _snapshot(context) if context else None))
+        self._enqueued += 1
+        if self._writer is None:
+            self._start()
+
+    def set_level(self, level: LogLevel):
+        """Drop records below level"""
+        self.level = level
+        self._rank = _RANKS[level]
+
+    def is_enabled(self, level: LogLevel) -> bool:
+        """Whether records at level are written"""
+        return _RANKS[level] >= self._rank
+
+    def flush(self):
+        """Write every buffered record now"""
+        while self._drain():
+            pass
+
+    def close(self):
+        """Flush and stop the writer thread"""
+        self._stop.set()
+        writer = self._writer
+        if writer is not None and writer is not threading.current_thread():
+            writer.join()
+            self._writer = None
+        self.flush()
+
+    def register_hooks(self, application):
+        """Flush buffered records on Application shutdown"""
+        async def close():
+            self.close()
+        application.hooks.on_shutdown(close)
+
+    @property
+    def stats(self) -> LoggerStats:
+        return LoggerStats(
+            self._enqueued, self._written, self._dropped, self._batches, len(self._buffer)
+        )
+
+    def _start(self):
+        with self._write_lock:
+            if self._writer is not None:
+                return
+            self._stop.clear()
+            self._writer = threading.Thread(
+                target=self._run, name=f"{self.name}-log-writer", daemon=True
+            )
+            self._writer.start()
+
+    def _run(self):
+        while True:
+            if self._drain():
+                continue
+            if self._stop.wait(self.flush_interval):
+                self.flush()
+                return
+
+    def _drain(self) -> bool:
+        buffer = self._buffer
+        with self._write_lock:
+            batch: List[tuple] = []
+            while buffer and len(batch) < self.max_batch:
+                batch.append(buffer.popleft())
+            if not batch:
+                return False
+            lines: List[str] = []
+            for record in batch:
+                try:
+                    lines.append(self._format(record))
+                except Exception:
+                    self._dropped += 1
+            if not lines:
+                return True
+            try:
+                self.stream.write("\n".join(lines) + "\n")
+                self.stream.flush()
+            except (OSError, ValueError):
+                self._dropped += len(lines)
+                return True
+            self._written += len(lines)
+            self._batches += 1
+            return True
+
+    def _format(self, record: Tuple[float, LogLevel, str, Dict[str, Any]]) -> str:
+        epoch, level, message, context = record
+        entry = {
+            "timestamp": self._timestamps.format(epoch),
             "level": level.value,
             "message": message,
-            **(context or {})
         }
-        
-        log_str = json.dumps(log_entry)
-        
-        if level == LogLevel.DEBUG:
-            self.logger.debug(log_str)
-        elif level == LogLevel.INFO:
-            self.logger.info(log_str)
-        elif level == LogLevel.WARNING:
-            self.logger.warning(log_str)
-        elif level == LogLevel.ERROR:
-            self.logger.error(log_str)
-        elif level == LogLevel.CRITICAL:
-            self.logger.critical(log_str)
+        if context:
+            for key, value in context.items():
+                entry[key] = value.func() if isinstance(value, Lazy) else value
+        return self.encoder(entry)
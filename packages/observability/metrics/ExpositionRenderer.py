@@ -0,0 +1,153 @@
+import asyncio
+import gzip
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+from prometheus_client.exposition import gzip_accepted
+from prometheus_client.openmetrics import exposition as openmetrics
+from .Metrics import Metrics
+
+_EOF = b"# EOF\n"
+
+
+@dataclass(frozen=True)
+class RenderStats:
+    """Snapshot of renderer counters"""
+    renders: int
+    coalesced: int
+    families_rendered: int
+    families_reused: int
+
+
+class _Family:
+    """Collector yielding one already collected family"""
+
+    __slots__ = ("family",)
+
+    def __init__(self, family):
+        self.family = family
+
+    def collect(self):
+        return [self.family]
+
+
+def _marker(family) -> tuple:
+    # collect() builds a fresh samples list on every scrape, so the list can
+    # be kept and compared as is (elementwise in C) instead of being copied
+    return (family.documentation, family.type, family.unit, family.samples)
+
+
+class ExpositionRenderer:
+    """Renders a registry for /metrics, re-serializing only changed families
+
+    Each family's text is cached with the samples it was formatted from; a
+    scrape collects the registry, compares sample lists and formats only
+    families whose samples changed. Rendering and gzip compression run in a
+    worker thread, concurrent scrapes share one job, and output younger
+    than max_age seconds is served as is. Supports gzip and OpenMetrics
+    negotiation.
+    """
+
+    def __init__(self, registry=None, max_age: float = 0.0, gzip_min_size: int = 1024):
+        self.registry = registry
+        self.max_age = max_age
+        self.gzip_min_size = gzip_min_size
+        self._families: Dict[bool, Dict[str, Tuple[tuple, bytes]]] = {False: {}, True: {}}
+        self._output: Dict[bool, Tuple[float, bytes]] = {}
+        self._gzipped: Dict[bool, Tuple[bytes, bytes]] = {}
+        self._inflight: Dict[Tuple[bool, bool], asyncio.Future] = {}
+        self._lock = threading.Lock()
+        self._renders = 0
+        self._coalesced = 0
+        self._rendered = 0
+        self._reused = 0
+
+    def render(self, openmetrics_format: bool = False) -> bytes:
+        """Render the registry, reusing the text of unchanged families"""
+        with self._lock:
+            cached = self._output.get(openmetrics_format)
+            now = time.monotonic()
+            if cached is not None and now - cached[0] < self.max_age:
+                return cached[1]
+
+            registry = self.registry if self.registry is not None else Metrics.registry()
+            previous = self._families[openmetrics_format]
+            current: Dict[str, Tuple[tuple, bytes]] = {}
+            chunks: List[bytes] = []
+            for family in registry.collect():
+                marker = _marker(family)
+                entry = previous.get(family.name)
+                if entry is None or entry[0] != marker:
+                    entry = (marker, self._serialize(family, openmetrics_format))
+                    self._rendered += 1
+                else:
+                    self._reused += 1
+                current[family.name] = entry
+                chunks.append(entry[1])
+            if openmetrics_format:
+                chunks.append(_EOF)
+
+            self._families[openmetrics_format] = current
+            output = b"".join(chunks)
+            self._output[openmetrics_format] = (now, output)
+            self._renders += 1
+            return output
+
+    async def render_async(self, openmetrics_format: bool = False) -> bytes:
+        """Render off the event loop; concurrent callers share one render"""
+        body, _ = await self._run(openmetrics_format, False)
+        return body
+
+    async def response(self, accept: str = "", accept_encoding: str = "") -> Tuple[bytes, Dict[str, str]]:
+        """Body and headers negotiated from the Accept and Accept-Encoding headers"""
+        openmetrics_format = "application/openmetrics-text" in (accept or "")
+        body, gzipped = await self._run(openmetrics_format, gzip_accepted(accept_encoding or ""))
+        headers = {
+            "Content-Type": openmetrics.CONTENT_TYPE_LATEST if openmetrics_format else CONTENT_TYPE_LATEST
+        }
+        if gzipped:
+            headers["Content-Encoding"] = "gzip"
+        return body, headers
+
+    @property
+    def stats(self) -> RenderStats:
+        return RenderStats(self._renders, self._coalesced, self._rendered, self._reused)
+
+    async def _run(self, openmetrics_format: bool, accepts_gzip: bool) -> Tuple[bytes, bool]:
+        key = (openmetrics_format, accepts_gzip)
+        pending = self._inflight.get(key)
+        if pending is not None:
+            self._coalesced += 1
+            return await asyncio.shield(pending)
+
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(None, self._encode, openmetrics_format, accepts_gzip)
+        self._inflight[key] = future
+        try:
+            return await future
+        finally:
+            del self._inflight[key]
+
+    def _encode(self, openmetrics_format: bool, accepts_gzip: bool) -> Tuple[bytes, bool]:
+        """Worker thread job: render, then compress when accepted and large enough"""
+        body = self.render(openmetrics_format)
+        if not accepts_gzip or len(body) < self.gzip_min_size:
+            return body, False
+        with self._lock:
+            return self._compress(openmetrics_format, body), True
+
+    def _compress(self, openmetrics_format: bool, body: bytes) -> bytes:
+        cached = self._gzipped.get(openmetrics_format)
+        if cached is not None and cached[0] == body:
+            return cached[1]
+        compressed = gzip.compress(body, compresslevel=5)
+        self._gzipped[openmetrics_format] = (body, compressed)
+        return compressed
+
+    @staticmethod
+    def _serialize(family, openmetrics_format: bool) -> bytes:
+        if openmetrics_format:
+            return openmetrics.generate_latest(_Family(family))[:-len(_EOF)]
+        return generate_latest(_Family(family))
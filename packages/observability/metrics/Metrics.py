@@ -1,9 +1,56 @@
-from prometheus_client import Counter, Histogram, Gauge, generate_latest, CONTENT_TYPE_LATEST
+import glob
+import os
+from typing import Dict, Optional, Tuple
+from prometheus_client import (
+    Counter, Histogram, Gauge, generate_latest, CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry
+)
+from prometheus_client import multiprocess
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+
+MULTIPROC_DIR_ENV = "PROMETHEUS_MULTIPROC_DIR"
+
+
+class StatsCollector:
+    """Exposes `stats` snapshots of tracked objects at scrape time
+
+    Reading counters on scrape keeps the tracked object's hot path free
+    of metric updates.
+    """
+    
+    def __init__(self, prefix: str, label: str, counters: Tuple[str, ...], gauges: Tuple[str, ...]):
+        self.prefix = prefix
+        self.label = label
+        self.counters = counters
+        self.gauges = gauges
+        self.sources: Dict[str, object] = {}
+
+    def collect(self):
+        families = [
+            (name, CounterMetricFamily(f"{self.prefix}_{name}", f"{self.prefix} {name}", labels=[self.label]))
+            for name in self.counters
+        ] + [
+            (name, GaugeMetricFamily(f"{self.prefix}_{name}", f"{self.prefix} {name}", labels=[self.label]))
+            for name in self.gauges
+        ]
+        for source_name, source in self.sources.items():
+            stats = source.stats
+            for name, family in families:
+                family.add_metric([source_name], getattr(stats, name))
+        return [family for _, family in families]
 
 
 class Metrics:
-    """Prometheus metrics"""
+    """Prometheus metrics
+
+    When PROMETHEUS_MULTIPROC_DIR is set before prometheus_client is
+    imported, every worker writes its values to mmap files in that
+    directory and export() aggregates all of them. Objects tracked with
+    track_* keep per-process stats and are only exported in single
+    process mode.
+    """
     
+    _multiprocess_registry: Optional[CollectorRegistry] = None
+
     def __init__(self, namespace: str = "app"):
         self.namespace = namespace
         
@@ -23,7 +70,30 @@ class Metrics:
         # Business metrics
         self.active_users = Gauge(
             f"{namespace}_active_users",
-            "Number of active users"
+            "Number of active users",
+            multiprocess_mode="livesum"
+        )
+        
+        self._cache_collector = StatsCollector(
+            f"{namespace}_cache", "cache",
+            ("hits", "misses", "evictions", "expirations"), ("entries", "bytes")
+        )
+        self._pool_collector = StatsCollector(
+            f"{namespace}_db_pool", "pool",
+            ("acquired", "timeouts", "created", "closed", "wait_seconds"),
+            ("size", "max_size", "in_use", "idle", "waiting")
+        )
+        self._jwt_collector = StatsCollector(
+            f"{namespace}_jwt", "service",
+            ("cache_hits", "cache_misses", "verifications", "verify_seconds"), ("cache_entries",)
+        )
+        self._hasher_collector = StatsCollector(
+            f"{namespace}_password_hasher", "hasher",
+            ("completed", "rehashed", "wait_seconds", "work_seconds"), ("queued", "in_flight", "rounds")
+        )
+        self._logger_collector = StatsCollector(
+            f"{namespace}_logger", "logger",
+            ("enqueued", "written", "dropped", "batches"), ("queued",)
         )
 
     def record_request(self, method: str, endpoint: str, status: int):
@@ -38,10 +108,71 @@ class Metrics:
         """Set active users count"""
         self.active_users.set(count)
 
+    def track_cache(self, name: str, cache):
+        """Expose hit/miss/eviction counters of a cache with a `stats` property"""
+        self._track(self._cache_collector, name, cache)
+
+    def track_pool(self, name: str, pool):
+        """Expose wait time and saturation of a connection pool"""
+        self._track(self._pool_collector, name, pool)
+
+    def track_jwt(self, name: str, jwt_service):
+        """Expose verification cache hit rate and verify latency of a JWTService"""
+        self._track(self._jwt_collector, name, jwt_service)
+
+    def track_password_hasher(self, name: str, hasher):
+        """Expose queueing and hash time of a PasswordHasher"""
+        self._track(self._hasher_collector, name, hasher)
+
+    def track_logger(self, name: str, logger):
+        """Expose buffered, written and dropped records of a StructuredLogger"""
+        self._track(self._logger_collector, name, logger)
+
+    @staticmethod
+    def _track(collector: StatsCollector, name: str, source):
+        if not collector.sources:
+            REGISTRY.register(collector)
+        collector.sources[name] = source
+
     @staticmethod
-    def export():
+    def multiprocess() -> bool:
+        """Whether metrics are shared between worker processes"""
+        return MULTIPROC_DIR_ENV in os.environ
+
+    @classmethod
+    def registry(cls) -> CollectorRegistry:
+        """Registry to scrape: all workers in multiprocess mode, else the default"""
+        if not cls.multiprocess():
+            return REGISTRY
+        if cls._multiprocess_registry is None:
+            registry = CollectorRegistry()
+            multiprocess.MultiProcessCollector(registry)
+            cls._multiprocess_registry = registry
+        return cls._multiprocess_registry
+
+    @classmethod
+    def export(cls):
         """Export metrics"""
-        return generate_latest()
+        return generate_latest(cls.registry())
+
+    @staticmethod
+    def mark_worker_dead(pid: int = None):
+        """Drop live gauge files of a finished worker (multiprocess mode)"""
+        if Metrics.multiprocess():
+            multiprocess.mark_process_dead(pid if pid is not None else os.getpid())
+
+    @staticmethod
+    def clear_multiprocess_dir():
+        """Remove files left by previous runs; call in the master before forking workers"""
+        if Metrics.multiprocess():
+            for path in glob.glob(os.path.join(os.environ[MULTIPROC_DIR_ENV], "*.db")):
+                os.remove(path)
+
+    def register_hooks(self, application):
+        """Clean up this worker's files on Application shutdown"""
+        async def cleanup():
+            self.mark_worker_dead()
+        application.hooks.on_shutdown(cleanup)
 
     @staticmethod
     def content_type():
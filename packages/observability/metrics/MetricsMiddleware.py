@@ -1,27 +1,65 @@
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-import time
+from time import perf_counter_ns
+from typing import Dict, Tuple
 from .Metrics import Metrics
 
+UNMATCHED = "unmatched"
+OTHER = "other"
 
-class MetricsMiddleware(BaseHTTPMiddleware):
-    """Middleware to collect metrics"""
+_METHODS = frozenset(("GET", "HEAD", "POST", "PUT", "DELETE", "CONNECT", "OPTIONS", "TRACE", "PATCH"))
+
+
+class MetricsMiddleware:
+    """ASGI middleware to collect metrics
+    
+    Requests are labeled by matched route template ("/streams/{id}"),
+    never by raw path, so series stay bounded; requests no route matched
+    share the "unmatched" label. Methods outside the standard HTTP set are
+    client-chosen, so they share the "other" label. Metric children are
+    cached per (method, route, status). Streaming responses pass through untouched.
+    """
     
     def __init__(self, app, metrics: Metrics):
-        super().__init__(app)
+        self.app = app
         self.metrics = metrics
+        self._children: Dict[Tuple[str, str, int], tuple] = {}
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = perf_counter_ns()
+        status = 500
+
+        async def send_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_status)
+        finally:
+            duration = (perf_counter_ns() - start) / 1e9
+            method = scope["method"]
+            key = (method if method in _METHODS else OTHER, _route_template(scope), status)
+            children = self._children.get(key)
+            if children is None:
+                children = self._labels(*key)
+            children[0].inc()
+            children[1].observe(duration)
+
+    def _labels(self, method: str, endpoint: str, status: int) -> tuple:
+        children = (
+            self.metrics.http_requests.labels(method=method, endpoint=endpoint, status=status),
+            self.metrics.http_duration.labels(method=method, endpoint=endpoint),
+        )
+        self._children[(method, endpoint, status)] = children
+        return children
+
 
-    async def dispatch(self, request: Request, call_next):
-        start = time.time()
-        
-        response = await call_next(request)
-        
-        duration = time.time() - start
-        method = request.method
-        endpoint = request.url.path
-        status = response.status_code
-        
-        self.metrics.record_request(method, endpoint, status)
-        self.metrics.record_duration(method, endpoint, duration)
-        
-        return response
+def _route_template(scope) -> str:
+    route = scope.get("route")
+    if route is None:
+        return UNMATCHED
+    return getattr(route, "path_format", None) or getattr(route, "path", UNMATCHED)
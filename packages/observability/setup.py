@@ -24,4 +24,7 @@ setup(
         "prometheus-client>=0.19.0",
         "fastapi>=0.104.0",
     ],
+    extras_require={
+        "fast": ["orjson>=3.9.0"],
+    },
 )
@@ -0,0 +1,395 @@
+"""
+Script de validação do Observability
+
+Valida:
+- Imports funcionam
+- Coletores track_* e export multiprocess
+- MetricsMiddleware mantém labels limitados
+- ExpositionRenderer reaproveita famílias e comprime fora do event loop
+- StructuredLogger copia o contexto em log()
+- Níveis, valores lazy, políticas de overflow e encoders
+"""
+
+import sys
+from pathlib import Path
+
+# Add packages to path
+packages_path = Path(__file__).parent.parent
+sys.path.insert(0, str(packages_path))
+
+
+def call(app, method: str, path: str):
+    """Call an ASGI app directly, without a server"""
+    import asyncio
+
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+        "method": method, "scheme": "http", "path": path, "raw_path": path.encode(),
+        "root_path": "", "query_string": b"", "headers": [],
+        "server": ("test", 80), "client": ("test", 1234),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    asyncio.run(app(scope, receive, send))
+
+
+def test_imports():
+    """Test all imports work"""
+    print("[TEST] Testing imports...")
+
+    try:
+        from observability import (
+            Metrics, MetricsMiddleware, ExpositionRenderer, StructuredLogger, lazy
+        )
+        print("[OK] All imports successful")
+        return True
+    except Exception as e:
+        print(f"[FAIL] Import failed: {e}")
+        return False
+
+
+def test_tracked_stats():
+    """Test track_* exposes stats snapshots at scrape time"""
+    print("\n[TEST] Testing tracked stats collectors...")
+
+    try:
+        import io
+        from prometheus_client import REGISTRY
+        from observability import Metrics, StructuredLogger
+
+        metrics = Metrics(namespace="validate_tracked")
+        logger = StructuredLogger(stream=io.StringIO(), flush_interval=60)
+        metrics.track_logger("app", logger)
+        for i in range(3):
+            logger.info("line", {"i": i})
+        logger.close()
+
+        def sample(name):
+            return REGISTRY.get_sample_value(f"validate_tracked_logger_{name}", {"logger": "app"})
+
+        assert sample("enqueued_total") == 3 and sample("written_total") == 3
+        assert sample("queued") == 0
+        assert b"validate_tracked_logger_written_total" in Metrics.export()
+
+        print("[OK] Tracked stats are exported")
+        return True
+    except Exception as e:
+        print(f"[FAIL] Tracked stats failed: {e!r}")
+        return False
+
+
+def test_multiprocess_export():
+    """Test export aggregates counters written by several worker processes"""
+    print("\n[TEST] Testing multiprocess export...")
+
+    try:
+        import os
+        import subprocess
+        import tempfile
+
+        worker = (
+            "import sys; sys.path.insert(0, sys.argv[1]);"
+            "from observability import Metrics;"
+            "Metrics(namespace='validate_mp').record_request('GET', '/items', 200)"
+        )
+        exporter = (
+            "import sys; sys.path.insert(0, sys.argv[1]);"
+            "from observability import Metrics;"
+            "sys.stdout.write(Metrics.export().decode())"
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            env = {**os.environ, "PROMETHEUS_MULTIPROC_DIR": directory}
+            for _ in range(3):
+                subprocess.run([sys.executable, "-c", worker, str(packages_path)], env=env, check=True)
+            output = subprocess.run(
+                [sys.executable, "-c", exporter, str(packages_path)],
+                env=env, check=True, capture_output=True, text=True
+            ).stdout
+
+        line = next(line for line in output.splitlines()
+                    if line.startswith("validate_mp_http_requests_total{"))
+        assert float(line.rsplit(" ", 1)[1]) == 3.0
+
+        print("[OK] Multiprocess export aggregates workers")
+        return True
+    except Exception as e:
+        print(f"[FAIL] Multiprocess export failed: {e!r}")
+        return False
+
+
+def test_middleware_labels():
+    """Test route templates, unmatched paths and non-standard methods"""
+    print("\n[TEST] Testing MetricsMiddleware labels...")
+
+    try:
+        from fastapi import FastAPI
+        from prometheus_client import REGISTRY
+        from observability import Metrics, MetricsMiddleware
+
+        app = FastAPI()
+
+        @app.get("/streams/{stream_id}")
+        async def get_stream(stream_id: str):
+            return {"id": stream_id}
+
+        app.add_middleware(MetricsMiddleware, metrics=Metrics(namespace="validate_middleware"))
+        for path in ("/streams/1", "/streams/2"):
+            call(app, "GET", path)
+        call(app, "GET", "/missing/3")
+        for method in ("FOO", "BAR", "get"):
+            call(app, method, "/streams/1")
+
+        def requests(method, endpoint, status):
+            return REGISTRY.get_sample_value("validate_middleware_http_requests_total", {
+                "method": method, "endpoint": endpoint, "status": str(status)
+            })
+
+        assert requests("GET", "/streams/{stream_id}", 200) == 2
+        assert requests("GET", "unmatched", 404) == 1
+        assert requests("other", "/streams/{stream_id}", 405) == 3
+        assert requests("FOO", "/streams/{stream_id}", 405) is None
+
+        print("[OK] MetricsMiddleware labels stay bounded")
+        return True
+    except Exception as e:
+        print(f"[FAIL] MetricsMiddleware failed: {e!r}")
+        return False
+
+
+def test_exposition_renderer():
+    """Test renderer output, family reuse and gzip off the event loop"""
+    print("\n[TEST] Testing ExpositionRenderer...")
+
+    try:
+        import asyncio
+        import gzip
+        import threading
+        from prometheus_client import CollectorRegistry, Counter, Gauge, generate_latest
+        from observability import ExpositionRenderer
+
+        registry = CollectorRegistry()
+        counter = Counter("validate_requests", "requests", ["key"], registry=registry)
+        gauge = Gauge("validate_depth", "depth", registry=registry)
+        for i in range(200):
+            counter.labels(str(i)).inc()
+
+        renderer = ExpositionRenderer(registry)
+        assert renderer.render() == generate_latest(registry)
+        gauge.set(3)
+        assert renderer.render() == generate_latest(registry)
+        assert renderer.stats.families_reused == 1
+
+        threads = []
+        compress = renderer._compress
+
+        def recording(*args):
+            threads.append(threading.current_thread())
+            return compress(*args)
+
+        renderer._compress = recording
+
+        async def run():
+            body, headers = await renderer.response("", "gzip")
+            assert headers["Content-Encoding"] == "gzip"
+            assert gzip.decompress(body) == generate_latest(registry)
+            plain, headers = await renderer.response("", "")
+            assert "Content-Encoding" not in headers and plain == generate_latest(registry)
+            scrapes = await asyncio.gather(*(renderer.response("", "gzip") for _ in range(5)))
+            assert all(body == scrapes[0][0] for body, _ in scrapes)
+
+        asyncio.run(run())
+        assert threads and threading.main_thread() not in threads
+        assert renderer.stats.coalesced >= 4
+
+        async def negotiate():
+            return await renderer.response("application/openmetrics-text; version=1.0.0", "")
+
+        body, headers = asyncio.run(negotiate())
+        assert headers["Content-Type"].startswith("application/openmetrics-text")
+        assert body.endswith(b"# EOF\n") and body.count(b"# EOF") == 1
+
+        print("[OK] ExpositionRenderer works")
+        return True
+    except Exception as e:
+        print(f"[FAIL] ExpositionRenderer failed: {e!r}")
+        return False
+
+
+def test_logger_snapshot():
+    """Test context is captured at log() time while lazy values are deferred"""
+    print("\n[TEST] Testing StructuredLogger context snapshot...")
+
+    try:
+        import io
+        import json
+        from dataclasses import dataclass, field
+        from observability import StructuredLogger, lazy, stdlib_encoder
+
+        @dataclass
+        class Job:
+            name: str
+            tags: list = field(default_factory=list)
+
+        class Counter:
+            value = 0
+
+            def __str__(self):
+                return f"counter={self.value}"
+
+        stream = io.StringIO()
+        logger = StructuredLogger(stream=stream, encoder=stdlib_encoder, flush_interval=60)
+        tags = ["a"]
+        nested = {"depth": 1}
+        job = Job("encode", ["x"])
+        counter = Counter()
+        state = {"calls": 0}
+        logger.info("first", {
+            "tags": tags, "nested": nested, "job": job, "counter": counter,
+            "calls": lazy(lambda: state["calls"]),
+        })
+        tags.append("b")
+        nested["depth"] = 2
+        job.tags.append("y")
+        counter.value = 5
+        state["calls"] = 3
+        logger.close()
+
+        record = json.loads(stream.getvalue())
+        assert record["tags"] == ["a"] and record["nested"] == {"depth": 1}
+        assert record["job"] == str(Job("encode", ["x"]))
+        assert record["counter"] == "counter=0"
+        assert record["calls"] == 3
+
+        print("[OK] StructuredLogger snapshots context")
+        return True
+    except Exception as e:
+        print(f"[FAIL] StructuredLogger failed: {e!r}")
+        return False
+
+
+def test_logger_levels_and_overflow():
+    """Test level filtering, lazy values, overflow policies and encoders"""
+    print("\n[TEST] Testing StructuredLogger levels and overflow...")
+
+    try:
+        import io
+        import json
+        from datetime import datetime
+        from enum import Enum
+        from uuid import uuid4
+        from core.infrastructure import LogLevel
+        from observability import (
+            StructuredLogger, lazy, stdlib_encoder, orjson_encoder, DROP_OLDEST
+        )
+        from observability.logging.Encoders import orjson
+
+        calls = []
+        stream = io.StringIO()
+        logger = StructuredLogger(stream=stream, level=LogLevel.INFO, flush_interval=60)
+        logger.debug("skipped", {"dump": lazy(lambda: calls.append("debug"))})
+        logger.info("kept", {"dump": lazy(lambda: calls.append("info") or "done")})
+        assert not logger.is_enabled(LogLevel.DEBUG) and logger.stats.enqueued == 1
+        logger.close()
+        assert calls == ["info"] and json.loads(stream.getvalue())["dump"] == "done"
+
+        newest = StructuredLogger(stream=io.StringIO(), buffer_size=3, flush_interval=60)
+        newest._start = lambda: None  # keep records in the buffer
+        oldest = StructuredLogger(stream=io.StringIO(), buffer_size=3, flush_interval=60,
+                                  overflow=DROP_OLDEST)
+        oldest._start = lambda: None
+        for i in range(5):
+            newest.info(str(i))
+            oldest.info(str(i))
+        assert [record[2] for record in newest._buffer] == ["0", "1", "2"]
+        assert [record[2] for record in oldest._buffer] == ["2", "3", "4"]
+        assert newest.stats.dropped == 2 and oldest.stats.dropped == 2
+
+        class Color(Enum):
+            RED = "red"
+
+        entry = {"id": uuid4(), "at": datetime(2024, 1, 2, 3, 4, 5), "color": Color.RED, "tags": {"a"}}
+        expected = {"id": str(entry["id"]), "at": "2024-01-02T03:04:05", "color": "red", "tags": ["a"]}
+        assert json.loads(stdlib_encoder(entry)) == expected
+        if orjson is not None:
+            assert json.loads(orjson_encoder(entry)) == expected
+
+        print("[OK] StructuredLogger levels and overflow work")
+        return True
+    except Exception as e:
+        print(f"[FAIL] StructuredLogger levels and overflow failed: {e!r}")
+        return False
+
+
+def test_logger_fork():
+    """Test records buffered before fork are written once, by the parent"""
+    print("\n[TEST] Testing StructuredLogger after fork...")
+
+    try:
+        import os
+        import tempfile
+        from observability import StructuredLogger
+
+        with tempfile.TemporaryFile("w+") as stream:
+            logger = StructuredLogger(stream=stream, flush_interval=60)
+            logger._start = lambda: None  # keep the record buffered across fork
+            logger.info("before fork")
+            pid = os.fork()
+            if pid == 0:
+                code = 0 if len(logger._buffer) == 0 and logger.stats.enqueued == 0 else 1
+                logger.info("child")
+                logger.flush()
+                os._exit(code)
+            _, status = os.waitpid(pid, 0)
+            logger.flush()
+            stream.seek(0)
+            messages = [line for line in stream.read().splitlines() if line]
+
+        assert os.waitstatus_to_exitcode(status) == 0
+        assert sum('"before fork"' in line for line in messages) == 1
+        assert sum('"child"' in line for line in messages) == 1
+
+        print("[OK] StructuredLogger writes buffered records once after fork")
+        return True
+    except Exception as e:
+        print(f"[FAIL] StructuredLogger after fork failed: {e!r}")
+        return False
+
+
+def main():
+    """Run all tests"""
+    print("=" * 50)
+    print("Observability Validation")
+    print("=" * 50)
+
+    tests = [
+        test_imports,
+        test_tracked_stats,
+        test_multiprocess_export,
+        test_middleware_labels,
+        test_exposition_renderer,
+        test_logger_snapshot,
+        test_logger_levels_and_overflow,
+        test_logger_fork,
+    ]
+
+    results = [test() for test in tests]
+
+    print("\n" + "=" * 50)
+    print(f"Results: {sum(results)}/{len(results)} passed")
+    print("=" * 50)
+
+    if all(results):
+        print("[SUCCESS] All tests passed!")
+        return 0
+    else:
+        print("[ERROR] Some tests failed")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,19 +4,26 @@ RBAC Package - Role-Based Access Control
 Provides:
 - Role and Permission entities
 - RBAC service for access control
-- FastAPI permission decorators
+- FastAPI permission decorators and per-request RBACGuard
 """
 
-from .domain import Permission, Role
-from .application import RBACService
-from .infrastructure import require_permission, require_any_permission
+from .domain import Permission, PermissionRegistry, permission_registry, Role, RoleChanged, ResourceGrant
+from .application import RBACService, RoleStore, DecisionCache
+from .infrastructure import require_permission, require_any_permission, RBACGuard
 
 __version__ = "1.0.0"
 
 __all__ = [
     'Permission',
+    'PermissionRegistry',
+    'permission_registry',
     'Role',
+    'RoleChanged',
+    'ResourceGrant',
     'RBACService',
+    'RoleStore',
+    'DecisionCache',
     'require_permission',
-    'require_any_permission'
+    'require_any_permission',
+    'RBACGuard'
 ]
@@ -0,0 +1,47 @@
+from collections import OrderedDict
+from typing import Tuple
+from ..domain import Role, RoleChanged
+
+
+class DecisionCache:
+    """Bounded LRU of authorization decisions
+    
+    Keyed by (registry, role's effective mask, codes, mode): a decision
+    depends only on the permissions the role holds right now, so role
+    changes, inherited changes and roles reloaded from storage with a
+    different mask never hit a stale entry. Clearing on RoleChanged only
+    releases entries early.
+    """
+    
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[tuple, bool]" = OrderedDict()
+
+    def allowed(self, role: Role, codes: Tuple[str, ...], any_of: bool = False) -> bool:
+        """Whether role has all (or any) of codes"""
+        # Interning codes may extend wildcard masks, so read role.mask after it
+        mask = role.registry.mask(codes)
+        key = (role.registry, role.mask, codes, any_of)
+        decision = self._entries.get(key)
+        if decision is not None:
+            self._entries.move_to_end(key)
+            return decision
+        decision = role.has_any(mask) if any_of else role.has_all(mask)
+        self._entries[key] = decision
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return decision
+
+    def clear(self):
+        """Drop all decisions"""
+        self._entries.clear()
+
+    def subscribe(self, event_bus):
+        """Clear on RoleChanged events"""
+        event_bus.subscribe(RoleChanged, self._on_role_changed)
+
+    async def _on_role_changed(self, event: RoleChanged):
+        self.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -1,7 +1,9 @@
-from typing import List
-from core import Result
+from typing import Any, Iterable, List, TypeVar, Union
+from core import Result, DomainException, EntityColumns
 from ..domain import Role, Permission
 
+R = TypeVar('R')
+
 
 class RBACService:
     """Role-Based Access Control service"""
@@ -14,12 +16,56 @@ class RBACService:
     @staticmethod
     def can_access_any(role: Role, permission_codes: List[str]) -> bool:
         """Check if role has any of the permissions"""
-        return any(role.has_permission(code) for code in permission_codes)
+        return role.has_any(role.registry.mask(permission_codes))
 
     @staticmethod
     def can_access_all(role: Role, permission_codes: List[str]) -> bool:
         """Check if role has all permissions"""
-        return all(role.has_permission(code) for code in permission_codes)
+        return role.has_all(role.registry.mask(permission_codes))
+
+    @staticmethod
+    def can_access_resource(role: Role, permission_code: str, resource: Any) -> bool:
+        """Check if role has permission globally or through a grant on resource"""
+        if role.has_permission(permission_code):
+            return True
+        return any(
+            getattr(resource, attribute, None) in allowed
+            for attribute, allowed in role.resource_scope(permission_code).items()
+        )
+
+    @staticmethod
+    def filter_authorized(role: Role, resources: Union[Iterable[R], EntityColumns],
+                          permission_code: str) -> Union[List[R], EntityColumns]:
+        """Resources role may access with permission, checked against the grant index
+        
+        EntityColumns are filtered column by column without materializing
+        entities and come back as EntityColumns. Grant attributes the
+        resources do not have match nothing, for lists and columns alike.
+        """
+        columnar = isinstance(resources, EntityColumns)
+        if role.has_permission(permission_code):
+            return resources if columnar else list(resources)
+
+        scope = role.resource_scope(permission_code)
+        if columnar:
+            rows = set()
+            for attribute, allowed in scope.items():
+                try:
+                    column = resources.values(attribute)
+                except KeyError:
+                    continue
+                rows.update(index for index, value in enumerate(column) if value in allowed)
+            return resources.take(sorted(rows))
+
+        if not scope:
+            return []
+        if len(scope) == 1:
+            (attribute, allowed), = scope.items()
+            return [r for r in resources if getattr(r, attribute, None) in allowed]
+        return [
+            r for r in resources
+            if any(getattr(r, attribute, None) in allowed for attribute, allowed in scope.items())
+        ]
 
     @staticmethod
     def grant_permission(role: Role, permission: Permission) -> Result[Role]:
@@ -32,3 +78,18 @@ class RBACService:
         """Revoke permission from role"""
         role.remove_permission(permission)
         return Result.ok(role)
+
+    @staticmethod
+    def inherit_role(role: Role, parent: Role) -> Result[Role]:
+        """Make role inherit the permissions of parent"""
+        try:
+            role.add_parent(parent)
+        except DomainException as e:
+            return Result.fail(str(e))
+        return Result.ok(role)
+
+    @staticmethod
+    def disinherit_role(role: Role, parent: Role) -> Result[Role]:
+        """Stop role inheriting from parent"""
+        role.remove_parent(parent)
+        return Result.ok(role)
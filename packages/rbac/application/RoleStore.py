@@ -0,0 +1,37 @@
+from typing import Awaitable, Callable, Optional
+from core import Cache, MemoryCache
+from ..domain import Role, RoleChanged
+
+RoleLoader = Callable[[str], Awaitable[Optional[Role]]]
+
+
+class RoleStore:
+    """Cached role lookup by code
+    
+    Roles are loaded through loader once and kept in the cache; concurrent
+    misses share one load. RoleChanged events drop every cached role,
+    since a change also affects roles inheriting from it.
+    """
+    
+    def __init__(self, loader: RoleLoader, cache: Cache = None, ttl: int = 300):
+        self.loader = loader
+        self.cache = cache or MemoryCache(max_entries=1024)
+        self.ttl = ttl
+
+    async def get(self, code: str) -> Optional[Role]:
+        """Role for code, loading it on a miss"""
+        return await self.cache.get_or_set(code, lambda: self.loader(code), self.ttl)
+
+    async def invalidate(self, code: str = None):
+        """Drop one cached role, or all of them"""
+        if code is None:
+            await self.cache.clear()
+        else:
+            await self.cache.delete(code)
+
+    def subscribe(self, event_bus):
+        """Invalidate on RoleChanged events"""
+        event_bus.subscribe(RoleChanged, self._on_role_changed)
+
+    async def _on_role_changed(self, event: RoleChanged):
+        await self.invalidate()
@@ -1,3 +1,5 @@
 from .RBACService import RBACService
+from .RoleStore import RoleStore
+from .DecisionCache import DecisionCache
 
-__all__ = ['RBACService']
+__all__ = ['RBACService', 'RoleStore', 'DecisionCache']
@@ -0,0 +1,96 @@
+import re
+from typing import Dict, Iterable, List, Tuple
+
+WILDCARD = "*"
+
+_SEPARATORS = re.compile(r"[.:]")
+
+
+def is_wildcard(code: str) -> bool:
+    """Whether code is a wildcard pattern ("*", "camera:*", "users.*")"""
+    return code == WILDCARD or code.endswith((".*", ":*"))
+
+
+def _segments(code: str) -> List[str]:
+    return _SEPARATORS.split(code) if code else []
+
+
+class _TrieNode:
+    __slots__ = ("children", "wildcard", "mask")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.wildcard = False
+        self.mask = 0
+
+
+class PermissionRegistry:
+    """Interns permission codes to bit positions
+    
+    Roles compile their permissions into an int bitmask, so permission
+    checks become a single mask operation. Wildcard patterns live in a
+    segment trie whose nodes keep the mask of every known code below
+    them; interning a code updates the masks along its path and bumps
+    `generation` so roles holding a matching wildcard recompile.
+    """
+    
+    def __init__(self):
+        self._bits: Dict[str, int] = {}
+        self._masks: Dict[Tuple[str, ...], int] = {}
+        self._trie = _TrieNode()
+        self.generation = 0
+
+    def bit(self, code: str) -> int:
+        """Bit for code, assigning the next free bit on first use"""
+        bit = self._bits.get(code)
+        if bit is None:
+            bit = 1 << len(self._bits)
+            self._bits[code] = bit
+            self._index(code, bit)
+        return bit
+
+    def mask(self, codes: Iterable[str]) -> int:
+        """Combined bits for codes (memoized per code tuple)"""
+        codes = tuple(codes)
+        mask = self._masks.get(codes)
+        if mask is None:
+            mask = 0
+            for code in codes:
+                mask |= self.bit(code)
+            self._masks[codes] = mask
+        return mask
+
+    def wildcard_mask(self, pattern: str) -> int:
+        """Bits of every known code matched by a wildcard pattern"""
+        node = self._trie
+        prefix = _segments(pattern[:-2]) if pattern != WILDCARD else []
+        for segment in prefix:
+            node = node.children.setdefault(segment, _TrieNode())
+        if not node.wildcard:
+            node.wildcard = True
+            depth = len(prefix)
+            for code, bit in self._bits.items():
+                segments = _segments(code)
+                if len(segments) > depth and segments[:depth] == prefix:
+                    node.mask |= bit
+        return node.mask
+
+    def codes(self, mask: int) -> Tuple[str, ...]:
+        """Codes whose bits are set in mask"""
+        return tuple(code for code, bit in self._bits.items() if mask & bit)
+
+    def _index(self, code: str, bit: int):
+        node = self._trie
+        matched = False
+        for segment in _segments(code):
+            if node.wildcard:
+                node.mask |= bit
+                matched = True
+            node = node.children.get(segment)
+            if node is None:
+                break
+        if matched:
+            self.generation += 1
+
+
+permission_registry = PermissionRegistry()
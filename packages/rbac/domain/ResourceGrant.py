@@ -0,0 +1,17 @@
+from typing import Any
+from core import SlottedValueObject
+
+
+class ResourceGrant(SlottedValueObject):
+    """Permission granted only on resources whose attribute equals value
+    
+    e.g. ResourceGrant("camera:view", "site_id", site_x.id). The permission
+    may be a wildcard pattern ("camera:*").
+    """
+    
+    __slots__ = ("permission", "attribute", "value")
+
+    def __init__(self, permission: str, attribute: str, value: Any):
+        self.permission = permission
+        self.attribute = attribute
+        self.value = value
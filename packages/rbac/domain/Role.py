@@ -1,28 +1,203 @@
-from core import Entity
+from core import AggregateRoot, BusinessRuleViolationException
 from uuid import UUID
-from typing import List
+from weakref import WeakSet
+from typing import Dict, FrozenSet, List, Optional, Set
 from .Permission import Permission
+from .PermissionRegistry import PermissionRegistry, permission_registry, is_wildcard
+from .RoleChanged import RoleChanged
+from .ResourceGrant import ResourceGrant
 
 
-class Role(Entity):
-    """Role entity with permissions"""
+class Role(AggregateRoot):
+    """Role entity with permissions and parent roles
+    
+    Permissions are kept by id and compiled into a bitmask from the
+    permission registry; add/remove update the mask incrementally.
+    The effective mask (own permissions, expanded wildcards and every
+    inherited role) is computed once and invalidated down the hierarchy
+    when a role changes, so checks stay O(1) regardless of depth.
+    Every change bumps `version` on the role and its descendants and
+    records a RoleChanged event.
+
+    Resource grants scope a permission to resources with a given attribute
+    value; resource_scope() compiles them (inherited ones included) into an
+    attribute -> values index per permission, cached like the mask.
+    """
     
     def __init__(self, id: UUID = None, code: str = "", name: str = "", 
-                 permissions: List[Permission] = None):
+                 permissions: List[Permission] = None, parents: List['Role'] = None,
+                 grants: List[ResourceGrant] = None, registry: PermissionRegistry = permission_registry):
         super().__init__(id)
         self.code = code
         self.name = name
+        self.registry = registry
+        self._parents: Dict[UUID, Role] = {}
+        self._children: WeakSet = WeakSet()
+        self._effective: Optional[int] = None
+        self._generation = -1
+        self.version = 0
+        self._grants: Set[ResourceGrant] = set(grants or ())
+        self._scopes: Dict[str, Dict[str, FrozenSet]] = {}
         self.permissions = permissions or []
+        for parent in parents or []:
+            self._inherit(parent)
+
+    @property
+    def permissions(self) -> List[Permission]:
+        return list(self._permissions.values())
+
+    @permissions.setter
+    def permissions(self, permissions: List[Permission]):
+        self._permissions: Dict[UUID, Permission] = {}
+        self._code_counts: Dict[str, int] = {}
+        self._wildcards: Dict[str, int] = {}
+        self._mask = 0
+        for permission in permissions:
+            self._grant(permission)
+        self._invalidate()
+
+    @property
+    def parents(self) -> List['Role']:
+        return list(self._parents.values())
+
+    @property
+    def grants(self) -> List[ResourceGrant]:
+        return list(self._grants)
+
+    @property
+    def mask(self) -> int:
+        """Effective permission bitmask, including inherited roles"""
+        if self._effective is None or self._generation != self.registry.generation:
+            self._compile()
+        return self._effective
 
     def add_permission(self, permission: Permission):
-        if permission not in self.permissions:
-            self.permissions.append(permission)
-            self._touch()
+        if permission.id not in self._permissions:
+            self._grant(permission)
+            self._changed()
 
     def remove_permission(self, permission: Permission):
-        if permission in self.permissions:
-            self.permissions.remove(permission)
-            self._touch()
+        if permission.id in self._permissions:
+            self._revoke(permission)
+            self._changed()
+
+    def add_parent(self, parent: 'Role'):
+        """Inherit every permission of parent"""
+        if parent.id not in self._parents:
+            self._inherit(parent)
+            self._changed()
+
+    def remove_parent(self, parent: 'Role'):
+        stored = self._parents.pop(parent.id, None)
+        if stored is not None:
+            stored._children.discard(self)
+            self._changed()
+
+    def add_grant(self, grant: ResourceGrant):
+        if grant not in self._grants:
+            self._grants.add(grant)
+            self._changed()
+
+    def remove_grant(self, grant: ResourceGrant):
+        if grant in self._grants:
+            self._grants.discard(grant)
+            self._changed()
+
+    def resource_scope(self, code: str) -> Dict[str, FrozenSet]:
+        """Attribute -> allowed values for permission code (own and inherited grants)"""
+        scope = self._scopes.get(code)
+        if scope is None:
+            scope = self._compile_scope(code)
+            self._scopes[code] = scope
+        return scope
+
+    def inherits_from(self, role: 'Role') -> bool:
+        """Whether role is an ancestor of this role"""
+        pending = list(self._parents.values())
+        seen = set()
+        while pending:
+            parent = pending.pop()
+            if parent.id == role.id:
+                return True
+            if parent.id not in seen:
+                seen.add(parent.id)
+                pending.extend(parent._parents.values())
+        return False
 
     def has_permission(self, code: str) -> bool:
-        return any(p.code == code for p in self.permissions)
+        bit = self.registry.bit(code)
+        return bool(self.mask & bit)
+
+    def has_any(self, mask: int) -> bool:
+        """Whether role has any permission in mask"""
+        return bool(self.mask & mask)
+
+    def has_all(self, mask: int) -> bool:
+        """Whether role has every permission in mask"""
+        return self.mask & mask == mask
+
+    def _inherit(self, parent: 'Role'):
+        if parent.id == self.id or parent.inherits_from(self):
+            raise BusinessRuleViolationException(
+                f"Role '{parent.code}' already inherits from '{self.code}'"
+            )
+        self._parents[parent.id] = parent
+        parent._children.add(self)
+
+    def _compile(self):
+        generation = self.registry.generation
+        mask = self._mask
+        for pattern in self._wildcards:
+            mask |= self.registry.wildcard_mask(pattern)
+        for parent in self._parents.values():
+            mask |= parent.mask
+        self._effective = mask
+        self._generation = generation
+
+    def _compile_scope(self, code: str) -> Dict[str, FrozenSet]:
+        bit = self.registry.bit(code)
+        values: Dict[str, set] = {}
+        for grant in self._grants:
+            if grant.permission == code or (
+                is_wildcard(grant.permission)
+                and self.registry.wildcard_mask(grant.permission) & bit
+            ):
+                values.setdefault(grant.attribute, set()).add(grant.value)
+        for parent in self._parents.values():
+            for attribute, allowed in parent.resource_scope(code).items():
+                values.setdefault(attribute, set()).update(allowed)
+        return {attribute: frozenset(allowed) for attribute, allowed in values.items()}
+
+    def _changed(self):
+        self._invalidate()
+        self._touch()
+        self.add_domain_event(RoleChanged(self.id, self.code))
+
+    def _invalidate(self):
+        self._effective = None
+        self._scopes = {}
+        self.version += 1
+        for child in list(self._children):
+            child._invalidate()
+
+    def _grant(self, permission: Permission):
+        self._permissions[permission.id] = permission
+        code = permission.code
+        if is_wildcard(code):
+            self._wildcards[code] = self._wildcards.get(code, 0) + 1
+            return
+        count = self._code_counts.get(code, 0)
+        self._code_counts[code] = count + 1
+        self._mask |= self.registry.bit(code)
+
+    def _revoke(self, permission: Permission):
+        stored = self._permissions.pop(permission.id)
+        code = stored.code
+        counts = self._wildcards if is_wildcard(code) else self._code_counts
+        count = counts[code] - 1
+        if count:
+            counts[code] = count
+            return
+        del counts[code]
+        if counts is self._code_counts:
+            self._mask &= ~self.registry.bit(code)
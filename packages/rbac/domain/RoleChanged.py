@@ -0,0 +1,11 @@
+from core import DomainEvent
+from uuid import UUID
+
+
+class RoleChanged(DomainEvent):
+    """Raised when a role's permissions or parents change"""
+    
+    def __init__(self, role_id: UUID, code: str):
+        super().__init__()
+        self.role_id = role_id
+        self.code = code
@@ -1,4 +1,7 @@
 from .Permission import Permission
+from .PermissionRegistry import PermissionRegistry, permission_registry
+from .RoleChanged import RoleChanged
+from .ResourceGrant import ResourceGrant
 from .Role import Role
 
-__all__ = ['Permission', 'Role']
+__all__ = ['Permission', 'PermissionRegistry', 'permission_registry', 'Role', 'RoleChanged', 'ResourceGrant']
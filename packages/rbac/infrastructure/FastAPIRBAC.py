@@ -1,18 +1,17 @@
-from fastapi import HTTPException, status
+from fastapi import Depends, HTTPException, status
 from typing import Callable, List
 from ..domain import Role
-from ..application import RBACService
+from ..application import RBACService, RoleStore, DecisionCache
 
 
 def require_permission(permission_code: str):
     """Decorator to require permission"""
+    detail = f"Permission required: {permission_code}"
+
     def decorator(func: Callable):
         async def wrapper(*args, role: Role = None, **kwargs):
             if not role or not RBACService.can_access(role, permission_code):
-                raise HTTPException(
-                    status_code=status.HTTP_403_FORBIDDEN,
-                    detail=f"Permission required: {permission_code}"
-                )
+                raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=detail)
             return await func(*args, role=role, **kwargs)
         return wrapper
     return decorator
@@ -20,13 +19,57 @@ def require_permission(permission_code: str):
 
 def require_any_permission(permission_codes: List[str]):
     """Decorator to require any of the permissions"""
+    detail = f"One of these permissions required: {permission_codes}"
+    permission_codes = tuple(permission_codes)
+
     def decorator(func: Callable):
         async def wrapper(*args, role: Role = None, **kwargs):
             if not role or not RBACService.can_access_any(role, permission_codes):
-                raise HTTPException(
-                    status_code=status.HTTP_403_FORBIDDEN,
-                    detail=f"One of these permissions required: {permission_codes}"
-                )
+                raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=detail)
             return await func(*args, role=role, **kwargs)
         return wrapper
     return decorator
+
+
+class RBACGuard:
+    """FastAPI dependencies resolving the caller's role once per request
+    
+    claims is a dependency returning the verified token claims (anything
+    with a `role` attribute, e.g. auth's TokenPayload). The role is looked
+    up in the RoleStore and, since FastAPI caches a dependency within a
+    request, shared by every permission check of the endpoint.
+    """
+    
+    def __init__(self, claims: Callable, roles: RoleStore, decisions: DecisionCache = None):
+        self.roles = roles
+        self.decisions = decisions or DecisionCache()
+
+        async def current_role(payload=Depends(claims)) -> Role:
+            role = await roles.get(payload.role)
+            if role is None:
+                raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Unknown role")
+            return role
+
+        self.current_role = current_role
+
+    def require(self, *permission_codes: str) -> Callable:
+        """Dependency requiring every permission"""
+        return self._dependency(permission_codes, False, f"Permission required: {', '.join(permission_codes)}")
+
+    def require_any(self, *permission_codes: str) -> Callable:
+        """Dependency requiring any of the permissions"""
+        return self._dependency(permission_codes, True, f"One of these permissions required: {list(permission_codes)}")
+
+    def subscribe(self, event_bus):
+        """Invalidate cached roles and decisions on RoleChanged events"""
+        self.roles.subscribe(event_bus)
+        self.decisions.subscribe(event_bus)
+
+    def _dependency(self, codes, any_of: bool, detail: str) -> Callable:
+        decisions = self.decisions
+
+        async def check(role: Role = Depends(self.current_role)) -> Role:
+            if not decisions.allowed(role, codes, any_of):
+                raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=detail)
+            return role
+        return check
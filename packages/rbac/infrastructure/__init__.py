@@ -1,3 +1,3 @@
-from .FastAPIRBAC import require_permission, require_any_permission
+from .FastAPIRBAC import require_permission, require_any_permission, RBACGuard
 
-__all__ = ['require_permission', 'require_any_permission']
+__all__ = ['require_permission', 'require_any_permission', 'RBACGuard']
@@ -0,0 +1,287 @@
+"""
+Script de validação do RBAC
+
+Valida:
+- Imports funcionam
+- Máscaras de permissions, wildcards e herança de roles
+- Autorização por recurso (listas e EntityColumns)
+- RBACGuard com RoleStore
+- DecisionCache não reaproveita decisões de roles recarregadas
+"""
+
+import sys
+from pathlib import Path
+
+# Add packages to path
+packages_path = Path(__file__).parent.parent
+sys.path.insert(0, str(packages_path))
+
+
+def test_imports():
+    """Test all imports work"""
+    print("[TEST] Testing imports...")
+
+    try:
+        from rbac import (
+            Role, Permission, RBACService, RoleStore, DecisionCache
+        )
+        print("[OK] All imports successful")
+        return True
+    except Exception as e:
+        print(f"[FAIL] Import failed: {e}")
+        return False
+
+
+def test_permission_masks():
+    """Test bitmask checks follow added and removed permissions"""
+    print("\n[TEST] Testing permission masks...")
+
+    try:
+        from rbac import Role, Permission, PermissionRegistry, RBACService
+
+        registry = PermissionRegistry()
+        view = Permission(code="camera:view")
+        edit = Permission(code="camera:edit")
+        role = Role(code="viewer", permissions=[view], registry=registry)
+        assert registry.bit("camera:view") != registry.bit("camera:edit")
+        assert role.has_permission("camera:view") and not role.has_permission("camera:edit")
+
+        RBACService.grant_permission(role, edit)
+        assert RBACService.can_access_all(role, ["camera:view", "camera:edit"])
+        RBACService.revoke_permission(role, view)
+        assert not RBACService.can_access(role, "camera:view")
+        assert RBACService.can_access_any(role, ["camera:view", "camera:edit"])
+        assert registry.codes(role.mask) == ("camera:edit",)
+        assert len(role.domain_events) == 2
+
+        twin = Role(code="twin", permissions=[edit, Permission(code="camera:edit")], registry=registry)
+        twin.remove_permission(edit)
+        assert twin.has_permission("camera:edit")
+
+        print("[OK] Permission masks work")
+        return True
+    except Exception as e:
+        print(f"[FAIL] Permission masks failed: {e!r}")
+        return False
+
+
+def test_wildcards_and_inheritance():
+    """Test wildcard patterns, later registered codes and role hierarchies"""
+    print("\n[TEST] Testing wildcards and inheritance...")
+
+    try:
+        from core import BusinessRuleViolationException
+        from rbac import Role, Permission, PermissionRegistry, RBACService
+
+        registry = PermissionRegistry()
+        registry.bit("camera:view")
+        cameras = Role(code="cameras", permissions=[Permission(code="camera:*")], registry=registry)
+        assert cameras.has_permission("camera:view")
+        assert cameras.has_permission("camera:zoom")
+        assert not cameras.has_permission("site:view")
+
+        root = Role(code="root", permissions=[Permission(code="*")], registry=registry)
+        assert root.has_permission("site:delete") and root.has_permission("anything.else")
+
+        base = Role(code="base", permissions=[Permission(code="site:view")], registry=registry)
+        operator = Role(code="operator", parents=[base, cameras], registry=registry)
+        supervisor = Role(code="supervisor", parents=[operator], registry=registry)
+        assert supervisor.has_permission("site:view") and supervisor.has_permission("camera:pan")
+        assert supervisor.inherits_from(base)
+
+        base.add_permission(Permission(code="site:edit"))
+        assert supervisor.has_permission("site:edit")
+        operator.remove_parent(base)
+        assert not supervisor.has_permission("site:view")
+
+        try:
+            base.add_parent(supervisor)
+            operator.add_parent(supervisor)
+            assert False, "cycle accepted"
+        except BusinessRuleViolationException:
+            pass
+        assert RBACService.inherit_role(cameras, supervisor).is_failure
+
+        print("[OK] Wildcards and inheritance work")
+        return True
+    except Exception as e:
+        print(f"[FAIL] Wildcards and inheritance failed: {e!r}")
+        return False
+
+
+def test_resource_filtering():
+    """Test resource grants and bulk filtering of lists and EntityColumns"""
+    print("\n[TEST] Testing resource-scoped authorization...")
+
+    try:
+        from core import Entity, EntityColumns
+        from rbac import Role, Permission, PermissionRegistry, ResourceGrant, RBACService
+
+        class Camera(Entity):
+            def __init__(self, id=None, site_id="", owner=""):
+                super().__init__(id)
+                self.site_id = site_id
+                self.owner = owner
+
+        registry = PermissionRegistry()
+        cameras = [Camera(site_id=f"s{i % 4}", owner=f"u{i % 5}") for i in range(40)]
+        site = Role(code="site", grants=[ResourceGrant("camera:view", "site_id", "s1")], registry=registry)
+        assert RBACService.can_access_resource(site, "camera:view", cameras[1])
+        assert not RBACService.can_access_resource(site, "camera:view", cameras[2])
+
+        visible = RBACService.filter_authorized(site, cameras, "camera:view")
+        assert visible == [camera for camera in cameras if camera.site_id == "s1"]
+
+        owner = Role(code="owner", parents=[site], registry=registry,
+                     grants=[ResourceGrant("camera:*", "owner", "u0")])
+        expected = [c for c in cameras if c.site_id == "s1" or c.owner == "u0"]
+        assert RBACService.filter_authorized(owner, cameras, "camera:view") == expected
+        assert RBACService.filter_authorized(owner, cameras, "site:view") == []
+
+        columns = EntityColumns(Camera, {"site_id": EntityColumns.OBJECT, "owner": EntityColumns.OBJECT})
+        for camera in cameras:
+            columns.add(camera)
+        filtered = RBACService.filter_authorized(owner, columns, "camera:view")
+        assert isinstance(filtered, EntityColumns)
+        assert [camera.id for camera in filtered] == [camera.id for camera in expected]
+
+        picked = Role(code="picked", registry=registry, grants=[
+            ResourceGrant("camera:view", "id", cameras[3].id),
+            ResourceGrant("camera:view", "zone", "north"),
+        ])
+        assert RBACService.filter_authorized(picked, cameras, "camera:view") == [cameras[3]]
+        assert [camera.id for camera in RBACService.filter_authorized(picked, columns, "camera:view")] == [cameras[3].id]
+
+        admin = Role(code="admin", permissions=[Permission(code="camera:view")], registry=registry)
+        assert RBACService.filter_authorized(admin, cameras, "camera:view") == cameras
+        assert RBACService.filter_authorized(admin, columns, "camera:view") is columns
+
+        print("[OK] Resource-scoped authorization works")
+        return True
+    except Exception as e:
+        print(f"[FAIL] Resource-scoped authorization failed: {e!r}")
+        return False
+
+
+def test_decision_cache_reload():
+    """Test decisions follow roles reloaded with fewer permissions"""
+    print("\n[TEST] Testing DecisionCache with reloaded roles...")
+
+    try:
+        from rbac import Role, Permission, DecisionCache, PermissionRegistry
+
+        registry = PermissionRegistry()
+        read = Permission(code="camera:read")
+        delete = Permission(code="camera:delete")
+        admin = Role(code="admin", permissions=[read, delete], registry=registry)
+        cache = DecisionCache()
+        assert cache.allowed(admin, ("camera:delete",))
+
+        reloaded = Role(id=admin.id, code="admin", permissions=[read], registry=registry)
+        assert reloaded.version == admin.version
+        assert not cache.allowed(reloaded, ("camera:delete",))
+        assert cache.allowed(reloaded, ("camera:read", "camera:delete"), any_of=True)
+
+        child = Role(code="operator", parents=[reloaded], registry=registry)
+        assert cache.allowed(child, ("camera:read",))
+        reloaded.remove_permission(read)
+        assert not cache.allowed(child, ("camera:read",))
+
+        registry = PermissionRegistry()
+        wildcard = Role(code="cameras", permissions=[Permission(code="camera:*")], registry=registry)
+        reader = Role(code="reader", permissions=[read], registry=registry)
+        assert wildcard.mask == reader.mask
+        assert cache.allowed(wildcard, ("camera:zoom",))
+        assert not cache.allowed(reader, ("camera:zoom",))
+
+        print("[OK] DecisionCache follows the role's current permissions")
+        return True
+    except Exception as e:
+        print(f"[FAIL] DecisionCache failed: {e!r}")
+        return False
+
+
+def test_rbac_guard():
+    """Test RBACGuard dependencies, RoleStore loading and invalidation"""
+    print("\n[TEST] Testing RBACGuard...")
+
+    try:
+        import asyncio
+        from types import SimpleNamespace
+        from fastapi import Depends, FastAPI, Header
+        from fastapi.testclient import TestClient
+        from rbac import Role, Permission, RBACGuard, RoleStore
+
+        roles = {
+            "viewer": Role(code="viewer", permissions=[Permission(code="camera:view")]),
+            "admin": Role(code="admin", permissions=[Permission(code="camera:*")]),
+        }
+        loads = []
+
+        async def load_role(code):
+            loads.append(code)
+            return roles.get(code)
+
+        async def claims(x_role: str = Header("")):
+            return SimpleNamespace(role=x_role)
+
+        store = RoleStore(load_role)
+        guard = RBACGuard(claims, store)
+        app = FastAPI()
+
+        @app.delete("/cameras/{id}", dependencies=[
+            Depends(guard.require("camera:view")),
+            Depends(guard.require_any("camera:delete", "site:admin")),
+        ])
+        async def delete_camera(id: str, role: Role = Depends(guard.current_role)):
+            return {"deleted": id, "role": role.code}
+
+        client = TestClient(app)
+        assert client.delete("/cameras/1", headers={"x-role": "admin"}).json() == {"deleted": "1", "role": "admin"}
+        assert client.delete("/cameras/1", headers={"x-role": "viewer"}).status_code == 403
+        assert client.delete("/cameras/1", headers={"x-role": "ghost"}).status_code == 403
+        client.delete("/cameras/2", headers={"x-role": "admin"})
+        assert loads.count("admin") == 1
+
+        asyncio.run(store.invalidate("admin"))
+        client.delete("/cameras/3", headers={"x-role": "admin"})
+        assert loads.count("admin") == 2
+
+        print("[OK] RBACGuard works")
+        return True
+    except Exception as e:
+        print(f"[FAIL] RBACGuard failed: {e!r}")
+        return False
+
+
+def main():
+    """Run all tests"""
+    print("=" * 50)
+    print("RBAC Validation")
+    print("=" * 50)
+
+    tests = [
+        test_imports,
+        test_permission_masks,
+        test_wildcards_and_inheritance,
+        test_resource_filtering,
+        test_decision_cache_reload,
+        test_rbac_guard,
+    ]
+
+    results = [test() for test in tests]
+
+    print("\n" + "=" * 50)
+    print(f"Results: {sum(results)}/{len(results)} passed")
+    print("=" * 50)
+
+    if all(results):
+        print("[SUCCESS] All tests passed!")
+        return 0
+    else:
+        print("[ERROR] Some tests failed")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
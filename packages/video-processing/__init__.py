@@ -7,9 +7,10 @@ Provides:
 - Video processing utilities
 """
 
-from .domain import Thumbnail, Clip, ThumbnailService, ClipService
+from .domain import Thumbnail, Clip, ThumbnailService, ClipService, THUMBNAIL_COLUMNS
 from .application import VideoProcessingService
 
 __version__ = "1.0.0"
 
-__all__ = ['Thumbnail', 'Clip', 'ThumbnailService', 'ClipService', 'VideoProcessingService']
+__all__ = ['Thumbnail', 'Clip', 'ThumbnailService', 'ClipService', 'THUMBNAIL_COLUMNS',
+           'VideoProcessingService']
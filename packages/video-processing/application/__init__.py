@@ -1,6 +1,6 @@
 from uuid import UUID
-from core import Result
-from ..domain import Thumbnail, Clip, ThumbnailService, ClipService
+from core import Result, EntityColumns
+from ..domain import Thumbnail, Clip, ThumbnailService, ClipService, THUMBNAIL_COLUMNS
 
 
 class VideoProcessingService:
@@ -22,6 +22,17 @@ class VideoProcessingService:
         ]
         return Result.ok(thumbnails)
 
+    async def generate_thumbnail_columns(self, video_id: UUID, video_path: str,
+                                         interval: int = 10) -> Result[EntityColumns]:
+        """Generate thumbnails as a columnar collection (no per-item entities)"""
+        timestamps = list(range(0, 3600, interval))
+        urls = await self.thumbnail.generate(video_path, timestamps)
+        
+        thumbnails = EntityColumns(Thumbnail, THUMBNAIL_COLUMNS)
+        for ts, url in zip(timestamps, urls):
+            thumbnails.append(video_id=video_id, timestamp=ts, url=url)
+        return Result.ok(thumbnails)
+
     async def create_clip(self, video_id: UUID, video_path: str, 
                          start: float, duration: float) -> Result[Clip]:
         """Create video clip"""
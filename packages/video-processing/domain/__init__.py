@@ -1,4 +1,4 @@
-from core import Entity
+from core import Entity, EntityColumns
 from uuid import UUID
 from datetime import datetime
 from abc import ABC, abstractmethod
@@ -14,6 +14,13 @@ class Thumbnail(Entity):
         self.url = url
 
 
+THUMBNAIL_COLUMNS = {
+    "video_id": EntityColumns.OBJECT,
+    "timestamp": "d",
+    "url": EntityColumns.OBJECT,
+}
+
+
 class Clip(Entity):
     """Video clip"""
     def __init__(self, id: UUID = None, video_id: UUID = None, start: float = 0.0, 
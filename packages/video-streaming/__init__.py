@@ -10,7 +10,7 @@ Provides:
 """
 
 from .domain import (
-    Stream, Recording,
+    Stream, Recording, RECORDING_COLUMNS,
     StreamStatus, RecordingStatus, RetentionPolicy,
     MediaMTXClient, FFmpegService, StorageService
 )
@@ -20,7 +20,7 @@ from .infrastructure import MediaMTXClientImpl
 __version__ = "1.0.0"
 
 __all__ = [
-    'Stream', 'Recording',
+    'Stream', 'Recording', 'RECORDING_COLUMNS',
     'StreamStatus', 'RecordingStatus', 'RetentionPolicy',
     'MediaMTXClient', 'FFmpegService', 'StorageService',
     'StreamingService',
@@ -1,5 +1,7 @@
+import math
+from datetime import datetime
 from uuid import UUID
-from core import Result
+from core import Result, EntityColumns
 from ..domain import Stream, Recording, StreamStatus, RecordingStatus, RetentionPolicy
 from ..domain import MediaMTXClient, FFmpegService, StorageService
 
@@ -62,3 +64,16 @@ class StreamingService:
         
         recording.stop()
         return Result.ok(recording)
+
+    @staticmethod
+    def find_expired_recordings(recordings: EntityColumns[Recording],
+                                now: datetime = None) -> EntityColumns[Recording]:
+        """Recordings past retention (same rule as Recording.should_be_deleted), column-wise"""
+        now_seconds = ((now or datetime.utcnow()) - datetime(1970, 1, 1)).total_seconds()
+        
+        def expired(stopped_at: float, retention_policy: RetentionPolicy) -> bool:
+            if math.isnan(stopped_at):
+                return False
+            return now_seconds - stopped_at >= (retention_policy.days + 1) * 86400
+        
+        return recordings.where(expired, "stopped_at", "retention_policy")
@@ -1,4 +1,4 @@
-from core import Entity
+from core import Entity, EntityColumns
 from uuid import UUID
 from datetime import datetime
 from .ValueObjects import RecordingStatus, RetentionPolicy
@@ -40,3 +40,15 @@ class Recording(Entity):
             return False
         days_old = (datetime.utcnow() - self.stopped_at).days
         return days_old > self.retention_policy.days
+
+
+RECORDING_COLUMNS = {
+    "stream_id": EntityColumns.OBJECT,
+    "retention_policy": EntityColumns.OBJECT,
+    "status": EntityColumns.OBJECT,
+    "storage_path": EntityColumns.OBJECT,
+    "file_size_mb": "d",
+    "started_at": EntityColumns.TIMESTAMP,
+    "stopped_at": EntityColumns.TIMESTAMP,
+    "duration_seconds": "q",
+}
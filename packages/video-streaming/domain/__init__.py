@@ -1,10 +1,10 @@
 from .Stream import Stream
-from .Recording import Recording
+from .Recording import Recording, RECORDING_COLUMNS
 from .ValueObjects import StreamStatus, RecordingStatus, RetentionPolicy
 from .Services import MediaMTXClient, FFmpegService, StorageService
 
 __all__ = [
-    'Stream', 'Recording',
+    'Stream', 'Recording', 'RECORDING_COLUMNS',
     'StreamStatus', 'RecordingStatus', 'RetentionPolicy',
     'MediaMTXClient', 'FFmpegService', 'StorageService'
 ]